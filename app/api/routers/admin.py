@@ -12,17 +12,28 @@
 - اعتماد كامل على حقن التبعيات (Dependency Injection).
 """
 
-import inspect
-from collections.abc import Callable
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.routers.ws_auth import extract_websocket_auth
-from app.api.schemas.admin import ConversationDetailsResponse, ConversationSummaryResponse
+from app.api.routers.ws_auth import (
+    ActorLite,
+    extract_websocket_auth,
+    load_ws_actor,
+    negotiates_batch_protocol,
+    ws_secret_key,
+)
+from app.api.routers.ws_streaming import send_json_fast, stream_events
+from app.api.schemas.admin import (
+    ChatSocketMessage,
+    ConversationDetailsResponse,
+    ConversationSummaryResponse,
+)
 from app.core.ai_gateway import AIClient, get_ai_client
-from app.core.config import get_settings
 from app.core.database import async_session_factory, get_db
 from app.core.di import get_logger
 from app.core.domain.user import User
@@ -45,6 +56,13 @@ router = APIRouter(
     tags=["Admin"],
 )
 
+# الحد الأقصى للأسئلة المعلقة لكل اتصال قبل إيقاف القراءة من العميل مؤقتاً.
+WS_PENDING_QUESTIONS = 4
+
+# محولات مبنية مرة واحدة عند الاستيراد لتجنب تمرير كل عنصر عبر حلقة Python.
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[ConversationSummaryResponse])
+_DETAILS_ADAPTER = TypeAdapter(ConversationDetailsResponse)
+
 
 # -----------------------------------------------------------------------------
 # DTOs
@@ -66,45 +84,20 @@ def get_session_factory() -> Callable[[], AsyncSession]:
     return async_session_factory
 
 
-def get_chat_actor(
-    current: CurrentUser = Depends(get_current_user),
-) -> CurrentUser:
-    """تبعية تُعيد المستخدم الحالي لاستخدام قنوات الدردشة الإدارية."""
-
-    return current
-
-
-def get_current_user_id(current: CurrentUser = Depends(get_chat_actor)) -> int:
-    """
-    إرجاع معرف المستخدم الحالي بعد التحقق من صلاحيات الأسئلة التعليمية.
-
-    يعتمد هذا التابع على تبعية `get_chat_actor` لضمان أن المستدعي يملك
-    التصاريح اللازمة قبل متابعة أي عمليات بث أو استعلامات خاصة بالمحادثات
-    الإدارية.
-
-    Args:
-        current: كائن المستخدم الحالي المزود بالأدوار والصلاحيات.
-
-    Returns:
-        int: معرف المستخدم الموثق.
-    """
-
-    return current.user.id
-
-
 async def get_actor_user(
-    user_id: int = Depends(get_current_user_id),
+    current: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
-    الحصول على كائن المستخدم الفعلي بالاعتماد على معرفه.
+    الحصول على كائن المستخدم الفعلي للمسؤول الحالي في تبعية واحدة.
 
-    يوفر هذا التابع طبقة تجريد تُمكِّن من تجاوز التحقق في الاختبارات عبر
-    إعادة تعريف `get_current_user_id`، مع الحفاظ على مسار التحقق الأساسي في
-    بيئة الإنتاج.
+    تجمع هذه التبعية استخراج المعرف والتحقق من الوجود والتفعيل والفصل عن
+    الجلسة في خطوة واحدة بدلاً من سلسلة تبعيات متداخلة. يمكن تجاوز التحقق في
+    الاختبارات عبر إعادة تعريف `get_current_user`. بما أن `get_current_user`
+    يستخدم الجلسة ذاتها، فإن `db.get` يُخدم غالباً من خريطة الهوية دون استعلام.
 
     Args:
-        user_id: معرف المستخدم المستخرج من التبعيات السابقة.
+        current: كائن المستخدم الحالي المزود بالأدوار والصلاحيات.
         db: جلسة قاعدة البيانات المستخدمة للاستعلام.
 
     Returns:
@@ -114,18 +107,16 @@ async def get_actor_user(
         HTTPException: إذا كان المستخدم غير موجود أو غير مفعّل.
     """
 
-    user = await db.get(User, user_id)
+    user = await db.get(User, current.user.id)
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
 
     if not user.is_active:
         raise HTTPException(status_code=403, detail="User inactive")
 
-    # فصل الكائن عن الجلسة لضمان توفر بياناته أثناء البث الطويل دون الاصطدام بإغلاق الجلسة.
-    await db.refresh(user)
-    expunge_result = db.expunge(user)
-    if inspect.isawaitable(expunge_result):
-        await expunge_result
+    # `db.get` يُعيد كائناً محمّلاً بالكامل، لذا يكفي فصله عن الجلسة لضمان توفر
+    # بياناته أثناء البث الطويل دون الاصطدام بإغلاق الجلسة.
+    db.expunge(user)
 
     return user
 
@@ -164,6 +155,109 @@ async def get_admin_user_count() -> AdminUserCountResponse:
         raise HTTPException(status_code=503, detail="User Service unavailable") from e
 
 
+async def _unless_worker_done[T](
+    awaitable: Awaitable[T], worker: asyncio.Task[None]
+) -> asyncio.Future[T] | None:
+    """
+    انتظار عملية على الاتصال ما لم تنتهِ مهمة المعالجة قبلها.
+
+    يمنع ذلك بقاء حلقة الاستقبال معلقة على العميل أو على طابور ممتلئ بعد
+    توقف مهمة المعالجة بسبب خطأ.
+
+    Args:
+        awaitable: عملية الاستقبال أو الإدراج في الطابور.
+        worker: مهمة معالجة الأسئلة للاتصال.
+
+    Returns:
+        العملية المكتملة، أو `None` إذا انتهت مهمة المعالجة أولاً.
+    """
+
+    step = asyncio.ensure_future(awaitable)
+    await asyncio.wait({step, worker}, return_when=asyncio.FIRST_COMPLETED)
+    if step.done():
+        return step
+    step.cancel()
+    return None
+
+
+async def _serve_questions(
+    websocket: WebSocket,
+    queue: asyncio.Queue[str],
+    *,
+    actor: ActorLite,
+    ai_client: AIClient,
+    dispatcher: ChatRoleDispatcher,
+    session_factory: Callable[[], AsyncSession],
+    batched: bool,
+) -> None:
+    """
+    معالجة أسئلة الاتصال الواردة من الطابور وبث ردودها بالترتيب.
+
+    تعمل هذه الدالة كمهمة مستقلة لكل اتصال حتى لا تحجب حلقة الاستقبال أثناء
+    البث؛ تبقى المعالجة تسلسلية لأن الموزّع يتشارك جلسة قاعدة بيانات واحدة
+    ولأن البروتوكول لا يميز أحداث الأسئلة المتداخلة.
+
+    Args:
+        websocket: قناة الاتصال المفتوحة.
+        queue: طابور الإطارات النصية الواردة من العميل.
+        actor: المستخدم المصادق عليه للاتصال.
+        ai_client: عميل الذكاء الاصطناعي.
+        dispatcher: موزّع الدردشة حسب الدور.
+        session_factory: مصنع الجلسات للعمليات الخلفية.
+        batched: تفعيل بث الأحداث على دفعات.
+    """
+
+    while True:
+        raw = await queue.get()
+        try:
+            message = ChatSocketMessage.model_validate_json(raw)
+        except ValidationError:
+            await send_json_fast(
+                websocket, {"type": "error", "payload": {"details": "Invalid message."}}
+            )
+            continue
+
+        if not message.question:
+            await send_json_fast(
+                websocket, {"type": "error", "payload": {"details": "Question is required."}}
+            )
+            continue
+
+        # لا يُخصص قاموس بيانات وصفية إلا حين يحدد العميل نوع المهمة.
+        metadata = {"mission_type": message.mission_type} if message.mission_type else None
+
+        dispatch_request = ChatDispatchRequest(
+            question=message.question,
+            conversation_id=message.conversation_id,
+            ai_client=ai_client,
+            session_factory=session_factory,
+            metadata=metadata,
+        )
+
+        try:
+            dispatch_result = await ChatOrchestrator.dispatch(
+                user=actor,
+                request=dispatch_request,
+                dispatcher=dispatcher,
+            )
+        except HTTPException as exc:
+            await send_json_fast(
+                websocket,
+                {
+                    "type": "error",
+                    "payload": {"details": exc.detail, "status_code": exc.status_code},
+                },
+            )
+            continue
+
+        await send_json_fast(
+            websocket,
+            {"type": "status", "payload": {"status_code": dispatch_result.status_code}},
+        )
+
+        await stream_events(websocket, dispatch_result.stream, batched=batched)
+
+
 @router.websocket("/api/chat/ws")
 async def chat_stream_ws(
     websocket: WebSocket,
@@ -181,78 +275,60 @@ async def chat_stream_ws(
         return
 
     try:
-        user_id = decode_user_id(token, get_settings().SECRET_KEY)
+        user_id = decode_user_id(token, ws_secret_key())
     except HTTPException:
         await websocket.close(code=4401)
         return
 
-    actor = await db.get(User, user_id)
+    actor = await load_ws_actor(db, user_id)
     if actor is None or not actor.is_active:
         await websocket.close(code=4401)
         return
 
+    batched = negotiates_batch_protocol(websocket)
     await websocket.accept(subprotocol=selected_protocol)
 
     if not actor.is_admin:
-        await websocket.send_json(
+        await send_json_fast(
+            websocket,
             {
                 "type": "error",
                 "payload": {
                     "details": "Standard accounts must use the customer chat endpoint.",
                     "status_code": 403,
                 },
-            }
+            },
         )
         await websocket.close(code=4403)
         return
 
+    queue: asyncio.Queue[str] = asyncio.Queue(maxsize=WS_PENDING_QUESTIONS)
+    worker = asyncio.create_task(
+        _serve_questions(
+            websocket,
+            queue,
+            actor=actor,
+            ai_client=ai_client,
+            dispatcher=dispatcher,
+            session_factory=session_factory,
+            batched=batched,
+        )
+    )
     try:
         while True:
-            payload = await websocket.receive_json()
-            question = str(payload.get("question", "")).strip()
-            if not question:
-                await websocket.send_json(
-                    {"type": "error", "payload": {"details": "Question is required."}}
-                )
-                continue
-
-            mission_type = payload.get("mission_type")
-            metadata = {}
-            if mission_type:
-                metadata["mission_type"] = mission_type
-
-            dispatch_request = ChatDispatchRequest(
-                question=question,
-                conversation_id=payload.get("conversation_id"),
-                ai_client=ai_client,
-                session_factory=session_factory,
-                metadata=metadata,
-            )
-
-            try:
-                dispatch_result = await ChatOrchestrator.dispatch(
-                    user=actor,
-                    request=dispatch_request,
-                    dispatcher=dispatcher,
-                )
-            except HTTPException as exc:
-                await websocket.send_json(
-                    {
-                        "type": "error",
-                        "payload": {"details": exc.detail, "status_code": exc.status_code},
-                    }
-                )
-                continue
-
-            await websocket.send_json(
-                {"type": "status", "payload": {"status_code": dispatch_result.status_code}}
-            )
-
-            async for event in dispatch_result.stream:
-                await websocket.send_json(event)
-
+            received = await _unless_worker_done(websocket.receive_text(), worker)
+            if received is None:
+                break
+            if await _unless_worker_done(queue.put(received.result()), worker) is None:
+                break
+        # إعادة رفع أي فشل غير متوقع في مهمة المعالجة كما كان يحدث داخل الحلقة.
+        worker.result()
     except WebSocketDisconnect:
         logger.info("Admin WebSocket disconnected")
+    finally:
+        worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect):
+            await worker
 
 
 @router.get(
@@ -273,7 +349,7 @@ async def get_latest_chat(
     conversation_data = await service.get_latest_conversation_details(actor)
     if not conversation_data:
         return None
-    return ConversationDetailsResponse.model_validate(conversation_data)
+    return _DETAILS_ADAPTER.validate_python(conversation_data, from_attributes=True)
 
 
 @router.get(
@@ -291,7 +367,7 @@ async def list_conversations(
     الخدمة تعيد البيانات متوافقة مع Schema مباشرة.
     """
     results = await service.list_user_conversations(actor)
-    return [ConversationSummaryResponse.model_validate(r) for r in results]
+    return _SUMMARY_LIST_ADAPTER.validate_python(results, from_attributes=True)
 
 
 @router.get(
@@ -308,4 +384,4 @@ async def get_conversation(
     استرجاع الرسائل والتفاصيل لمحادثة محددة.
     """
     data = await service.get_conversation_details(actor, conversation_id)
-    return ConversationDetailsResponse.model_validate(data)
+    return _DETAILS_ADAPTER.validate_python(data, from_attributes=True)
@@ -5,15 +5,25 @@
 مع فرض سياسات الأمان والملكية.
 """
 
+import contextlib
 from collections.abc import Callable
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.routers.ws_auth import extract_websocket_auth
-from app.api.schemas.customer_chat import CustomerConversationDetails, CustomerConversationSummary
+from app.api.routers.ws_auth import (
+    extract_websocket_auth,
+    negotiates_batch_protocol,
+    ws_secret_key,
+)
+from app.api.routers.ws_streaming import send_json_fast, stream_events
+from app.api.schemas.customer_chat import (
+    CustomerChatSocketMessage,
+    CustomerConversationDetails,
+    CustomerConversationSummary,
+)
 from app.core.ai_gateway import AIClient, get_ai_client
-from app.core.config import get_settings
 from app.core.database import async_session_factory, get_db
 from app.core.di import get_logger
 from app.core.domain.user import User
@@ -21,7 +31,7 @@ from app.deps.auth import CurrentUser, require_permissions
 from app.services.auth.token_decoder import decode_user_id
 from app.services.boundaries.customer_chat_boundary_service import CustomerChatBoundaryService
 from app.services.chat.contracts import ChatDispatchRequest
-from app.services.chat.dispatcher import ChatRoleDispatcher, build_chat_dispatcher
+from app.services.chat.dispatcher import build_chat_dispatcher
 from app.services.chat.orchestrator import ChatOrchestrator
 from app.services.rbac import QA_SUBMIT
 
@@ -35,37 +45,35 @@ router = APIRouter(
     tags=["Customer Chat"],
 )
 
+# محولات مبنية مرة واحدة عند الاستيراد لتجنب تمرير كل عنصر عبر حلقة Python.
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[CustomerConversationSummary])
+_DETAILS_ADAPTER = TypeAdapter(CustomerConversationDetails)
+
+# تبعية صلاحية الأسئلة التعليمية تُبنى مرة واحدة وتتشاركها كل المسارات.
+_REQUIRE_QA_SUBMIT = require_permissions(QA_SUBMIT)
+
 
 def get_session_factory() -> Callable[[], AsyncSession]:
     """تبعية لاسترجاع مصنع الجلسات."""
     return async_session_factory
 
 
-def get_chat_actor(
-    current: CurrentUser = Depends(require_permissions(QA_SUBMIT)),
-) -> CurrentUser:
-    """تبعية تضمن امتلاك صلاحية الأسئلة التعليمية."""
-    return current
-
-
-def get_current_user_id(current: CurrentUser = Depends(get_chat_actor)) -> int:
-    """إرجاع معرف المستخدم الحالي بعد تحقق الصلاحيات."""
-    return current.user.id
-
-
 async def get_actor_user(
-    user_id: int = Depends(get_current_user_id),
+    current: CurrentUser = Depends(_REQUIRE_QA_SUBMIT),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
-    جلب كائن المستخدم الفعلي بعد التحقق من الحالة.
+    جلب كائن المستخدم الفعلي بعد التحقق من الصلاحية والحالة في تبعية واحدة.
+
+    تجمع هذه التبعية فحص صلاحية الأسئلة التعليمية واستخراج المعرف والتحقق من
+    الوجود والتفعيل والفصل عن الجلسة بدلاً من سلسلة تبعيات متداخلة.
     """
-    user = await db.get(User, user_id)
+    user = await db.get(User, current.user.id)
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
     if not user.is_active:
         raise HTTPException(status_code=403, detail="User inactive")
-    await db.refresh(user)
+    # `db.get` يُعيد كائناً محمّلاً بالكامل، فلا حاجة لاستعلام `refresh` إضافي قبل الفصل.
     db.expunge(user)
     return user
 
@@ -75,16 +83,10 @@ def get_customer_service(db: AsyncSession = Depends(get_db)) -> CustomerChatBoun
     return CustomerChatBoundaryService(db)
 
 
-def get_chat_dispatcher(db: AsyncSession = Depends(get_db)) -> ChatRoleDispatcher:
-    """تبعية للحصول على موزّع الدردشة حسب الدور."""
-    return build_chat_dispatcher(db)
-
-
 @router.websocket("/ws")
 async def chat_stream_ws(
     websocket: WebSocket,
     ai_client: AIClient = Depends(get_ai_client),
-    dispatcher: ChatRoleDispatcher = Depends(get_chat_dispatcher),
     session_factory: Callable[[], AsyncSession] = Depends(get_session_factory),
     db: AsyncSession = Depends(get_db),
 ) -> None:
@@ -97,7 +99,7 @@ async def chat_stream_ws(
         return
 
     try:
-        user_id = decode_user_id(token, get_settings().SECRET_KEY)
+        user_id = decode_user_id(token, ws_secret_key())
     except HTTPException:
         await websocket.close(code=4401)
         return
@@ -107,40 +109,51 @@ async def chat_stream_ws(
         await websocket.close(code=4401)
         return
 
+    batched = negotiates_batch_protocol(websocket)
     await websocket.accept(subprotocol=selected_protocol)
 
     if actor.is_admin:
-        await websocket.send_json(
+        await send_json_fast(
+            websocket,
             {
                 "type": "error",
                 "payload": {
                     "details": "Admin accounts must use the admin chat endpoint.",
                     "status_code": 403,
                 },
-            }
+            },
         )
         await websocket.close(code=4403)
         return
 
-    try:
-        while True:
-            payload = await websocket.receive_json()
-            question = str(payload.get("question", "")).strip()
-            if not question:
-                await websocket.send_json(
-                    {"type": "error", "payload": {"details": "Question is required."}}
+    # يُبنى الموزّع بعد نجاح المصافحة فقط، على الجلسة نفسها التي تحقق منها المستخدم،
+    # حتى لا تُنشأ خدمات الحدود لاتصالات مرفوضة.
+    dispatcher = build_chat_dispatcher(db)
+
+    # المكرر ينتهي بهدوء عند قطع العميل للاتصال؛ الكتم يغطي الانقطاع أثناء الإرسال.
+    with contextlib.suppress(WebSocketDisconnect):
+        async for raw_message in websocket.iter_text():
+            try:
+                message = CustomerChatSocketMessage.model_validate_json(raw_message)
+            except ValidationError:
+                await send_json_fast(
+                    websocket, {"type": "error", "payload": {"details": "Invalid message."}}
+                )
+                continue
+
+            if not message.question:
+                await send_json_fast(
+                    websocket, {"type": "error", "payload": {"details": "Question is required."}}
                 )
                 continue
 
-            mission_type = payload.get("mission_type")
-            metadata: dict[str, object] = {}
-            if mission_type:
-                metadata["mission_type"] = mission_type
+            # لا يُخصص قاموس بيانات وصفية إلا حين يحدد العميل نوع المهمة.
+            metadata = {"mission_type": message.mission_type} if message.mission_type else None
 
             try:
                 dispatch_request = ChatDispatchRequest(
-                    question=question,
-                    conversation_id=payload.get("conversation_id"),
+                    question=message.question,
+                    conversation_id=message.conversation_id,
                     ai_client=ai_client,
                     session_factory=session_factory,
                     metadata=metadata,
@@ -151,37 +164,35 @@ async def chat_stream_ws(
                     dispatcher=dispatcher,
                 )
             except HTTPException as exc:
-                await websocket.send_json(
+                await send_json_fast(
+                    websocket,
                     {
                         "type": "error",
                         "payload": {"details": exc.detail, "status_code": exc.status_code},
-                    }
+                    },
                 )
                 continue
 
-            await websocket.send_json(
-                {"type": "status", "payload": {"status_code": dispatch_result.status_code}}
+            await send_json_fast(
+                websocket,
+                {"type": "status", "payload": {"status_code": dispatch_result.status_code}},
             )
 
             try:
-                async for event in dispatch_result.stream:
-                    if not isinstance(event, dict):
-                        normalized_event = {"type": "delta", "payload": {"content": str(event)}}
-                    else:
-                        normalized_event = event
-                    await websocket.send_json(normalized_event)
+                # حدود الزبون تبث أحداثاً بشكل `{type, payload}` دائماً، فتُمرَّر دون تحويل.
+                await stream_events(websocket, dispatch_result.stream, batched=batched)
             except Exception as exc:
-                logger.error(f"Error in chat stream: {exc}", exc_info=True)
-                await websocket.send_json(
+                logger.error("Error in chat stream: %s", exc, exc_info=True)
+                await send_json_fast(
+                    websocket,
                     {
                         "type": "error",
                         "payload": {"details": str(exc), "status_code": 500},
-                    }
+                    },
                 )
                 continue
 
-    except WebSocketDisconnect:
-        logger.info("Customer WebSocket disconnected")
+    logger.info("Customer WebSocket disconnected")
 
 
 @router.get(
@@ -196,7 +207,7 @@ async def get_latest_chat(
     conversation_data = await service.get_latest_conversation_details(actor)
     if not conversation_data:
         return None
-    return CustomerConversationDetails.model_validate(conversation_data)
+    return _DETAILS_ADAPTER.validate_python(conversation_data, from_attributes=True)
 
 
 @router.get(
@@ -209,7 +220,7 @@ async def list_conversations(
     service: CustomerChatBoundaryService = Depends(get_customer_service),
 ) -> list[CustomerConversationSummary]:
     results = await service.list_user_conversations(actor)
-    return [CustomerConversationSummary.model_validate(r) for r in results]
+    return _SUMMARY_LIST_ADAPTER.validate_python(results, from_attributes=True)
 
 
 @router.get(
@@ -225,4 +236,4 @@ async def get_conversation(
     service: CustomerChatBoundaryService = Depends(get_customer_service),
 ) -> CustomerConversationDetails:
     data = await service.get_conversation_details(actor, conversation_id)
-    return CustomerConversationDetails.model_validate(data)
+    return _DETAILS_ADAPTER.validate_python(data, from_attributes=True)
@@ -16,18 +16,21 @@ from app.api.routers import (
 
 type RouterSpec = tuple[APIRouter, str]
 
+# سجل ثابت يُبنى مرة واحدة عند الاستيراد؛ الترتيب هنا هو ترتيب التركيب.
+BASE_ROUTER_REGISTRY: tuple[RouterSpec, ...] = (
+    (system.root_router, ""),
+    (system.router, ""),
+    (admin.router, ""),
+    (security.router, "/api/security"),
+    (data_mesh.router, "/api/v1/data-mesh"),
+    (ums.router, "/api/v1"),
+    (customer_chat.router, ""),
+    (content.router, ""),
+)
+
 
-def base_router_registry() -> list[RouterSpec]:
+def base_router_registry() -> tuple[RouterSpec, ...]:
     """
-    يبني سجل الموجهات الأساسية للتطبيق بدون موجه البوابة.
+    يعيد سجل الموجهات الأساسية للتطبيق بدون موجه البوابة.
     """
-    return [
-        (system.root_router, ""),
-        (system.router, ""),
-        (admin.router, ""),
-        (security.router, "/api/security"),
-        (data_mesh.router, "/api/v1/data-mesh"),
-        (ums.router, "/api/v1"),
-        (customer_chat.router, ""),
-        (content.router, ""),
-    ]
+    return BASE_ROUTER_REGISTRY
@@ -5,10 +5,47 @@
 رؤوس بروتوكولات WebSocket أو من معاملات الاستعلام كحل تراثي.
 """
 
+import functools
+from dataclasses import dataclass
+
 from fastapi import WebSocket
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.domain.user import User
 from app.core.settings.base import get_settings
 
+BATCH_PROTOCOL = "batch-v1"
+
+
+@dataclass(slots=True, frozen=True)
+class ActorLite:
+    """
+    تمثيل خفيف لمستخدم مصافحة WebSocket.
+
+    يحمل الحقول الثلاثة التي يحتاجها مسار البث فقط، بدلاً من كائن `User`
+    كامل مرتبط بخريطة الهوية في الجلسة.
+    """
+
+    id: int
+    is_active: bool
+    is_admin: bool
+
+
+@functools.cache
+def ws_secret_key() -> str:
+    """
+    إرجاع المفتاح السري المستخدم لفك رموز مصافحة WebSocket.
+
+    يُقرأ المفتاح مرة واحدة عند أول مصافحة ثم يُعاد من الذاكرة، لأن قيمته
+    ثابتة طوال عمر العملية ولا داعي لتمريره عبر الإعدادات في كل اتصال.
+
+    Returns:
+        المفتاح السري الحالي للتطبيق.
+    """
+
+    return get_settings().SECRET_KEY
+
 
 def _parse_protocol_header(protocol_header: str | None) -> list[str]:
     """
@@ -85,3 +122,46 @@ def extract_websocket_auth(websocket: WebSocket) -> tuple[str | None, str | None
         return None, None
 
     return fallback_token, None
+
+
+def negotiates_batch_protocol(websocket: WebSocket) -> bool:
+    """
+    التحقق مما إذا كان العميل يدعم استقبال الأحداث على دفعات.
+
+    يعلن العميل دعمه بإضافة البروتوكول `batch-v1` إلى ترويسة
+    `sec-websocket-protocol` بجانب بروتوكول المصادقة، ويبقى البروتوكول
+    المختار في المصافحة كما هو حتى لا يتأثر العملاء القدامى.
+
+    Args:
+        websocket: كائن WebSocket الوارد من FastAPI.
+
+    Returns:
+        `True` إذا طلب العميل بث الأحداث على دفعات.
+    """
+
+    protocols = _parse_protocol_header(websocket.headers.get("sec-websocket-protocol"))
+    return BATCH_PROTOCOL in protocols
+
+
+async def load_ws_actor(db: AsyncSession, user_id: int) -> ActorLite | None:
+    """
+    تحميل الحقول اللازمة لمستخدم المصافحة عبر استعلام إسقاط مباشر.
+
+    يتجاوز الاستعلام بناء كائن ORM وإدراجه في خريطة الهوية ثم فصله، ويجلب
+    الأعمدة الثلاثة فقط بدلاً من الصف كاملاً.
+
+    Args:
+        db: جلسة قاعدة البيانات.
+        user_id: معرف المستخدم المستخرج من الرمز.
+
+    Returns:
+        `ActorLite` إذا وُجد المستخدم، وإلا `None`.
+    """
+
+    result = await db.execute(
+        select(User.id, User.is_active, User.is_admin).where(User.id == user_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return ActorLite(id=row.id, is_active=row.is_active, is_admin=row.is_admin)
@@ -0,0 +1,146 @@
+"""
+مساعدات بث أحداث WebSocket على دفعات.
+
+تجمع هذه الوحدة الأحداث المتلاحقة القادمة من المنسق ضمن نافذة زمنية قصيرة
+وترسلها كإطار واحد `{"type": "batch", "events": [...]}` بدلاً من إطار لكل
+حدث، مما يخفض عدد استدعاءات الإرسال وكلفة ترويسات الإطارات أثناء بث الرموز.
+العملاء القدامى الذين لم يتفاوضوا على بروتوكول الدفعات يستمرون بالإرسال
+حدثاً بحدث دون أي تغيير.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
+import orjson
+from fastapi import WebSocket
+
+BATCH_MAX_EVENTS = 128
+BATCH_WINDOW_SECONDS = 0.01
+
+_FLUSH_EVENT_TYPES = frozenset({"assistant_final", "error"})
+_END_OF_STREAM = object()
+_NEXT_ITEM = object()
+
+
+async def send_json_fast(websocket: WebSocket, data: object) -> None:
+    """
+    ترميز الحدث عبر `orjson` وإرساله كإطار نصي.
+
+    بديل مباشر لـ `websocket.send_json` الذي يعتمد على `json.dumps` القياسي؛
+    يبقى الإطار نصياً حتى لا يتغير شيء لدى عملاء المتصفح.
+
+    Args:
+        websocket: قناة الاتصال المفتوحة.
+        data: الكائن القابل للتسلسل إلى JSON.
+    """
+
+    await websocket.send_text(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode())
+
+
+def _is_flush_event(event: object) -> bool:
+    """
+    تحديد ما إذا كان الحدث نهائياً يجب إرساله فوراً دون انتظار النافذة.
+
+    Args:
+        event: الحدث الصادر من المنسق.
+
+    Returns:
+        `True` إذا كان الحدث من الأنواع الحساسة للكمون.
+    """
+
+    return isinstance(event, dict) and event.get("type") in _FLUSH_EVENT_TYPES
+
+
+async def _send_batch(websocket: WebSocket, batch: list[object]) -> None:
+    """
+    إرسال دفعة الأحداث كإطار واحد، أو الحدث منفرداً إذا كانت الدفعة بحجم واحد.
+
+    Args:
+        websocket: قناة الاتصال المفتوحة.
+        batch: الأحداث المجمعة بالترتيب.
+    """
+
+    if len(batch) == 1:
+        await send_json_fast(websocket, batch[0])
+        return
+    await send_json_fast(websocket, {"type": "batch", "events": batch})
+
+
+async def stream_events(
+    websocket: WebSocket,
+    events: AsyncIterator[object],
+    *,
+    batched: bool,
+    max_events: int = BATCH_MAX_EVENTS,
+    window_seconds: float = BATCH_WINDOW_SECONDS,
+) -> None:
+    """
+    بث أحداث المنسق إلى العميل مع تجميعها على دفعات عند التفاوض على ذلك.
+
+    يعمل منتج مستقل على سحب الأحداث إلى طابور، بينما يجمع المستهلك ما يصل
+    خلال نافذة قصيرة أو حتى بلوغ الحد الأقصى، ثم يرسله في إطار واحد مع الحفاظ
+    على الترتيب. الأحداث النهائية (`assistant_final` و`error`) تُفرّغ الدفعة فوراً.
+    أي استثناء من مصدر الأحداث يُعاد رفعه بعد إرسال ما سبقه.
+
+    Args:
+        websocket: قناة الاتصال المفتوحة.
+        events: مكرر الأحداث غير المتزامن القادم من المنسق.
+        batched: تفعيل التجميع إذا تفاوض العميل على بروتوكول الدفعات.
+        max_events: الحد الأقصى لعدد الأحداث في الإطار الواحد.
+        window_seconds: مدة نافذة التجميع بالثواني.
+    """
+
+    if not batched:
+        async for event in events:
+            await send_json_fast(websocket, event)
+        return
+
+    queue: asyncio.Queue[object] = asyncio.Queue()
+    failure: list[BaseException] = []
+
+    async def _produce() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as exc:
+            failure.append(exc)
+        finally:
+            queue.put_nowait(_END_OF_STREAM)
+
+    producer = asyncio.create_task(_produce())
+    loop = asyncio.get_running_loop()
+    try:
+        item = await queue.get()
+        while item is not _END_OF_STREAM:
+            batch: list[object] = []
+            deadline = loop.time() + window_seconds
+            while item is not _END_OF_STREAM:
+                batch.append(item)
+                if _is_flush_event(item) or len(batch) >= max_events:
+                    item = _NEXT_ITEM
+                    break
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        item = _NEXT_ITEM
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                    except TimeoutError:
+                        item = _NEXT_ITEM
+                        break
+
+            await _send_batch(websocket, batch)
+            if item is _NEXT_ITEM:
+                item = await queue.get()
+    finally:
+        if not producer.done():
+            producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+    if failure:
+        raise failure[0]
@@ -36,6 +36,26 @@ class ChatRequest(RobustBaseModel):
         return trimmed
 
 
+class ChatSocketMessage(RobustBaseModel):
+    """
+    رسالة واردة عبر قناة WebSocket لمحادثة المسؤول.
+
+    تُفك مباشرة من نص الإطار، فلا يُحلل JSON مرتين ولا تتكرر عمليات التحويل
+    اليدوية لكل حقل داخل حلقة الاستقبال.
+    """
+
+    question: str = Field(default="", description="نص السؤال كما أرسله العميل.")
+    conversation_id: int | str | None = Field(default=None, description="المحادثة المستهدفة.")
+    mission_type: str | None = Field(default=None, description="نوع المهمة المطلوب صراحةً.")
+
+    @field_validator("question")
+    @classmethod
+    def strip_question(cls, value: str) -> str:
+        """يزيل الفراغات المحيطة بنص السؤال."""
+
+        return value.strip()
+
+
 class MessageResponse(RobustBaseModel):
     """
     نموذج استجابة لرسالة واحدة.
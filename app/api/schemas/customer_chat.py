@@ -2,14 +2,28 @@
 مخططات محادثة العملاء القياسيين (Customer Chat Schemas).
 """
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from app.core.schemas import RobustBaseModel
 
 
-class CustomerChatRequest(RobustBaseModel):
-    question: str = Field(..., min_length=1, max_length=10000)
-    conversation_id: int | None = None
+class CustomerChatSocketMessage(RobustBaseModel):
+    """
+    رسالة واردة عبر قناة WebSocket لمحادثة العميل.
+
+    تُفك مباشرة من نص الإطار بدل قراءة كل حقل يدوياً من قاموس JSON.
+    """
+
+    question: str = Field(default="", description="نص السؤال كما أرسله العميل.")
+    conversation_id: int | str | None = Field(default=None, description="المحادثة المستهدفة.")
+    mission_type: str | None = Field(default=None, description="نوع المهمة المطلوب صراحةً.")
+
+    @field_validator("question")
+    @classmethod
+    def strip_question(cls, value: str) -> str:
+        """يزيل الفراغات المحيطة بنص السؤال."""
+
+        return value.strip()
 
 
 class CustomerConversationSummary(RobustBaseModel):
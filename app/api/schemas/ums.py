@@ -6,12 +6,30 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Annotated, Final
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
 
 from app.core.domain.user import UserStatus
+from app.services.rbac import ADMIN_ROLE
+
+ADMIN_JUSTIFICATION_MIN_LENGTH: Final[int] = 10
+
+
+class _RequestModel(BaseModel):
+    """أساس نماذج الطلبات: تُقرأ فقط بعد التحقق وتُهمل الحقول غير المعروفة."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
-class RegisterRequest(BaseModel):
+
+class RegisterRequest(_RequestModel):
     full_name: str
     email: str
     password: str
@@ -22,7 +40,7 @@ class RegisterRequest(BaseModel):
         return value.lower().strip()
 
 
-class LoginRequest(BaseModel):
+class LoginRequest(_RequestModel):
     email: str
     password: str
 
@@ -38,7 +56,7 @@ class TokenPair(BaseModel):
     token_type: str = "Bearer"
 
 
-class ReauthRequest(BaseModel):
+class ReauthRequest(_RequestModel):
     password: str
 
 
@@ -47,15 +65,15 @@ class ReauthResponse(BaseModel):
     expires_in: int
 
 
-class RefreshRequest(BaseModel):
+class RefreshRequest(_RequestModel):
     refresh_token: str
 
 
-class LogoutRequest(BaseModel):
+class LogoutRequest(_RequestModel):
     refresh_token: str
 
 
-class PasswordResetRequest(BaseModel):
+class PasswordResetRequest(_RequestModel):
     email: str
 
     @field_validator("email")
@@ -64,7 +82,7 @@ class PasswordResetRequest(BaseModel):
         return value.lower().strip()
 
 
-class PasswordResetConfirmRequest(BaseModel):
+class PasswordResetConfirmRequest(_RequestModel):
     token: str
     new_password: str
 
@@ -75,7 +93,7 @@ class PasswordResetResponse(BaseModel):
     expires_in: int | None = None
 
 
-class ProfileUpdateRequest(BaseModel):
+class ProfileUpdateRequest(_RequestModel):
     full_name: str | None = None
     email: str | None = None
 
@@ -100,12 +118,12 @@ class UserOut(BaseModel):
     roles: list[str] = Field(default_factory=list)
 
 
-class ChangePasswordRequest(BaseModel):
+class ChangePasswordRequest(_RequestModel):
     current_password: str
     new_password: str
 
 
-class AdminCreateUserRequest(BaseModel):
+class AdminCreateUserRequest(_RequestModel):
     full_name: str
     email: str
     password: str
@@ -117,18 +135,26 @@ class AdminCreateUserRequest(BaseModel):
         return value.lower().strip()
 
 
-class StatusUpdateRequest(BaseModel):
+class StatusUpdateRequest(_RequestModel):
     status: UserStatus
 
 
-class RoleAssignmentRequest(BaseModel):
+class RoleAssignmentRequest(_RequestModel):
     role_name: str
     reauth_password: str | None = None
     reauth_token: str | None = None
-    justification: str | None = None
+    justification: Annotated[str, StringConstraints(strip_whitespace=True)] | None = None
+
+    @model_validator(mode="after")
+    def require_admin_justification(self) -> RoleAssignmentRequest:
+        if self.role_name == ADMIN_ROLE and (
+            len(self.justification or "") < ADMIN_JUSTIFICATION_MIN_LENGTH
+        ):
+            raise ValueError("Justification required for admin assignment")
+        return self
 
 
-class QuestionRequest(BaseModel):
+class QuestionRequest(_RequestModel):
     question: str
 
 
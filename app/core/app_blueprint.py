@@ -6,8 +6,11 @@ Config -> AppState -> WeavedApp
 مع الالتزام بالجوهر الوظيفي والقشرة الإجرائية.
 """
 
+import functools
 import os
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
@@ -40,22 +43,24 @@ __all__ = [
 
 type MiddlewareSpec = tuple[type[BaseHTTPMiddleware] | type, dict[str, object]]
 
-BASE_CORS_OPTIONS: dict[str, object] = {
-    "allow_credentials": True,
-    "allow_methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH", "HEAD"],
-    "allow_headers": [
-        "Authorization",
-        "Content-Type",
-        "Accept",
-        "Origin",
-        "X-Requested-With",
-        "X-CSRF-Token",
-    ],
-    "expose_headers": ["Content-Length", "Content-Range"],
-}
-
-
-@dataclass(frozen=True, slots=True)
+BASE_CORS_OPTIONS: Mapping[str, object] = MappingProxyType(
+    {
+        "allow_credentials": True,
+        "allow_methods": ("GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH", "HEAD"),
+        "allow_headers": (
+            "Authorization",
+            "Content-Type",
+            "Accept",
+            "Origin",
+            "X-Requested-With",
+            "X-CSRF-Token",
+        ),
+        "expose_headers": ("Content-Length", "Content-Range"),
+    }
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class KernelConfig:
     """حاوية إعدادات النواة بشكل صريح وقابل للتمرير."""
 
@@ -64,13 +69,13 @@ class KernelConfig:
     enable_static_files: bool
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class KernelSpec:
     """مواصفات تشغيلية تُشتق من إعدادات النواة كبيانات."""
 
     config: KernelConfig
     middleware_stack: list[MiddlewareSpec]
-    router_registry: list[RouterSpec]
+    router_registry: tuple[RouterSpec, ...]
     is_dev_environment: bool
     static_files_spec: "StaticFilesSpec"
 
@@ -161,23 +166,47 @@ def build_middleware_stack(settings: AppSettings) -> list[MiddlewareSpec]:
     Returns:
         list[MiddlewareSpec]: قائمة المواصفات.
     """
-    cors_options = build_cors_options(settings.BACKEND_CORS_ORIGINS)
+    return list(_cached_middleware_stack(_frozen_settings(settings)))
+
+
+def _frozen_settings(settings: AppSettings) -> tuple[tuple[str, object], ...]:
+    """يسقط الإعدادات التي تحدد مكدس البرمجيات الوسيطة على صيغة قابلة للتجزئة."""
+    return (
+        ("ALLOWED_HOSTS", tuple(settings.ALLOWED_HOSTS)),
+        ("BACKEND_CORS_ORIGINS", tuple(settings.BACKEND_CORS_ORIGINS)),
+        ("ENVIRONMENT", settings.ENVIRONMENT),
+    )
+
 
-    stack: list[MiddlewareSpec] = [
-        (TrustedHostMiddleware, {"allowed_hosts": settings.ALLOWED_HOSTS}),
+@functools.lru_cache(maxsize=8)
+def _cached_middleware_stack(
+    frozen_settings: tuple[tuple[str, object], ...],
+) -> tuple[MiddlewareSpec, ...]:
+    """
+    يبني المكدس مرة واحدة لكل إسقاط إعدادات.
+
+    تبني الاختبارات عشرات التطبيقات بالإعدادات نفسها، فنعيد استخدام المواصفات
+    بدل إعادة تخصيصها؛ والمستدعي ينسخها إلى قائمة قبل أي تعديل.
+    """
+    values = dict(frozen_settings)
+    cors_options = build_cors_options(values["BACKEND_CORS_ORIGINS"])
+
+    head: tuple[MiddlewareSpec, ...] = (
+        (TrustedHostMiddleware, {"allowed_hosts": list(values["ALLOWED_HOSTS"])}),
         (CORSMiddleware, cors_options),
         (SecurityHeadersMiddleware, {}),
+    )
+    tail: tuple[MiddlewareSpec, ...] = (
         (RemoveBlockingHeadersMiddleware, {}),
         (GZipMiddleware, {"minimum_size": 1000}),
-    ]
-
-    if settings.ENVIRONMENT != "testing":
-        stack.insert(3, (RateLimitMiddleware, {}))
+    )
 
-    return stack
+    if values["ENVIRONMENT"] != "testing":
+        return (*head, (RateLimitMiddleware, {}), *tail)
+    return head + tail
 
 
-def build_cors_options(origins: list[str]) -> dict[str, object]:
+def build_cors_options(origins: Sequence[str]) -> dict[str, object]:
     """
     بناء خيارات CORS بشكل واضح ومتسق.
 
@@ -187,18 +216,15 @@ def build_cors_options(origins: list[str]) -> dict[str, object]:
     Returns:
         dict[str, object]: قاموس خيارات CORS الجاهز للاستخدام.
     """
-    allow_origins = origins or ["*"]
-    options = dict(BASE_CORS_OPTIONS)
-    options["allow_origins"] = allow_origins
-    return options
+    return {**BASE_CORS_OPTIONS, "allow_origins": tuple(origins) if origins else ("*",)}
 
 
-def build_router_registry() -> list[RouterSpec]:
+def build_router_registry() -> tuple[RouterSpec, ...]:
     """
     سجل الموجهات (Router Registry) كبيانات.
 
     Returns:
-        list[RouterSpec]: قائمة (الموجه، البادئة).
+        tuple[RouterSpec, ...]: أزواج (الموجه، البادئة) الثابتة.
     """
     return base_router_registry()
 
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import functools
+import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
+_LEADING_SPACES_RE = re.compile(r" *")
+_OPERATION_KEYS = frozenset({"publish:", "subscribe:", "messages:"})
+
+# مفتاح أعلى المستند: يبدأ من العمود الأول، فتسقط الأسطر المزاحة والتعليقات تلقائياً.
+_TOP_KEY_RE = re.compile(r"^([A-Za-z_][\w.-]*)[ \t]*:", re.MULTILINE)
+
 
 @dataclass(frozen=True)
 class AsyncAPIContractReport:
@@ -31,9 +40,22 @@ def validate_asyncapi_contract_structure(spec_path: Path) -> AsyncAPIContractRep
     هذا التحقق لا يعوض المدققات الرسمية، لكنه يمنع الفجوات الأساسية
     مثل غياب `asyncapi` أو القنوات.
     """
-    if not spec_path.exists():
+    try:
+        mtime_ns = spec_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return AsyncAPIContractReport(errors=(f"AsyncAPI spec not found: {spec_path}",))
 
+    return _validate_contract_text(spec_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _validate_contract_text(spec_path: Path, mtime_ns: int) -> AsyncAPIContractReport:
+    """
+    يتحقق من محتوى العقد مع تذكّر النتيجة لكل مسار وزمن تعديل.
+
+    يعيد الإقلاع والاختبارات التحقق من الملف نفسه مراراً، ويُبطل تغيّر
+    `mtime_ns` النتيجة المخزنة تلقائياً عند تعديل العقد.
+    """
     text = spec_path.read_text(encoding="utf-8")
     top_level = _scan_top_level_keys(text)
 
@@ -58,28 +80,17 @@ def validate_asyncapi_contract_structure(spec_path: Path) -> AsyncAPIContractRep
 
 def _scan_top_level_keys(text: str) -> set[str]:
     """يمسح هذا التابع المفاتيح العليا في YAML لتجنب محللات معقدة."""
-    keys: set[str] = set()
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if line.startswith(" "):
-            continue
-        if ":" in stripped:
-            key = stripped.split(":", maxsplit=1)[0].strip()
-            if key:
-                keys.add(key)
-    return keys
+    return set(_TOP_KEY_RE.findall(text))
 
 
 def _extract_channels_from_yaml(text: str) -> dict[str, bool]:
     """يستخرج القنوات ويحدد ما إذا كانت تحتوي publish أو subscribe."""
     # This is a very basic parser and prone to errors with complex YAML,
     # but serves the purpose of a quick check.
-    import yaml
-
     try:
-        data = yaml.safe_load(text)
+        from app.core.yaml_utils import load_yaml_safely
+
+        data = load_yaml_safely(text)
         if not isinstance(data, dict):
             return {}
         channels = data.get("channels", {})
@@ -107,66 +118,33 @@ def _extract_channels_from_yaml(text: str) -> dict[str, bool]:
 
 def _extract_channels_from_yaml_manual(text: str) -> dict[str, bool]:
     """يستخرج القنوات ويحدد ما إذا كانت تحتوي publish أو subscribe (manual fallback)."""
-    lines = text.splitlines()
     channels_indent: int | None = None
+    channel_indent = -1
+    current: str | None = None
     channels: dict[str, bool] = {}
-    index = 0
-
-    while index < len(lines):
-        line = lines[index]
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            index += 1
-            continue
-        if stripped == "channels:":
-            channels_indent = len(line) - len(line.lstrip(" "))
-            index += 1
-            break
-        index += 1
 
-    if channels_indent is None:
-        return channels
-
-    while index < len(lines):
-        line = lines[index]
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            index += 1
+    for indent, content in _indented_lines(text):
+        if channels_indent is None:
+            if content == "channels:":
+                channels_indent = indent
+                channel_indent = indent + 2
             continue
-        indent = len(line) - len(line.lstrip(" "))
         if indent <= channels_indent:
             break
-
-        if stripped.endswith(":") and indent == channels_indent + 2:
-            channel_name = stripped[:-1]
-            channels[channel_name] = _channel_has_operations(
-                lines,
-                start=index + 1,
-                base_indent=indent,
-            )
-        index += 1
+        if indent == channel_indent:
+            current = content[:-1] if content.endswith(":") else None
+            if current is not None:
+                channels[current] = False
+        elif current is not None and indent > channel_indent and content in _OPERATION_KEYS:
+            channels[current] = True
 
     return channels
 
 
-def _channel_has_operations(
-    lines: list[str],
-    *,
-    start: int,
-    base_indent: int,
-) -> bool:
-    """يتحقق مما إذا كانت القناة تحتوي publish أو subscribe."""
-    index = start
-    while index < len(lines):
-        line = lines[index]
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            index += 1
-            continue
-        indent = len(line) - len(line.lstrip(" "))
-        if indent <= base_indent:
-            break
-        if stripped in {"publish:", "subscribe:", "messages:"}:
-            return True
-        index += 1
-    return False
+def _indented_lines(text: str) -> Iterator[tuple[int, str]]:
+    """يعيد أزواج (الإزاحة، المحتوى) للأسطر الفعلية متجاوزاً الفارغة والتعليقات."""
+    for line in text.splitlines():
+        indent = _LEADING_SPACES_RE.match(line).end()
+        content = line[indent:].rstrip()
+        if content and not content.startswith("#"):
+            yield indent, content
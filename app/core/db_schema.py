@@ -6,13 +6,22 @@
 
 import logging
 import re
+from collections.abc import Sequence
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from app.core.agents.system_principles import format_architecture_system_principles
 from app.core.database import engine
-from app.core.db_schema_config import _ALLOWED_TABLES, REQUIRED_SCHEMA, SchemaValidationResult
+from app.core.db_schema_config import (
+    _ALL_COLUMN_NAMES,
+    _ALL_INDEX_NAMES,
+    _ALLOWED_TABLES,
+    _INDEX_NAME_RE,
+    _TABLE_NAMES,
+    REQUIRED_SCHEMA,
+    SchemaValidationResult,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +30,23 @@ _SQLITE_SKIP_INDEX_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"\bUSING\s+GIN\b", flags=re.IGNORECASE),
 )
 
+# استعلامات فهرس PostgreSQL المجمّعة: جولة واحدة لكل الجداول بدل جولة لكل جدول.
+_BATCH_COLUMNS_SQL = text(
+    "SELECT table_name, column_name FROM information_schema.columns "
+    "WHERE table_name IN :table_names AND column_name IN :column_names"
+).bindparams(bindparam("table_names", expanding=True), bindparam("column_names", expanding=True))
+_BATCH_TABLES_EXIST_SQL = text(
+    "SELECT table_name FROM information_schema.tables "
+    "WHERE table_schema = 'public' AND table_name IN :table_names"
+).bindparams(bindparam("table_names", expanding=True))
+_SQLITE_TABLES_EXIST_SQL = text(
+    "SELECT name FROM sqlite_master WHERE type='table' AND name IN :table_names"
+).bindparams(bindparam("table_names", expanding=True))
+_BATCH_INDEXES_SQL = text(
+    "SELECT tablename, indexname FROM pg_indexes "
+    "WHERE tablename IN :table_names AND indexname IN :index_names"
+).bindparams(bindparam("table_names", expanding=True), bindparam("index_names", expanding=True))
+
 __all__ = ["validate_schema_on_startup"]
 
 
@@ -58,7 +84,7 @@ def _should_skip_sqlite_index(sql: str) -> bool:
 
 def _assert_schema_whitelist_alignment() -> None:
     """يتأكد من تطابق المخطط مع قائمة الجداول المسموح بها."""
-    defined_tables = set(REQUIRED_SCHEMA.keys())
+    defined_tables = frozenset(_TABLE_NAMES)
     undefined_tables = defined_tables - _ALLOWED_TABLES
     missing_definitions = _ALLOWED_TABLES - defined_tables
 
@@ -92,6 +118,49 @@ async def _get_existing_columns(conn: AsyncConnection, table_name: str) -> set[s
     return {row[0] for row in result.fetchall()}
 
 
+async def _get_columns_by_table(
+    conn: AsyncConnection, table_names: Sequence[str]
+) -> dict[str, set[str]]:
+    """يجلب أعمدة عدة جداول؛ باستعلام واحد في PostgreSQL ومحلياً في SQLite."""
+    if conn.dialect.name == "sqlite":
+        return {name: await _get_existing_columns(conn, name) for name in table_names}
+
+    # يكفي اتحاد الأعمدة المطلوبة؛ الفرق مع المخطط يُحسب لكل جدول على حدة.
+    result = await conn.execute(
+        _BATCH_COLUMNS_SQL,
+        {"table_names": list(table_names), "column_names": list(_ALL_COLUMN_NAMES)},
+    )
+    columns: dict[str, set[str]] = {name: set() for name in table_names}
+    for table_name, column_name in result.fetchall():
+        columns[table_name].add(column_name)
+    return columns
+
+
+async def _get_indexes_by_table(
+    conn: AsyncConnection, table_names: Sequence[str]
+) -> dict[str, set[str]]:
+    """يجلب فهارس عدة جداول؛ باستعلام واحد في PostgreSQL ومحلياً في SQLite."""
+    if conn.dialect.name == "sqlite":
+        return {name: await _get_existing_indexes(conn, name) for name in table_names}
+
+    # تكفي الفهارس المطلوبة في المخطط؛ لا حاجة لجلب المفاتيح الأساسية وغيرها.
+    result = await conn.execute(
+        _BATCH_INDEXES_SQL,
+        {"table_names": list(table_names), "index_names": list(_ALL_INDEX_NAMES)},
+    )
+    indexes: dict[str, set[str]] = {name: set() for name in table_names}
+    for table_name, index_name in result.fetchall():
+        indexes[table_name].add(index_name)
+    return indexes
+
+
+async def _get_existing_tables(conn: AsyncConnection, table_names: Sequence[str]) -> set[str]:
+    """يتحقق من وجود عدة جداول باستعلام واحد ويعيد الموجود منها."""
+    query = _SQLITE_TABLES_EXIST_SQL if conn.dialect.name == "sqlite" else _BATCH_TABLES_EXIST_SQL
+    result = await conn.execute(query, {"table_names": list(table_names)})
+    return {row[0] for row in result.fetchall()}
+
+
 async def _table_exists(conn: AsyncConnection, table_name: str) -> bool:
     """يتحقق من وجود الجدول في قاعدة البيانات."""
     dialect_name = conn.dialect.name
@@ -145,8 +214,7 @@ async def _fix_missing_column(
 
 def _infer_index_name(index_query: str) -> str | None:
     """يستنتج اسم الفهرس من عبارة SQL."""
-    pattern = re.compile(r"INDEX(?: IF NOT EXISTS)?\s+\"([^\"]+)\"", flags=re.IGNORECASE)
-    match = pattern.search(index_query)
+    match = _INDEX_NAME_RE.search(index_query)
     if match:
         return match.group(1)
     return None
@@ -177,16 +245,23 @@ async def _ensure_missing_indexes(
     index_names: dict[str, str],
     existing_columns: set[str],
     auto_fix: bool,
+    *,
+    existing_indexes: set[str] | None = None,
 ) -> tuple[list[str], list[str], list[str]]:
     """يتأكد من وجود الفهارس المطلوبة مع تسجيل ما تم إنشاؤه أو فقده."""
     missing_indexes: list[str] = []
     fixed_indexes: list[str] = []
     errors: list[str] = []
 
-    try:
-        existing_indexes = await _get_existing_indexes(conn, table_name)
-    except Exception as exc:
-        return missing_indexes, fixed_indexes, [f"Error reading indexes for {table_name}: {exc}"]
+    if existing_indexes is None:
+        try:
+            existing_indexes = await _get_existing_indexes(conn, table_name)
+        except Exception as exc:
+            return (
+                missing_indexes,
+                fixed_indexes,
+                [f"Error reading indexes for {table_name}: {exc}"],
+            )
 
     for key, index_query in index_queries.items():
         index_name = index_names.get(key) or _infer_index_name(index_query)
@@ -234,13 +309,32 @@ async def validate_and_fix_schema(auto_fix: bool = True) -> SchemaValidationResu
 
     try:
         async with engine.connect() as conn:
-            for table_name, schema_info in REQUIRED_SCHEMA.items():
-                if table_name not in _ALLOWED_TABLES:
-                    continue
-
+            # تطابق المخطط مع القائمة المسموح بها مؤكَّد عند الاستيراد، فتكفي المصفوفة المرتبة.
+            table_names = list(_TABLE_NAMES)
+            try:
+                existing_tables: set[str] | None = await _get_existing_tables(conn, table_names)
+                columns_by_table: dict[str, set[str]] | None = await _get_columns_by_table(
+                    conn, table_names
+                )
+                indexes_by_table: dict[str, set[str]] | None = await _get_indexes_by_table(
+                    conn, table_names
+                )
+            except Exception as exc:
+                # نرجع إلى القراءة لكل جدول كي تبقى الأخطاء منسوبة إلى جداولها.
+                logger.warning(f"⚠️ Batched schema catalog read failed: {exc}")
+                await conn.rollback()
+                existing_tables = columns_by_table = indexes_by_table = None
+
+            for table_name in table_names:
+                schema_info = REQUIRED_SCHEMA[table_name]
                 results["checked_tables"].append(table_name)
+                # الجداول المُنشأة أو المُعدّلة في هذا التشغيل تُقرأ من جديد بدل اللقطة المسبقة.
+                catalog_is_fresh = columns_by_table is not None
 
-                table_exists = await _table_exists(conn, table_name)
+                if existing_tables is None:
+                    table_exists = await _table_exists(conn, table_name)
+                else:
+                    table_exists = table_name in existing_tables
 
                 if not table_exists:
                     create_query = schema_info.get("create_table")
@@ -249,11 +343,12 @@ async def validate_and_fix_schema(auto_fix: bool = True) -> SchemaValidationResu
                         try:
                             await conn.execute(text(_apply_dialect_ddl(conn, create_query)))
                             logger.info(f"✅ Created missing table: {table_name}")
-                            existing_columns = set(schema_info.get("columns", []))
+                            existing_columns = set(schema_info["columns_set"])
                             results["fixed_columns"].extend(
                                 [f"{table_name}.{col}" for col in existing_columns]
                             )
                             table_exists = True
+                            catalog_is_fresh = False
                         except Exception as exc:
                             results["errors"].append(f"Failed to create table {table_name}: {exc}")
                             continue
@@ -264,13 +359,15 @@ async def validate_and_fix_schema(auto_fix: bool = True) -> SchemaValidationResu
                         continue
 
                 try:
-                    existing_columns = await _get_existing_columns(conn, table_name)
+                    if catalog_is_fresh:
+                        existing_columns = columns_by_table[table_name]
+                    else:
+                        existing_columns = await _get_existing_columns(conn, table_name)
                 except Exception as exc:
                     results["errors"].append(f"Error checking table {table_name}: {exc}")
                     continue
 
-                required_columns = set(schema_info.get("columns", []))
-                missing = required_columns - existing_columns
+                missing = schema_info["columns_set"] - existing_columns
 
                 if missing:
                     results["missing_columns"].extend([f"{table_name}.{col}" for col in missing])
@@ -284,6 +381,7 @@ async def validate_and_fix_schema(auto_fix: bool = True) -> SchemaValidationResu
                                 conn, table_name, col, auto_fix_queries, index_queries
                             ):
                                 results["fixed_columns"].append(f"{table_name}.{col}")
+                                catalog_is_fresh = False
 
                 index_queries = schema_info.get("indexes", {})
                 index_names = schema_info.get("index_names", {})
@@ -296,6 +394,9 @@ async def validate_and_fix_schema(auto_fix: bool = True) -> SchemaValidationResu
                         index_names=index_names,
                         existing_columns=existing_columns,
                         auto_fix=auto_fix,
+                        existing_indexes=(
+                            indexes_by_table[table_name] if catalog_is_fresh else None
+                        ),
                     )
 
                     results["missing_indexes"].extend(missing_idx)
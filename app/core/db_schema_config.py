@@ -4,11 +4,21 @@
 بهدف تقليل التعقيد في منطق التحقق وضمان وضوح الحدود البنيوية.
 """
 
+import os
+import re
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Final, NotRequired, TypedDict
 
 __all__ = [
     "REQUIRED_SCHEMA",
     "_ALLOWED_TABLES",
+    "_ALL_COLUMN_NAMES",
+    "_ALL_INDEX_NAMES",
+    "_INDEX_NAME_RE",
+    "_INDEX_SQL_BY_NAME",
+    "_TABLE_NAMES",
     "SchemaValidationResult",
     "TableSchemaConfig",
 ]
@@ -22,6 +32,7 @@ class TableSchemaConfig(TypedDict):
     indexes: dict[str, str]
     index_names: NotRequired[dict[str, str]]
     create_table: NotRequired[str]
+    columns_set: NotRequired[frozenset[str]]
 
 
 class SchemaValidationResult(TypedDict):
@@ -59,8 +70,24 @@ _ALLOWED_TABLES: Final[frozenset[str]] = frozenset(
     }
 )
 
+_HNSW_INDEX_TEMPLATE: Final[str] = (
+    'CREATE INDEX IF NOT EXISTS "ix_knowledge_nodes_embedding" ON "knowledge_nodes" '
+    'USING hnsw ("embedding" vector_cosine_ops) WITH (m = {m}, ef_construction = {ef})'
+)
+# معاملات بناء فهرس HNSW لكل فئة نشر؛ "balanced" تطابق القيم الافتراضية لـ pgvector.
+_HNSW_VARIANTS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "fast": _HNSW_INDEX_TEMPLATE.format(m=8, ef=32),
+        "balanced": _HNSW_INDEX_TEMPLATE.format(m=16, ef=64),
+        "accurate": _HNSW_INDEX_TEMPLATE.format(m=32, ef=200),
+    }
+)
+_HNSW_EMBEDDING_INDEX_SQL: Final[str] = _HNSW_VARIANTS.get(
+    os.getenv("PGVECTOR_PROFILE", "balanced"), _HNSW_VARIANTS["balanced"]
+)
+
 
-REQUIRED_SCHEMA: Final[dict[str, TableSchemaConfig]] = {
+_REQUIRED_SCHEMA: dict[str, TableSchemaConfig] = {
     "admin_conversations": {
         "columns": [
             "id",
@@ -553,7 +580,7 @@ REQUIRED_SCHEMA: Final[dict[str, TableSchemaConfig]] = {
             "search_vector": 'ALTER TABLE "knowledge_nodes" ADD COLUMN "search_vector" tsvector GENERATED ALWAYS AS (to_tsvector(\'simple\', "name" || \' \' || COALESCE("content", \'\'))) STORED',
         },
         "indexes": {
-            "embedding": 'CREATE INDEX IF NOT EXISTS "ix_knowledge_nodes_embedding" ON "knowledge_nodes" USING hnsw ("embedding" vector_cosine_ops)',
+            "embedding": _HNSW_EMBEDDING_INDEX_SQL,
             "name": 'CREATE INDEX IF NOT EXISTS "ix_knowledge_nodes_name" ON "knowledge_nodes"("name")',
             "search_vector": 'CREATE INDEX IF NOT EXISTS "ix_knowledge_nodes_search_vector" ON "knowledge_nodes" USING GIN ("search_vector")',
         },
@@ -605,3 +632,68 @@ REQUIRED_SCHEMA: Final[dict[str, TableSchemaConfig]] = {
         ),
     },
 }
+
+# توحيد أسماء الأعمدة المكررة عبر الأقسام في كائن واحد لكل اسم، ثم حساب مجموعة
+# أعمدة مجمّدة لكل جدول مرة عند الاستيراد لفروق المجموعات في التحقق.
+for _table_config in _REQUIRED_SCHEMA.values():
+    _table_config["columns"] = [sys.intern(column) for column in _table_config["columns"]]
+    for _section in ("auto_fix", "indexes", "index_names"):
+        if _section in _table_config:
+            _table_config[_section] = {
+                sys.intern(column): value for column, value in _table_config[_section].items()
+            }
+    _table_config["columns_set"] = frozenset(_table_config["columns"])
+del _table_config, _section
+
+# واجهة قراءة فقط: يمنع المستهلكين من تعديل التعريف المشترك عن طريق الخطأ.
+REQUIRED_SCHEMA: Final[Mapping[str, TableSchemaConfig]] = MappingProxyType(_REQUIRED_SCHEMA)
+del _REQUIRED_SCHEMA
+
+_REFERENCES_RE: Final[re.Pattern[str]] = re.compile(r'REFERENCES\s+"?(\w+)"?')
+
+
+def _foreign_key_order(schema: Mapping[str, TableSchemaConfig]) -> tuple[str, ...]:
+    """يرتب الجداول بحيث يسبق كل جدول مرجعي الجداول التي تشير إليه مع حفظ ترتيب التعريف."""
+    ordered: dict[str, None] = {}
+
+    def visit(name: str, path: frozenset[str]) -> None:
+        if name in ordered:
+            return
+        for parent in _REFERENCES_RE.findall(schema[name].get("create_table", "")):
+            if parent in schema and parent != name and parent not in path:
+                visit(parent, path | {name})
+        ordered[name] = None
+
+    for table_name in schema:
+        visit(table_name, frozenset())
+    return tuple(ordered)
+
+
+# أسماء الجداول مرتبة حسب المفاتيح الأجنبية كي يُنشأ الجدول المرجعي قبل الجداول التابعة له.
+_TABLE_NAMES: Final[tuple[str, ...]] = _foreign_key_order(REQUIRED_SCHEMA)
+# اتحاد أسماء الأعمدة المطلوبة في كل الجداول لتصفية قراءة الأعمدة المجمّعة.
+_ALL_COLUMN_NAMES: Final[tuple[str, ...]] = tuple(
+    sorted({column for config in REQUIRED_SCHEMA.values() for column in config["columns"]})
+)
+_INDEX_NAME_RE: Final[re.Pattern[str]] = re.compile(
+    r"INDEX(?: IF NOT EXISTS)?\s+\"([^\"]+)\"", flags=re.IGNORECASE
+)
+
+
+def _index_sql_by_name() -> dict[str, str]:
+    """يربط اسم كل فهرس مطلوب بأمر إنشائه، مستنتجاً الاسم من الأمر عند غيابه."""
+    mapping: dict[str, str] = {}
+    for name in _TABLE_NAMES:
+        config = REQUIRED_SCHEMA[name]
+        index_names = config.get("index_names", {})
+        for column, sql in config["indexes"].items():
+            match = _INDEX_NAME_RE.search(sql)
+            index_name = index_names.get(column) or (match.group(1) if match else None)
+            if index_name:
+                mapping[index_name] = sql
+    return mapping
+
+
+# أسماء الفهارس المطلوبة مع أمر إنشاء كل منها، لفحص وجودها دفعة واحدة وإنشاء الناقص فقط.
+_INDEX_SQL_BY_NAME: Final[Mapping[str, str]] = MappingProxyType(_index_sql_by_name())
+_ALL_INDEX_NAMES: Final[tuple[str, ...]] = tuple(_INDEX_SQL_BY_NAME)
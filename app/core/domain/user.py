@@ -14,7 +14,7 @@ from sqlalchemy.orm import relationship
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.core.domain.common import CaseInsensitiveEnum, FlexibleEnum, utc_now
-from app.security.passwords import pwd_context
+from app.security.passwords import pwd_context, verify_against_dummy_hash
 
 if TYPE_CHECKING:
     from app.core.domain.audit import AuditLog
@@ -22,6 +22,11 @@ if TYPE_CHECKING:
     from app.core.domain.mission import Mission
 
 
+def _new_uuid_str() -> str:
+    """يولد معرّف UUID نصيًا بالصيغة ذات الشرطات المتوافقة مع أعمدة String(36)."""
+    return str(uuid.uuid4())
+
+
 class UserStatus(CaseInsensitiveEnum):
     """User Lifecycle Status."""
 
@@ -35,7 +40,7 @@ class User(SQLModel, table=True):
     __tablename__ = "users"
     id: int | None = Field(default=None, primary_key=True)
     external_id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=_new_uuid_str,
         sa_column=Column(String(36), unique=True, nullable=True),
     )
     full_name: str = Field(max_length=150)
@@ -112,12 +117,22 @@ class User(SQLModel, table=True):
         self.password_hash = pwd_context.hash(password)
 
     def check_password(self, password: str) -> bool:
+        valid, _ = self.verify_password_and_rehash(password)
+        return valid
+
+    def verify_password_and_rehash(self, password: str) -> tuple[bool, str | None]:
+        """
+        يتحقق من كلمة المرور دون تعديل الكائن، ويعيد تجزئة Argon2id بديلة إن كانت القديمة مهملة.
+
+        حفظ التجزئة الجديدة مسؤولية طبقة الخدمة كي تُثبَّت في المعاملة على حلقة الأحداث.
+        """
         if not self.password_hash:
-            return False
-        return pwd_context.verify(password, self.password_hash)
+            # زمن ثابت: الحساب بلا كلمة مرور يستغرق زمن التحقق نفسه.
+            verify_against_dummy_hash(password)
+            return False, None
+        return pwd_context.verify_and_update(password, self.password_hash)
 
-    def verify_password(self, password: str) -> bool:
-        return self.check_password(password)
+    verify_password = check_password
 
     def __repr__(self):
         return f"<User id={self.id} email={self.email}>"
@@ -214,11 +229,11 @@ class RefreshToken(SQLModel, table=True):
 
     id: int | None = Field(default=None, primary_key=True)
     token_id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=_new_uuid_str,
         sa_column=Column(String(36), unique=True, nullable=False),
     )
     family_id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=_new_uuid_str,
         sa_column=Column(String(36), index=True, nullable=False),
     )
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -260,7 +275,7 @@ class PasswordResetToken(SQLModel, table=True):
 
     id: int | None = Field(default=None, primary_key=True)
     token_id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=_new_uuid_str,
         sa_column=Column(String(36), unique=True, nullable=False),
     )
     hashed_token: str = Field(max_length=255, sa_column=Column(String(255), unique=True))
@@ -5,15 +5,19 @@
 وفق مبدأ: Functional Core, Imperative Shell.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
 
 from app.core.event_bus_impl import get_event_bus
 from app.core.protocols import EventBusProtocol
-from app.services.overmind.langgraph.service import LangGraphAgentService, create_langgraph_service
 from app.services.overmind.plan_registry import AgentPlanRegistry
 
+if TYPE_CHECKING:
+    from app.services.overmind.langgraph.service import LangGraphAgentService
+
 __all__ = [
     "AppStateServices",
     "apply_app_state",
@@ -26,10 +30,17 @@ class AppStateServices:
     """حاوية حالة التطبيق المنسقة كبيانات صريحة."""
 
     agent_plan_registry: AgentPlanRegistry
-    langgraph_service: LangGraphAgentService
+    langgraph_service_factory: Callable[[], "LangGraphAgentService"]
     event_bus: EventBusProtocol
 
 
+def _lazy_langgraph_service() -> "LangGraphAgentService":
+    """يستورد خدمة LangGraph وينشئها عند أول طلب فقط بدل وقت الإقلاع."""
+    from app.services.overmind.langgraph.service import get_langgraph_service
+
+    return get_langgraph_service()
+
+
 def build_app_state() -> AppStateServices:
     """
     يبني حالة التطبيق كبيانات صريحة بدون تأثيرات جانبية.
@@ -39,7 +50,7 @@ def build_app_state() -> AppStateServices:
     """
     return AppStateServices(
         agent_plan_registry=AgentPlanRegistry(),
-        langgraph_service=create_langgraph_service(),
+        langgraph_service_factory=_lazy_langgraph_service,
         event_bus=get_event_bus(),
     )
 
@@ -53,5 +64,5 @@ def apply_app_state(app: FastAPI, state: AppStateServices) -> None:
         state: حاوية حالة التطبيق.
     """
     app.state.agent_plan_registry = state.agent_plan_registry
-    app.state.langgraph_service = state.langgraph_service
+    app.state.langgraph_service_factory = state.langgraph_service_factory
     app.state.event_bus = state.event_bus
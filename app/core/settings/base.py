@@ -163,6 +163,11 @@ class AppSettings(BaseServiceSettings):
     # Security (Tokens)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(60 * 24 * 8, description="Access Token Expiry")
     REAUTH_TOKEN_EXPIRE_MINUTES: int = Field(10, description="Re-auth Token Expiry")
+    REAUTH_CACHE_TTL_SECONDS: int = Field(
+        0,
+        ge=0,
+        description="Reuse a verified re-auth proof for this many seconds (0 disables).",
+    )
 
     @field_validator("BACKEND_CORS_ORIGINS", "ALLOWED_HOSTS", mode="before")
     @classmethod
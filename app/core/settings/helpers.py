@@ -7,14 +7,21 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import re
 import secrets
 
+import orjson
+
 logger = logging.getLogger("app.core.settings")
 
 _DEV_SECRET_KEY_CACHE: str | None = None
 
+# جزء محلي ونطاق بلا مسافات أو نقاط طرفية/متتالية، ونطاق علوي من حرفين على الأقل.
+_EMAIL_RE = re.compile(r"[^\s@.]+(?:\.[^\s@.]+)*@[^\s@.]+(?:\.[^\s@.]+)*\.[^\s@.]{2,}")
+
 
 def _get_or_create_dev_secret_key() -> str:
     """ينشئ مفتاحًا ثابتًا للتطوير لتجنّب إبطال الجلسات عند إعادة التشغيل."""
@@ -51,8 +58,9 @@ def _upgrade_postgres_protocol(url: str) -> str:
     return url
 
 
+@functools.lru_cache(maxsize=8)
 def _normalize_postgres_ssl(url: str) -> str:
-    """يوحد معاملات SSL في روابط PostgreSQL إلى صيغة واحدة آمنة."""
+    """يوحد معاملات SSL في روابط PostgreSQL إلى صيغة واحدة آمنة (دالة نقية مخزنة)."""
     if not url.startswith(("postgres://", "postgresql://", "postgresql+asyncpg://")):
         return url
 
@@ -80,23 +88,18 @@ def _normalize_postgres_ssl(url: str) -> str:
     return urlunparse(parsed._replace(query=new_query))
 
 
+def _clean_items(items: list[object]) -> list[str]:
+    """يقص العناصر ويسقط الفارغ منها ثم يزيل التكرار مع الحفاظ على الترتيب."""
+    return list(dict.fromkeys(text for item in items if (text := str(item).strip())))
+
+
 def _normalize_csv_or_list(value: list[str] | str | None) -> list[str]:
     """يطبع قيَم CSV أو JSON إلى قائمة نصية مرتبة دون تكرار."""
     if value is None:
         return []
 
-    def _deduplicate(items: list[str]) -> list[str]:
-        seen: set[str] = set()
-        normalized: list[str] = []
-        for item in items:
-            if item not in seen:
-                seen.add(item)
-                normalized.append(item)
-        return normalized
-
     if isinstance(value, list):
-        cleaned = [str(item).strip() for item in value if str(item).strip()]
-        return _deduplicate(cleaned)
+        return _clean_items(value)
 
     if isinstance(value, str):
         candidate = value.strip()
@@ -107,37 +110,23 @@ def _normalize_csv_or_list(value: list[str] | str | None) -> list[str]:
             try:
                 parsed = json.loads(candidate)
                 if isinstance(parsed, list):
-                    cleaned = [str(item).strip() for item in parsed if str(item).strip()]
-                    return _deduplicate(cleaned)
+                    return _clean_items(parsed)
             except json.JSONDecodeError:
                 pass
 
-        cleaned = [item.strip() for item in candidate.split(",") if item.strip()]
-        return _deduplicate(cleaned)
+        return _clean_items(candidate.split(","))
 
     return []
 
 
 def _is_valid_email(value: str) -> bool:
     """يتحقق من تنسيق بريد إلكتروني بسيط وآمن للاستخدام الإداري."""
-    candidate = value.strip().lower()
-    if not candidate or " " in candidate:
-        return False
-    if candidate.count("@") != 1:
-        return False
-    local, _, domain = candidate.partition("@")
-    if not local or not domain:
-        return False
-    if local.startswith(".") or local.endswith(".") or ".." in local:
-        return False
-    if "." not in domain or domain.startswith(".") or domain.endswith(".") or ".." in domain:
-        return False
-    return len(domain.split(".")[-1]) >= 2
+    return _EMAIL_RE.fullmatch(value.strip()) is not None
 
 
 def _lenient_json_loads(value: str) -> object:
     """يفسر قيم البيئة كـ JSON مع السماح بالنصوص عند فشل التحليل."""
     try:
-        return json.loads(value)
-    except json.JSONDecodeError:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
         return value
@@ -8,6 +8,9 @@ import yaml
 
 _LOG = logging.getLogger("yaml_utils")
 
+# محمّل libyaml المكتوب بلغة C أسرع بعدة أضعاف، ويتوفر فقط إن بُنيت PyYAML مع libyaml.
+_SAFE_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 type YamlScalar = str | int | float | bool | None
 type YamlValue = YamlScalar | list["YamlValue"] | dict[str, "YamlValue"]
 type YamlDocument = dict[str, YamlValue] | list[YamlValue] | YamlValue
@@ -34,12 +37,12 @@ class YamlSource(Protocol):
 
 
 class SafeYamlParser:
-    """محلل YAML آمن يعتمد على `yaml.safe_load` فقط."""
+    """محلل YAML آمن يعتمد على المحمّل الآمن فقط (`CSafeLoader` عند توفر libyaml)."""
 
     def parse(self, content: str | bytes) -> YamlDocument:
         """يفسر محتوى YAML باستخدام التحميل الآمن مع حماية من التنفيذ البعيد."""
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_SAFE_LOADER)  # nosec B506 - محمّل آمن
             return cast(YamlDocument, data)
         except yaml.YAMLError as exc:
             _LOG.error("فشل تحليل YAML بأمان: %s", exc)
@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
 from fastapi import Depends, HTTPException, Request, status
@@ -60,20 +61,21 @@ async def get_current_user(
 
     rbac = RBACService(service.session)
     await rbac.ensure_seed()
-    roles = await rbac.user_roles(user.id)
+    roles, permissions = await rbac.user_roles_and_permissions(user.id)
 
     if not roles:
         desired_role = ADMIN_ROLE if user.is_admin else STANDARD_ROLE
         await rbac.assign_role(user, desired_role)
-        roles = await rbac.user_roles(user.id)
+        roles, permissions = await rbac.user_roles_and_permissions(user.id)
 
-    permissions = await rbac.user_permissions(user.id)
     return CurrentUser(user=user, roles=roles, permissions=permissions)
 
 
 def require_roles(*roles: str):
+    required = frozenset(roles)
+
     async def dependency(current: CurrentUser = Depends(get_current_user)) -> CurrentUser:
-        if not set(current.roles).intersection(set(roles)):
+        if required.isdisjoint(current.roles):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient role")
         return current
 
@@ -81,8 +83,10 @@ def require_roles(*roles: str):
 
 
 def require_permissions(*permissions: str):
+    required = frozenset(permissions)
+
     async def dependency(current: CurrentUser = Depends(get_current_user)) -> CurrentUser:
-        if not set(permissions).issubset(current.permissions):
+        if not required.issubset(current.permissions):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Missing permissions")
         return current
 
@@ -102,11 +106,13 @@ def require_permissions_or_admin(*permissions: str):
         HTTPException: في حال غياب الصلاحيات المطلوبة لمستخدم غير إداري.
     """
 
+    required = frozenset(permissions)
+
     async def dependency(current: CurrentUser = Depends(get_current_user)) -> CurrentUser:
         if current.user.is_admin:
             return current
 
-        if not set(permissions).issubset(current.permissions):
+        if not required.issubset(current.permissions):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Missing permissions")
 
         return current
@@ -134,7 +140,7 @@ def reauth_dependency():
             )
             return current
 
-        if password and current.user.check_password(password):
+        if password and await asyncio.to_thread(current.user.check_password, password):
             return current
 
         raise HTTPException(
@@ -19,9 +19,9 @@ class LangGraphDriver(WorkflowEngine):
         try:
             # Lazy import to avoid circular dependencies and ensure isolation
             from app.services.overmind.domain.api_schemas import LangGraphRunRequest
-            from app.services.overmind.langgraph.service import create_langgraph_service
+            from app.services.overmind.langgraph.service import get_langgraph_service
 
-            service = create_langgraph_service()
+            service = get_langgraph_service()
             request = LangGraphRunRequest(
                 goal=plan.goal,
                 context=plan.context or {},
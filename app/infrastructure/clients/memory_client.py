@@ -5,9 +5,12 @@
 يتواصل مع خدمة Memory Agent لإدارة السياق والمعرفة.
 """
 
+import asyncio
+
 import httpx
 from pydantic import BaseModel
 
+from app.core.http_client_factory import HTTPClientConfig, get_http_client
 from app.core.logging import get_logger
 from app.core.settings.base import get_settings
 
@@ -47,59 +50,69 @@ class MemoryClient:
         # استخدام المتغيرات البيئية إذا كانت موجودة
         if hasattr(self.settings, "MEMORY_AGENT_URL") and self.settings.MEMORY_AGENT_URL:
             self.base_url = self.settings.MEMORY_AGENT_URL
+        self._base_url = self.base_url.rstrip("/")
 
         self.headers = {
             "Authorization": f"Bearer {self.settings.SECRET_KEY}",
             "Content-Type": "application/json",
         }
         self.timeout = httpx.Timeout(10.0, connect=5.0)
+        # عميل مشترك من المصنع المركزي يعيد استخدام الاتصالات ويُغلق مع إيقاف النواة.
+        self.config = HTTPClientConfig(
+            name="memory-agent-client",
+            timeout=10.0,
+            max_connections=128,
+            max_keepalive_connections=64,
+        )
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        return get_http_client(self.config)
+
+    def _url(self, path: str) -> str:
+        """التأكد من صحة الرابط (الجذر مُطبَّع مرة واحدة في المُنشئ)."""
+        return f"{self._base_url}/{path.lstrip('/')}"
 
     async def _get(self, path: str, params: dict | None = None) -> dict | list | None:
         """تنفيذ طلب GET."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                # التأكد من صحة الرابط
-                url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
-                response = await client.get(
-                    url,
-                    headers=self.headers,
-                    params=params,
-                )
-                if response.status_code == 404:
-                    return None
-                response.raise_for_status()
-                return response.json()
-            except httpx.RequestError as e:
-                logger.error(f"Memory Service Connection Error: {e}")
-                # في حالة التطوير، قد لا تكون الخدمة متاحة، نعيد None بدلاً من الفشل
-                # ولكن هذا قد يخفي أخطاء حقيقية. الأفضل هو رفع الاستثناء.
-                return None  # Fail Safe for Migration Phase
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"Memory Service HTTP Error: {e.response.status_code} - {e.response.text}"
-                )
+        client = await self._get_client()
+        try:
+            response = await client.get(
+                self._url(path),
+                headers=self.headers,
+                params=params,
+                timeout=self.timeout,
+            )
+            if response.status_code == 404:
                 return None
+            response.raise_for_status()
+            return response.json()
+        except httpx.RequestError as e:
+            logger.error(f"Memory Service Connection Error: {e}")
+            # في حالة التطوير، قد لا تكون الخدمة متاحة، نعيد None بدلاً من الفشل
+            # ولكن هذا قد يخفي أخطاء حقيقية. الأفضل هو رفع الاستثناء.
+            return None  # Fail Safe for Migration Phase
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Memory Service HTTP Error: {e.response.status_code} - {e.response.text}")
+            return None
 
     async def _post(self, path: str, payload: dict) -> dict | list | None:
         """تنفيذ طلب POST."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.RequestError as e:
-                logger.error(f"Memory Service Connection Error: {e}")
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"Memory Service HTTP Error: {e.response.status_code} - {e.response.text}"
-                )
-                return None
+        client = await self._get_client()
+        try:
+            response = await client.post(
+                self._url(path),
+                headers=self.headers,
+                json=payload,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.RequestError as e:
+            logger.error(f"Memory Service Connection Error: {e}")
+            return None
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Memory Service HTTP Error: {e.response.status_code} - {e.response.text}")
+            return None
 
     async def get_concept(self, concept_id: str) -> Concept | None:
         """جلب مفهوم."""
@@ -126,6 +139,25 @@ class MemoryClient:
         data = await self._get(f"/knowledge/concepts/{concept_id}/next")
         return [Concept(**item) for item in data] if data else []
 
+    async def get_concept_neighborhood(self, concept_id: str) -> dict[str, list[Concept]]:
+        """جلب المتطلبات والمفاهيم المرتبطة والتالية في رحلة واحدة.
+
+        يعود إلى الطلبات الثلاثة المتزامنة إن لم تدعم الخدمة مسار `/graph`.
+        """
+        data = await self._get(f"/knowledge/concepts/{concept_id}/graph")
+        if isinstance(data, dict):
+            return {
+                key: [Concept(**item) for item in data.get(key) or []]
+                for key in ("prerequisites", "related", "next")
+            }
+
+        prerequisites, related, next_concepts = await asyncio.gather(
+            self.get_prerequisites(concept_id),
+            self.get_related_concepts(concept_id),
+            self.get_next_concepts(concept_id),
+        )
+        return {"prerequisites": prerequisites, "related": related, "next": next_concepts}
+
     async def get_learning_path(self, from_concept: str, to_concept: str) -> list[Concept]:
         """جلب مسار تعلم."""
         payload = {"from_concept": from_concept, "to_concept": to_concept}
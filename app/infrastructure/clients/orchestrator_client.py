@@ -9,9 +9,10 @@ from __future__ import annotations
 import json
 import logging
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 
 import httpx
+import orjson
 from pydantic import BaseModel
 from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 
@@ -50,6 +51,20 @@ class MissionResponse(BaseModel):
     steps: list[dict[str, object]] = []
 
 
+async def _iter_ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+    """يقسم تدفق البايتات إلى أسطر NDJSON دون فك ترميز كل سطر إلى نص مسبقًا."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        if b"\n" not in chunk:
+            continue
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
 class OrchestratorClient:
     """
     Client for interacting with the Orchestrator Service.
@@ -239,13 +254,12 @@ class OrchestratorClient:
 
         client = await self._get_client()
         try:
-            logger.info(f"Dispatching mission to Orchestrator: {objective[:50]}...")
+            logger.info("Dispatching mission to Orchestrator: %.50s...", objective)
             response = await client.post(url, json=payload, headers=headers)
             response.raise_for_status()
-            data = response.json()
-            return MissionResponse(**data)
+            return MissionResponse.model_validate_json(response.content)
         except Exception as e:
-            logger.error(f"Failed to create mission: {e}", exc_info=True)
+            logger.error("Failed to create mission: %s", e, exc_info=True)
             raise
 
     async def get_mission(self, mission_id: int) -> MissionResponse | None:
@@ -259,10 +273,9 @@ class OrchestratorClient:
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-            data = response.json()
-            return MissionResponse(**data)
+            return MissionResponse.model_validate_json(response.content)
         except Exception as e:
-            logger.error(f"Failed to get mission {mission_id}: {e}")
+            logger.error("Failed to get mission %s: %s", mission_id, e)
             raise
 
     async def get_mission_events(self, mission_id: int) -> list[dict]:
@@ -276,9 +289,9 @@ class OrchestratorClient:
             if response.status_code == 404:
                 return []
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            logger.error(f"Failed to get mission events {mission_id}: {e}")
+            logger.error("Failed to get mission events %s: %s", mission_id, e)
             return []
 
     async def chat_with_agent(
@@ -343,14 +356,15 @@ class OrchestratorClient:
 
                 try:
                     response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        if not line.strip():
+                    async for raw_line in _iter_ndjson_lines(response.aiter_bytes()):
+                        if not raw_line.strip():
                             continue
                         try:
-                            parsed_line = json.loads(line)
+                            parsed_line = orjson.loads(raw_line)
                             yield self._normalize_stream_event(parsed_line)
-                        except json.JSONDecodeError:
-                            logger.warning(f"Received non-JSON line from agent: {line[:50]}...")
+                        except orjson.JSONDecodeError:
+                            line = raw_line.decode("utf-8", "replace").rstrip("\r")
+                            logger.warning("Received non-JSON line from agent: %.50s...", line)
                             yield self._normalize_stream_event(line)
                     return
                 finally:
@@ -385,7 +399,7 @@ class OrchestratorClient:
                 self._sanitize_error_for_user(request_id=request_id), ensure_ascii=False
             )
         except Exception as e:
-            logger.error(f"Failed to chat with agent: {e}", exc_info=True)
+            logger.error("Failed to chat with agent: %s", e, exc_info=True)
             yield json.dumps(
                 self._sanitize_error_for_user(request_id=request_id), ensure_ascii=False
             )
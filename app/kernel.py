@@ -45,6 +45,7 @@ from app.core.asyncapi_contracts import (
 from app.core.config import AppSettings
 from app.core.database import async_session_factory
 from app.core.db_schema import validate_schema_on_startup
+from app.core.http_client_factory import close_all_http_clients, get_http_client
 from app.core.kernel_state import apply_app_state, build_app_state
 from app.core.openapi_contracts import (
     compare_contract_to_runtime,
@@ -52,8 +53,11 @@ from app.core.openapi_contracts import (
     load_contract_operations,
 )
 from app.core.redis_bus import get_redis_bridge
+from app.infrastructure.clients.orchestrator_client import orchestrator_client
+from app.infrastructure.clients.user_client import user_client
 from app.middleware.fastapi_error_handlers import add_error_handlers
 from app.middleware.static_files_middleware import StaticFilesConfig, setup_static_files_middleware
+from app.services.audit import drain_pending_audit_records
 from app.services.bootstrap import bootstrap_admin_account
 from app.telemetry.unified_observability import get_unified_observability
 
@@ -71,7 +75,7 @@ def _apply_middleware(app: FastAPI, stack: list[MiddlewareSpec]) -> FastAPI:
     return app
 
 
-def _mount_routers(app: FastAPI, registry: list[RouterSpec]) -> FastAPI:
+def _mount_routers(app: FastAPI, registry: tuple[RouterSpec, ...]) -> FastAPI:
     """
     Combinator: ربط الموجهات بالتطبيق.
     """
@@ -223,6 +227,10 @@ class RealityKernel:
         except Exception as e:
             logger.warning(f"⚠️ Failed to start Redis Event Bridge: {e}")
 
+        # Pre-build pooled HTTP clients so hot admin/chat paths never pay pool setup
+        for service_client in (user_client, orchestrator_client):
+            get_http_client(service_client.config)
+
         logger.info("✅ System Ready")
         yield
 
@@ -239,6 +247,18 @@ class RealityKernel:
         except Exception as e:
             logger.warning(f"⚠️ Failed to stop observability sync: {e}")
 
+        # Flush audit writes scheduled in the background by request handlers
+        try:
+            await drain_pending_audit_records()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to flush pending audit records: {e}")
+
+        # Release pooled HTTP connections held by boundary service clients
+        try:
+            await close_all_http_clients()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to close HTTP clients: {e}")
+
         logger.info("👋 CogniForge System Shutting Down...")
 
 
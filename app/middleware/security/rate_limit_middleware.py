@@ -16,6 +16,9 @@ from app.middleware.core.context import RequestContext
 from app.middleware.core.result import MiddlewareResult
 from app.security.rate_limiter import AdaptiveRateLimiter, UserTier
 
+# Health probes bypass throttling; a frozenset keeps the per-request check O(1).
+_HEALTH_CHECK_PATHS = frozenset({"/health", "/api/health", "/ping"})
+
 
 class RateLimitMiddleware(BaseMiddleware):
     """
@@ -62,7 +65,7 @@ class RateLimitMiddleware(BaseMiddleware):
 
     def _is_health_check(self, path: str) -> bool:
         """Check if path is a health check endpoint"""
-        return path in ["/health", "/api/health", "/ping"]
+        return path in _HEALTH_CHECK_PATHS
 
     def _check_rate_limit(self, ctx: RequestContext, user_tier) -> tuple:
         """Check rate limit for the request"""
@@ -6,12 +6,34 @@
 """
 
 import os
+from functools import cache
 
 from passlib.context import CryptContext
 
 os.environ.setdefault("PASSLIB_BUILTIN_BCRYPT", "enabled")
 
+# معاملات Argon2id مثبّتة صراحةً كي لا يغيّرها تحديث passlib فيُعاد تجزئة كل الحسابات.
+# التوازي ثابت وليس مشتقاً من عدد المعالجات حتى تبقى التجزئات متطابقة بين الخوادم.
 pwd_context = CryptContext(
     schemes=["argon2", "bcrypt", "pbkdf2_sha256", "sha256_crypt"],
     deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=65536,
+    argon2__rounds=3,
+    argon2__parallelism=4,
 )
+
+
+@cache
+def _dummy_hash() -> str:
+    """تجزئة وهمية بمعاملات السياق الحالية تُحسب مرة عند أول حاجة لا عند الاستيراد."""
+    return pwd_context.hash("!invalid!")
+
+
+def verify_against_dummy_hash(password: str) -> None:
+    """
+    يستهلك زمن تحقق كامل دون حساب حقيقي.
+
+    يُستدعى عندما لا يوجد حساب أو لا توجد له كلمة مرور كي لا يكشف زمن الاستجابة ذلك.
+    """
+    pwd_context.verify(password, _dummy_hash())
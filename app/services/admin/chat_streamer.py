@@ -30,6 +30,9 @@ logger = logging.getLogger(__name__)
 # مجموعة عالمية للحفاظ على مراجع المهام الخلفية ومنع جمع القمامة (Garbage Collection)
 _background_tasks: set[asyncio.Task[object]] = set()
 
+# أنواع أحداث الخطأ التي تُمرَّر كما هي دون استخراج نص.
+_ERROR_EVENT_TYPES = frozenset({"error", "assistant_error"})
+
 
 class AdminChatStreamer:
     """
@@ -167,7 +170,7 @@ class AdminChatStreamer:
 
             if isinstance(content_part, dict):
                 # Extract text explicitly to avoid sending raw JSON dictionary
-                if "type" in content_part and content_part["type"] in ["error", "assistant_error"]:
+                if content_part.get("type") in _ERROR_EVENT_TYPES:
                     yield content_part
                     continue
                 elif "الإجابة" in content_part:
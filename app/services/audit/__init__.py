@@ -1,5 +1,15 @@
 from app.services.audit.enums import AuditAction
 from app.services.audit.schemas import AuditLogEntry
-from app.services.audit.service import AuditService
+from app.services.audit.service import (
+    AuditService,
+    drain_pending_audit_records,
+    schedule_audit_record,
+)
 
-__all__ = ["AuditAction", "AuditLogEntry", "AuditService"]
+__all__ = [
+    "AuditAction",
+    "AuditLogEntry",
+    "AuditService",
+    "drain_pending_audit_records",
+    "schedule_audit_record",
+]
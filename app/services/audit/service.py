@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -102,3 +102,76 @@ class AuditService:
             logger.error(f"Failed to persist audit log: {e}")
             await self.session.rollback()
             raise
+
+
+# Strong references keep scheduled audit writes alive until they finish.
+_pending_records: set[asyncio.Task[None]] = set()
+
+
+def schedule_audit_record(
+    session_factory: Callable[[], AsyncSession],
+    *,
+    actor_user_id: int | None,
+    action: str | AuditAction,
+    target_type: str,
+    target_id: str | None,
+    metadata: Mapping[str, object],
+    ip: str | None,
+    user_agent: str | None,
+) -> asyncio.Task[None]:
+    """
+    Persist an audit entry in the background on a dedicated session.
+
+    The request-scoped session may close before the write completes, so the
+    task opens its own. Call `drain_pending_audit_records` on shutdown.
+    """
+    task = asyncio.create_task(
+        _record_detached(
+            session_factory,
+            actor_user_id=actor_user_id,
+            action=action,
+            target_type=target_type,
+            target_id=target_id,
+            metadata=metadata,
+            ip=ip,
+            user_agent=user_agent,
+        )
+    )
+    _pending_records.add(task)
+    task.add_done_callback(_finish_record)
+    return task
+
+
+async def drain_pending_audit_records() -> None:
+    """Wait for every scheduled audit write so none is lost on shutdown."""
+    if _pending_records:
+        await asyncio.gather(*_pending_records, return_exceptions=True)
+
+
+async def _record_detached(
+    session_factory: Callable[[], AsyncSession],
+    *,
+    actor_user_id: int | None,
+    action: str | AuditAction,
+    target_type: str,
+    target_id: str | None,
+    metadata: Mapping[str, object],
+    ip: str | None,
+    user_agent: str | None,
+) -> None:
+    async with session_factory() as session:
+        await AuditService(session).record(
+            actor_user_id=actor_user_id,
+            action=action,
+            target_type=target_type,
+            target_id=target_id,
+            metadata=metadata,
+            ip=ip,
+            user_agent=user_agent,
+        )
+
+
+def _finish_record(task: asyncio.Task[None]) -> None:
+    _pending_records.discard(task)
+    if not task.cancelled() and (error := task.exception()) is not None:
+        logger.error("Background audit write failed: %s", error)
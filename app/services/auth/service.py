@@ -7,6 +7,10 @@
 
 from __future__ import annotations
 
+import hashlib
+import time
+from collections import OrderedDict
+
 from fastapi import HTTPException, status
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,15 +18,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.base_service import BaseService
 from app.core.config import AppSettings, get_settings
 from app.core.domain.user import RefreshToken, User, UserStatus
-from app.security.passwords import pwd_context
+from app.security.passwords import verify_against_dummy_hash
 from app.services.audit import AuditService
 from app.services.auth.crypto import AuthCrypto
 from app.services.auth.password_manager import PasswordManager
 from app.services.auth.registration import RegistrationManager
 from app.services.auth.schema import TokenBundle
-from app.services.auth.token_manager import TokenManager
+from app.services.auth.token_manager import TokenManager, verify_refresh_secret
 from app.services.rbac import ADMIN_ROLE, RBACService
 
+REAUTH_CACHE_MAX_ENTRIES = 10_000
+
+# أدلة إعادة المصادقة التي نجح التحقق منها: المفتاح (بصمة الرمز، معرف المستخدم)
+# والقيمة لحظة انتهاء صلاحية المدخل، بترتيب LRU يُقصى منه الأقدم استخداماً عند الامتلاء.
+# تبقى فارغة ما لم تُفعّل REAUTH_CACHE_TTL_SECONDS.
+_verified_reauth_proofs: OrderedDict[tuple[bytes, int], float] = OrderedDict()
+
 
 class AuthService(BaseService):
     """
@@ -87,7 +98,14 @@ class AuthService(BaseService):
         result = await self.session.execute(select(User).where(User.email == normalized_email))
         user = result.scalar_one_or_none()
 
-        if not user or not user.password_hash or not user.check_password(password):
+        upgraded_hash: str | None = None
+        if user is None:
+            # زمن ثابت: البريد غير المسجّل يستغرق زمن التحقق نفسه كي لا يُكشف وجود الحساب.
+            verify_against_dummy_hash(password)
+            valid = False
+        else:
+            valid, upgraded_hash = user.verify_password_and_rehash(password)
+        if user is None or not valid:
             self._log_warning(
                 "Authentication failed", email_hash=self.crypto.hash_identifier(normalized_email)
             )
@@ -108,6 +126,10 @@ class AuthService(BaseService):
             self._log_warning("Authentication rejected: Account disabled", user_id=str(user.id))
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account disabled")
 
+        if upgraded_hash:
+            # ترقية التجزئة القديمة إلى Argon2id؛ يثبتها commit سجل التدقيق التالي.
+            user.password_hash = upgraded_hash
+
         await self.audit.record(
             actor_user_id=user.id,
             action="AUTH_SUCCEEDED",
@@ -236,7 +258,18 @@ class AuthService(BaseService):
         ip: str | None = None,
         user_agent: str | None = None,
     ) -> None:
-        """التحقق من رمز إعادة المصادقة."""
+        """التحقق من رمز إعادة المصادقة مع إعادة استخدام تحقق حديث عند تفعيل الذاكرة."""
+        cache_ttl = self.settings.REAUTH_CACHE_TTL_SECONDS
+        now = time.time()
+        if cache_ttl:
+            cache_key = (hashlib.sha256(token.encode()).digest()[:16], user.id)
+            deadline = _verified_reauth_proofs.get(cache_key)
+            if deadline is not None:
+                if now < deadline:
+                    _verified_reauth_proofs.move_to_end(cache_key)
+                    return
+                del _verified_reauth_proofs[cache_key]
+
         try:
             payload = self.crypto.verify_jwt(token)
         except HTTPException as exc:
@@ -265,6 +298,15 @@ class AuthService(BaseService):
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Re-authentication required"
             )
 
+        if cache_ttl:
+            deadline = now + cache_ttl
+            expires_at = payload.get("exp")
+            if isinstance(expires_at, int | float):
+                deadline = min(deadline, float(expires_at))
+            _verified_reauth_proofs[cache_key] = deadline
+            if len(_verified_reauth_proofs) > REAUTH_CACHE_MAX_ENTRIES:
+                _verified_reauth_proofs.popitem(last=False)
+
     async def refresh_session(
         self,
         *,
@@ -333,7 +375,7 @@ class AuthService(BaseService):
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
             )
 
-        if not pwd_context.verify(secret, record.hashed_token):
+        if not verify_refresh_secret(secret, record.hashed_token):
             await self.token_manager.revoke_record(record)
             await self.audit.record(
                 actor_user_id=record.user_id,
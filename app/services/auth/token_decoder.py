@@ -7,11 +7,21 @@
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+
 import jwt
 from fastapi import HTTPException
 
 ALGORITHM = "HS256"
 
+DECODE_CACHE_MAX_ENTRIES = 1024
+DECODE_CACHE_TTL_SECONDS = 60.0
+
+# ذاكرة LRU للرموز التي نجح التحقق من توقيعها: المفتاح (الرمز، السر) والقيمة
+# (معرف المستخدم، الحمولة، لحظة انتهاء الصلاحية). لا تُخزن الرموز الفاشلة أبداً.
+_decoded_tokens: OrderedDict[tuple[str, str], tuple[int, dict[str, object], float]] = OrderedDict()
+
 
 def extract_bearer_token(auth_header: str | None) -> str:
     """
@@ -37,16 +47,16 @@ def extract_bearer_token(auth_header: str | None) -> str:
     return parts[1]
 
 
-def decode_user_id(token: str, secret_key: str) -> int:
+def _decode_payload(token: str, secret_key: str) -> tuple[int, dict[str, object]]:
     """
-    فك ترميز رمز JWT واستخراج معرف المستخدم.
+    التحقق من توقيع رمز JWT وإرجاع معرف المستخدم مع الحمولة كاملة.
 
     Args:
         token: رمز JWT الخام.
         secret_key: المفتاح السري المستخدم للفك.
 
     Returns:
-        int: معرف المستخدم المستخلص من الحمولة.
+        tuple[int, dict[str, object]]: معرف المستخدم والحمولة المفكوكة.
 
     Raises:
         HTTPException: عند فشل التحقق أو غياب معرف المستخدم.
@@ -59,9 +69,82 @@ def decode_user_id(token: str, secret_key: str) -> int:
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token payload")
 
-        return int(user_id)
+        return int(user_id), payload
 
     except jwt.PyJWTError as exc:
         raise HTTPException(status_code=401, detail="Invalid token") from exc
     except ValueError as exc:
         raise HTTPException(status_code=401, detail="Invalid user ID in token") from exc
+
+
+def _cache_deadline(payload: dict[str, object], now: float) -> float:
+    """
+    حساب لحظة انتهاء صلاحية المدخل المخزن دون تجاوز انتهاء الرمز نفسه.
+
+    Args:
+        payload: الحمولة المفكوكة للرمز.
+        now: الوقت الحالي بثواني حقبة يونكس.
+
+    Returns:
+        float: أقرب لحظتين بين انتهاء مدة التخزين وانتهاء المطالبة `exp`.
+    """
+
+    deadline = now + DECODE_CACHE_TTL_SECONDS
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, int | float):
+        return min(deadline, float(expires_at))
+    return deadline
+
+
+def _decode_payload_cached(token: str, secret_key: str) -> tuple[int, dict[str, object]]:
+    """
+    فك الرمز مع إعادة استخدام نتيجة التحقق لإعادة الاتصالات المتكررة بالرمز نفسه.
+
+    يُحذف المدخل عند انتهاء مدة التخزين القصيرة أو انتهاء صلاحية الرمز، أيهما
+    أقرب، فلا يُقبل رمز منتهي الصلاحية من الذاكرة.
+
+    Args:
+        token: رمز JWT الخام.
+        secret_key: المفتاح السري المستخدم للفك.
+
+    Returns:
+        tuple[int, dict[str, object]]: معرف المستخدم والحمولة المفكوكة.
+
+    Raises:
+        HTTPException: عند فشل التحقق أو غياب معرف المستخدم.
+    """
+
+    key = (token, secret_key)
+    now = time.time()
+    cached = _decoded_tokens.get(key)
+    if cached is not None:
+        user_id, payload, deadline = cached
+        if now < deadline:
+            _decoded_tokens.move_to_end(key)
+            return user_id, payload
+        del _decoded_tokens[key]
+
+    user_id, payload = _decode_payload(token, secret_key)
+    _decoded_tokens[key] = (user_id, payload, _cache_deadline(payload, now))
+    if len(_decoded_tokens) > DECODE_CACHE_MAX_ENTRIES:
+        _decoded_tokens.popitem(last=False)
+    return user_id, payload
+
+
+def decode_user_id(token: str, secret_key: str) -> int:
+    """
+    فك ترميز رمز JWT واستخراج معرف المستخدم.
+
+    Args:
+        token: رمز JWT الخام.
+        secret_key: المفتاح السري المستخدم للفك.
+
+    Returns:
+        int: معرف المستخدم المستخلص من الحمولة.
+
+    Raises:
+        HTTPException: عند فشل التحقق أو غياب معرف المستخدم.
+    """
+
+    user_id, _ = _decode_payload_cached(token, secret_key)
+    return user_id
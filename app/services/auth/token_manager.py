@@ -4,9 +4,11 @@
 
 from __future__ import annotations
 
+import hmac
 import secrets
 import uuid
 from datetime import timedelta
+from hashlib import sha256
 from typing import Final
 
 from sqlalchemy import select
@@ -19,6 +21,18 @@ from app.security.passwords import pwd_context
 REFRESH_EXPIRE_DAYS: Final[int] = 14
 
 
+def hash_refresh_secret(secret: str) -> str:
+    """يبصم سر رمز التحديث بـ SHA-256؛ السر عشوائي عالي الإنتروبيا فلا حاجة لتجزئة كلمات المرور."""
+    return sha256(secret.encode()).hexdigest()
+
+
+def verify_refresh_secret(secret: str, hashed_token: str) -> bool:
+    """يتحقق من سر رمز التحديث بزمن ثابت مع دعم التجزئات القديمة بصيغة passlib."""
+    if hashed_token.startswith("$"):
+        return pwd_context.verify(secret, hashed_token)
+    return hmac.compare_digest(hash_refresh_secret(secret), hashed_token)
+
+
 class TokenManager:
     """مسؤول عن إدارة دورة حياة رموز التحديث في قاعدة البيانات."""
 
@@ -36,7 +50,7 @@ class TokenManager:
         """إنشاء رمز تحديث جديد وحفظه في قاعدة البيانات."""
         token_id = str(uuid.uuid4())
         raw_secret = secrets.token_urlsafe(32)
-        hashed = pwd_context.hash(raw_secret)
+        hashed = hash_refresh_secret(raw_secret)
         expires_at = utc_now() + timedelta(days=REFRESH_EXPIRE_DAYS)
 
         record = RefreshToken(
@@ -13,7 +13,7 @@ from app.core.domain.user import User
 from app.services.admin.chat_persistence import AdminChatPersistence
 from app.services.admin.chat_streamer import AdminChatStreamer
 from app.services.auth.token_decoder import decode_user_id, extract_bearer_token
-from app.services.chat.contracts import ChatDispatchResult, ChatStreamEvent
+from app.services.chat.contracts import ChatActor, ChatDispatchResult, ChatStreamEvent
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +83,7 @@ class AdminChatBoundaryService:
             raise HTTPException(status_code=404, detail="Conversation not found") from e
 
     async def get_or_create_conversation(
-        self, user: User, question: str, conversation_id: str | int | None = None
+        self, user: ChatActor, question: str, conversation_id: str | int | None = None
     ) -> AdminConversation:
         """
         استرجاع محادثة موجودة أو إنشاء واحدة جديدة.
@@ -118,7 +118,7 @@ class AdminChatBoundaryService:
 
     async def stream_chat_response(
         self,
-        user: User,
+        user: ChatActor,
         conversation: AdminConversation,
         question: str,
         history: list[dict[str, object]],
@@ -136,7 +136,7 @@ class AdminChatBoundaryService:
 
     async def stream_chat_response_safe(
         self,
-        user: User,
+        user: ChatActor,
         conversation: AdminConversation,
         question: str,
         history: list[dict[str, object]],
@@ -162,7 +162,7 @@ class AdminChatBoundaryService:
 
     async def orchestrate_chat_stream(
         self,
-        user: User,
+        user: ChatActor,
         question: str,
         conversation_id: str | int | None,
         ai_client: AIClient,
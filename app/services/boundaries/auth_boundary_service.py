@@ -194,9 +194,10 @@ class AuthBoundaryService:
 
         # 2. التحقق من كلمة المرور
         is_valid = False
+        upgraded_hash: str | None = None
         if user:
             try:
-                is_valid = user.verify_password(password)
+                is_valid, upgraded_hash = user.verify_password_and_rehash(password)
             except Exception as e:
                 logger.error(f"Password verification error for user {user.id}: {e}")
                 is_valid = False
@@ -211,6 +212,10 @@ class AuthBoundaryService:
 
         chrono_shield.reset_target(email)
 
+        if upgraded_hash:
+            # ترقية التجزئات القديمة (bcrypt وغيرها) إلى Argon2id عند أول دخول ناجح.
+            await self.persistence.update_password_hash(user, upgraded_hash)
+
         # 3. توليد رمز JWT
         role = "admin" if user.is_admin else "user"
         payload = {
@@ -18,7 +18,7 @@ from app.core.ai_gateway import AIClient
 from app.core.domain.chat import CustomerConversation, MessageRole
 from app.core.domain.user import User
 from app.services.audit import AuditService
-from app.services.chat.contracts import ChatDispatchResult, ChatStreamEvent
+from app.services.chat.contracts import ChatActor, ChatDispatchResult, ChatStreamEvent
 from app.services.chat.intent_detector import ChatIntent, IntentDetector
 from app.services.chat.tool_router import ToolRouter
 from app.services.customer.chat_persistence import CustomerChatPersistence
@@ -32,13 +32,19 @@ class CustomerChatBoundaryService:
     واجهة تنسيق محادثات العملاء القياسيين.
     """
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        intent_detector: IntentDetector | None = None,
+        tool_router: ToolRouter | None = None,
+    ) -> None:
         self.db = db
         self.persistence = CustomerChatPersistence(db)
         self.streamer = CustomerChatStreamer(self.persistence)
         self.audit = AuditService(db)
-        self.intent_detector = IntentDetector()
-        self.tool_router = ToolRouter()
+        self.intent_detector = intent_detector or IntentDetector()
+        self.tool_router = tool_router or ToolRouter()
 
     async def verify_conversation_access(
         self, user: User, conversation_id: int
@@ -56,7 +62,7 @@ class CustomerChatBoundaryService:
 
     async def get_or_create_conversation(
         self,
-        user: User,
+        user: ChatActor,
         question: str,
         conversation_id: str | int | None = None,
     ) -> CustomerConversation:
@@ -110,7 +116,7 @@ class CustomerChatBoundaryService:
 
     async def orchestrate_chat_stream(
         self,
-        user: User,
+        user: ChatActor,
         question: str,
         conversation_id: str | int | None,
         ai_client: AIClient,
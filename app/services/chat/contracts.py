@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator, Callable
 from dataclasses import dataclass
+from typing import Protocol
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +15,16 @@ from app.core.ai_gateway import AIClient
 type ChatStreamEvent = dict[str, object]
 
 
+class ChatActor(Protocol):
+    """الحد الأدنى من هوية الفاعل الذي يحتاجه مسار التفريع (User أو ActorLite)."""
+
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def is_admin(self) -> bool: ...
+
+
 @dataclass(frozen=True, slots=True)
 class ChatDispatchRequest:
     """بيانات موحدة لطلب الدردشة قبل التوجيه حسب الدور."""
@@ -7,14 +7,18 @@
 
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.domain.user import User
 from app.services.boundaries.admin_chat_boundary_service import AdminChatBoundaryService
 from app.services.boundaries.customer_chat_boundary_service import (
     CustomerChatBoundaryService,
 )
-from app.services.chat.contracts import ChatDispatchRequest, ChatDispatchResult
+from app.services.chat.contracts import ChatActor, ChatDispatchRequest, ChatDispatchResult
+from app.services.chat.intent_detector import IntentDetector
+from app.services.chat.tool_router import ToolRouter
 
 
 class ChatRoleDispatcher:
@@ -34,7 +38,7 @@ class ChatRoleDispatcher:
     async def dispatch(
         self,
         *,
-        user: User,
+        user: ChatActor,
         request: ChatDispatchRequest,
     ) -> ChatDispatchResult:
         """
@@ -62,9 +66,36 @@ class ChatRoleDispatcher:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class ChatDispatcherTemplate:
+    """
+    قالب الموزّع الذي يحمل المكونات المستقلة عن الجلسة.
+
+    يُبنى مرة واحدة ثم يُربط بجلسة كل طلب عبر `bind` دون إعادة بناء
+    كاشف النوايا أو موجه الأدوات.
+    """
+
+    intent_detector: IntentDetector
+    tool_router: ToolRouter
+
+    def bind(self, db: AsyncSession) -> ChatRoleDispatcher:
+        """ربط القالب بجلسة الطلب وإنتاج موزّع جاهز."""
+        return ChatRoleDispatcher(
+            admin_boundary=AdminChatBoundaryService(db),
+            customer_boundary=CustomerChatBoundaryService(
+                db,
+                intent_detector=self.intent_detector,
+                tool_router=self.tool_router,
+            ),
+        )
+
+
+@functools.cache
+def get_dispatcher_template() -> ChatDispatcherTemplate:
+    """بناء قالب الموزّع مرة واحدة طوال عمر العملية."""
+    return ChatDispatcherTemplate(intent_detector=IntentDetector(), tool_router=ToolRouter())
+
+
 def build_chat_dispatcher(db: AsyncSession) -> ChatRoleDispatcher:
     """إنشاء موزّع الدردشة مع حدود مستقلة لكل دور."""
-    return ChatRoleDispatcher(
-        admin_boundary=AdminChatBoundaryService(db),
-        customer_boundary=CustomerChatBoundaryService(db),
-    )
+    return get_dispatcher_template().bind(db)
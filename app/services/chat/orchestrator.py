@@ -44,9 +44,27 @@ from app.services.overmind.identity import OvermindIdentity
 
 logger = logging.getLogger(__name__)
 
+# تحويل نوع المهمة الذي يختاره العميل إلى نية صريحة، يُبنى مرة واحدة.
+_MISSION_TYPE_INTENTS: dict[str, ChatIntent] = {
+    "mission_complex": ChatIntent.MISSION_COMPLEX,
+    "deep_analysis": ChatIntent.DEEP_ANALYSIS,
+    "code_search": ChatIntent.CODE_SEARCH,
+    "chat": ChatIntent.DEFAULT,
+}
+
+# نوايا تُفوَّض إلى وكيل المنسق في الخدمة المصغرة.
+_AGENT_INTENTS = frozenset(
+    {
+        ChatIntent.ADMIN_QUERY,
+        ChatIntent.ANALYTICS_REPORT,
+        ChatIntent.LEARNING_SUMMARY,
+        ChatIntent.CURRICULUM_PLAN,
+        ChatIntent.CONTENT_RETRIEVAL,
+    }
+)
+
 if TYPE_CHECKING:
-    from app.core.domain.user import User
-    from app.services.chat.contracts import ChatDispatchRequest, ChatDispatchResult
+    from app.services.chat.contracts import ChatActor, ChatDispatchRequest, ChatDispatchResult
     from app.services.chat.dispatcher import ChatRoleDispatcher
 
 
@@ -186,15 +204,9 @@ class ChatOrchestrator:
             )
             from app.services.chat.intent_detector import IntentResult
 
-            mapping = {
-                "mission_complex": ChatIntent.MISSION_COMPLEX,
-                "deep_analysis": ChatIntent.DEEP_ANALYSIS,
-                "code_search": ChatIntent.CODE_SEARCH,
-                "chat": ChatIntent.DEFAULT,
-            }
-            if mission_type in mapping:
+            if mission_type in _MISSION_TYPE_INTENTS:
                 intent_result = IntentResult(
-                    intent=mapping[mission_type],
+                    intent=_MISSION_TYPE_INTENTS[mission_type],
                     confidence=1.0,
                     params=intent_result.params,
                 )
@@ -206,13 +218,7 @@ class ChatOrchestrator:
 
         # 1. التوجيه الذكي للوكلاء (Smart Dispatching)
         # تشمل: استعلامات الأدمن، التحليلات، المناهج
-        is_agent_intent = intent_result.intent in (
-            ChatIntent.ADMIN_QUERY,
-            ChatIntent.ANALYTICS_REPORT,
-            ChatIntent.LEARNING_SUMMARY,
-            ChatIntent.CURRICULUM_PLAN,
-            ChatIntent.CONTENT_RETRIEVAL,
-        )
+        is_agent_intent = intent_result.intent in _AGENT_INTENTS
 
         if is_agent_intent:
             logger.info(
@@ -345,7 +351,7 @@ class ChatOrchestrator:
     @staticmethod
     async def dispatch(
         *,
-        user: User,
+        user: ChatActor,
         request: ChatDispatchRequest,
         dispatcher: ChatRoleDispatcher,
     ) -> ChatDispatchResult:
@@ -432,16 +432,14 @@ class MCPIntegrations:
             if not concept:
                 return {"success": False, "error": "مفهوم غير موجود"}
 
-            related = await client.get_related_concepts(concept.concept_id)
-            prereqs = await client.get_prerequisites(concept.concept_id)
-            next_concepts = await client.get_next_concepts(concept.concept_id)
+            neighborhood = await client.get_concept_neighborhood(concept.concept_id)
 
             return {
                 "success": True,
                 "concept": concept.name_ar,
-                "related": [c.name_ar for c in related],
-                "prerequisites": [c.name_ar for c in prereqs],
-                "leads_to": [c.name_ar for c in next_concepts],
+                "related": [c.name_ar for c in neighborhood["related"]],
+                "prerequisites": [c.name_ar for c in neighborhood["prerequisites"]],
+                "leads_to": [c.name_ar for c in neighborhood["next"]],
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
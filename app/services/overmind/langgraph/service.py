@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import cache
+
 from app.infrastructure.clients.orchestrator_client import orchestrator_client
 from app.services.overmind.domain.api_schemas import (
     LangGraphRunData,
@@ -60,3 +62,11 @@ def create_langgraph_service(db=None) -> LangGraphAgentService:
     Now returns a proxy service.
     """
     return LangGraphAgentService()
+
+
+@cache
+def get_langgraph_service() -> LangGraphAgentService:
+    """
+    يعيد نسخة مشتركة من خدمة LangGraph تُنشأ عند أول استخدام فقط.
+    """
+    return create_langgraph_service()
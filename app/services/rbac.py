@@ -168,6 +168,27 @@ class RBACService:
         )
         return {row[0] for row in result.all()}
 
+    async def user_roles_and_permissions(self, user_id: int) -> tuple[list[str], set[str]]:
+        """
+        جلب أدوار المستخدم وصلاحياته معاً باستعلام واحد لمسار المصادقة.
+        """
+
+        result = await self.session.execute(
+            select(Role.name, Permission.name)
+            .select_from(UserRole)
+            .join(Role, Role.id == UserRole.role_id)
+            .outerjoin(RolePermission, RolePermission.role_id == Role.id)
+            .outerjoin(Permission, Permission.id == RolePermission.permission_id)
+            .where(UserRole.user_id == user_id)
+        )
+        roles: dict[str, None] = {}
+        permissions: set[str] = set()
+        for role_name, permission_name in result.all():
+            roles[role_name] = None
+            if permission_name is not None:
+                permissions.add(permission_name)
+        return list(roles), permissions
+
     async def require_roles(self, user_id: int, allowed: Iterable[str]) -> None:
         roles = set(await self.user_roles(user_id))
         if not roles.intersection(set(allowed)):
@@ -30,6 +30,11 @@ class AuthPersistence:
         """يعيد المستخدم بحسب المعرف الرقمي."""
         return await self.db.get(User, user_id)
 
+    async def update_password_hash(self, user: User, password_hash: str) -> None:
+        """يحفظ تجزئة كلمة مرور مُرقّاة للمستخدم ويثبتها فوراً."""
+        user.password_hash = password_hash
+        await self.db.commit()
+
     async def create_user(
         self,
         full_name: str,
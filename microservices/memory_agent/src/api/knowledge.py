@@ -8,6 +8,7 @@ from pydantic import BaseModel
 
 from microservices.memory_agent.src.domain.concept_graph import Concept
 from microservices.memory_agent.src.schemas.knowledge_schemas import (
+    ConceptNeighborhood,
     ReadinessRequest,
     ReadinessResponse,
 )
@@ -72,6 +73,15 @@ async def get_next(
     return await service.get_next_concepts(concept_id)
 
 
+@router.get("/concepts/{concept_id}/graph", response_model=ConceptNeighborhood)
+async def get_neighborhood(
+    concept_id: str,
+    service: KnowledgeService = Depends(get_service),
+):
+    """يحصل على جوار المفهوم (المتطلبات، المرتبطة، التالية) في طلب واحد."""
+    return await service.get_concept_neighborhood(concept_id)
+
+
 class PathRequest(BaseModel):
     from_concept: str
     to_concept: str
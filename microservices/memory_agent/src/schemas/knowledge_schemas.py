@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
 
+from microservices.memory_agent.src.domain.concept_graph import Concept
+
 
 class ReadinessRequest(BaseModel):
     """طلب فحص الجاهزية."""
@@ -20,3 +22,11 @@ class ReadinessResponse(BaseModel):
     missing_prerequisites: list[str] = Field(..., description="أسماء المتطلبات المفقودة تماماً")
     weak_prerequisites: list[str] = Field(..., description="أسماء المتطلبات الضعيفة")
     recommendation: str = Field(..., description="توصية للطالب")
+
+
+class ConceptNeighborhood(BaseModel):
+    """جوار المفهوم في الرسم البياني ضمن استجابة واحدة."""
+
+    prerequisites: list[Concept] = Field(default_factory=list, description="المتطلبات السابقة")
+    related: list[Concept] = Field(default_factory=list, description="المفاهيم المرتبطة")
+    next: list[Concept] = Field(default_factory=list, description="المفاهيم التالية")
@@ -11,6 +11,7 @@ from microservices.memory_agent.src.domain.concept_graph import (
     get_concept_graph,
 )
 from microservices.memory_agent.src.schemas.knowledge_schemas import (
+    ConceptNeighborhood,
     ReadinessRequest,
     ReadinessResponse,
 )
@@ -40,6 +41,14 @@ class KnowledgeService:
         """يحصل على المفاهيم التالية."""
         return self.graph.get_next_concepts(concept_id)
 
+    async def get_concept_neighborhood(self, concept_id: str) -> ConceptNeighborhood:
+        """يحصل على المتطلبات والمفاهيم المرتبطة والتالية معًا."""
+        return ConceptNeighborhood(
+            prerequisites=self.graph.get_prerequisites(concept_id),
+            related=self.graph.get_related_concepts(concept_id),
+            next=self.graph.get_next_concepts(concept_id),
+        )
+
     async def find_concept_by_topic(self, topic: str) -> Concept | None:
         """يبحث عن مفهوم."""
         return self.graph.find_concept_by_topic(topic)
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
@@ -11,14 +12,21 @@ from microservices.orchestrator_service.src.api import routes
 from microservices.orchestrator_service.src.core.config import settings
 from microservices.orchestrator_service.src.core.database import async_session_factory, init_db
 from microservices.orchestrator_service.src.core.event_bus import event_bus
-from microservices.orchestrator_service.src.services.overmind.state import MissionStateManager
+from microservices.orchestrator_service.src.services.overmind.state import (
+    MissionStateManager,
+    set_outbox_wakeup,
+)
 from microservices.orchestrator_service.src.services.tools.registry import register_all_tools
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("orchestrator_service")
 
 
-async def _run_outbox_relay_once() -> dict[str, int]:
+# أقل فاصل بين دورتين سببهما الإيقاظ، كنسبة من فاصل الاستطلاع الدوري.
+_RELAY_WAKE_MIN_GAP_DIVISOR = 5
+
+
+async def _run_outbox_relay_once(*, fresh_only: bool = False) -> dict[str, int]:
     """ينفذ دورة relay واحدة لسجلات Outbox مع عزل جلسة قاعدة البيانات."""
 
     async with async_session_factory() as session:
@@ -27,25 +35,58 @@ async def _run_outbox_relay_once() -> dict[str, int]:
             batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
             max_failed_attempts=settings.OUTBOX_RELAY_MAX_FAILED_ATTEMPTS,
             processing_timeout_seconds=settings.OUTBOX_RELAY_PROCESSING_TIMEOUT_SECONDS,
+            fresh_only=fresh_only,
         )
 
 
+async def _wait_for_relay_signal(
+    stop_event: asyncio.Event, wake_event: asyncio.Event, timeout: float
+) -> None:
+    """ينتظر الإيقاف أو الإيقاظ أو انقضاء المهلة، أيها أسبق."""
+
+    waiters = {
+        asyncio.create_task(stop_event.wait()),
+        asyncio.create_task(wake_event.wait()),
+    }
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
 async def _outbox_relay_loop(stop_event: asyncio.Event) -> None:
-    """حلقة relay دورية قابلة للإيقاف الآمن أثناء shutdown."""
+    """حلقة relay قابلة للإيقاف الآمن؛ تستيقظ بعد تعثر نشر مباشر والفاصل الدوري احتياط.
+
+    دورات الإيقاظ متباعدة بحد أدنى ولا تعيد إلا السجلات التي لم يحاولها relay،
+    حتى لا تستنزف موجة أحداث أثناء انقطاع Redis ميزانية المحاولات.
+    """
 
     interval_seconds = max(1, int(settings.OUTBOX_RELAY_INTERVAL_SECONDS))
-    while not stop_event.is_set():
-        try:
-            summary = await _run_outbox_relay_once()
-            if summary["processed"] > 0:
-                logger.info("outbox_relay_cycle summary=%s", summary)
-        except Exception as exc:  # pragma: no cover - دفاعي تشغيلي
-            logger.error("outbox_relay_cycle_failed: %s", exc)
-
-        try:
-            await asyncio.wait_for(stop_event.wait(), timeout=interval_seconds)
-        except TimeoutError:
-            continue
+    min_wake_gap = interval_seconds / _RELAY_WAKE_MIN_GAP_DIVISOR
+    wake_event = asyncio.Event()
+    set_outbox_wakeup(wake_event)
+    fresh_only = False
+    try:
+        while not stop_event.is_set():
+            wake_event.clear()
+            started_at = time.monotonic()
+            try:
+                summary = await _run_outbox_relay_once(fresh_only=fresh_only)
+                if summary["processed"] > 0:
+                    logger.info("outbox_relay_cycle summary=%s", summary)
+            except Exception as exc:  # pragma: no cover - دفاعي تشغيلي
+                logger.error("outbox_relay_cycle_failed: %s", exc)
+
+            await _wait_for_relay_signal(stop_event, wake_event, interval_seconds)
+            fresh_only = wake_event.is_set()
+            if fresh_only:
+                remaining_gap = min_wake_gap - (time.monotonic() - started_at)
+                if remaining_gap > 0:
+                    with suppress(TimeoutError):
+                        await asyncio.wait_for(stop_event.wait(), timeout=remaining_gap)
+    finally:
+        set_outbox_wakeup(None)
 
 
 @asynccontextmanager
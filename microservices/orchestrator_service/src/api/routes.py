@@ -1,8 +1,12 @@
+import functools
 import logging
 import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TypedDict
 
 import jwt
+import orjson
 from fastapi import (
     APIRouter,
     BackgroundTasks,
@@ -27,8 +31,9 @@ from microservices.orchestrator_service.src.core.security import (
     decode_user_id,
     extract_bearer_token,
     extract_websocket_auth,
+    negotiates_batch_protocol,
 )
-from microservices.orchestrator_service.src.models.mission import Mission
+from microservices.orchestrator_service.src.models.mission import Mission, MissionEventType
 from microservices.orchestrator_service.src.services.llm.client import get_ai_client
 from microservices.orchestrator_service.src.services.overmind.agents.orchestrator import (
     OrchestratorAgent,
@@ -48,6 +53,8 @@ logger = logging.getLogger(__name__)
 
 type JsonObject = dict[str, object]
 
+_TERMINAL_MISSION_EVENTS = frozenset({"mission_completed", "mission_failed"})
+
 
 class ChatRunContext(TypedDict, total=False):
     """غلاف سياقي محدود لمسار تشغيل الدردشة لتجنّب القواميس المفتوحة في الحدود الحرجة."""
@@ -62,6 +69,24 @@ class MissionEventEnvelope(TypedDict):
     data: dict[str, object]
 
 
+async def _send_json_fast(websocket: WebSocket, data: object) -> None:
+    """يرمّز الحدث عبر `orjson` ويرسله كإطار نصي بدلاً من `json.dumps` القياسي."""
+    await websocket.send_text(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode())
+
+
+@functools.cache
+def _ws_secret_key() -> str:
+    """يحل المفتاح السري لمصافحات WebSocket مرة واحدة طوال عمر العملية."""
+    return get_settings().SECRET_KEY
+
+
+def _mission_event_type_name(event_type: object) -> str:
+    """يحوّل نوع حدث مخزن إلى اسمه النصي بفحص هوية النوع بدلاً من `hasattr`."""
+    if type(event_type) is MissionEventType:
+        return event_type.value
+    return str(event_type)
+
+
 def _canonicalize_mission_event(event: object) -> MissionEventEnvelope | None:
     """يوحّد أشكال الحدث التاريخية إلى غلاف داخلي ثابت مع توافق رجعي عند الحافة."""
 
@@ -479,7 +504,7 @@ async def _stream_chat_langgraph(
                 response_text = str(final_resp or "لا توجد تفاصيل متاحة.")
 
             final_content = response_text
-            logger.info(f"FINAL RESPONSE → {response_text[:100]}")
+            logger.info("FINAL RESPONSE → %.100s", response_text)
             await websocket.send_json(
                 {
                     "type": "assistant_final",
@@ -564,9 +589,9 @@ async def _stream_chat_langgraph(
                 }
             )
         else:
-            await websocket.send_json(evt)
+            await _send_json_fast(websocket, evt)
 
-    await websocket.send_json({"type": "complete", "payload": {}})
+    await _send_json_fast(websocket, {"type": "complete", "payload": {}})
 
     if final_content.strip():
         await _persist_assistant_message(
@@ -651,7 +676,7 @@ async def chat_ws_stategraph(websocket: WebSocket) -> None:
         return
 
     try:
-        user_id = decode_user_id(token, get_settings().SECRET_KEY)
+        user_id = decode_user_id(token, _ws_secret_key())
     except HTTPException:
         await websocket.close(code=4401)
         return
@@ -675,7 +700,7 @@ async def chat_ws_stategraph(websocket: WebSocket) -> None:
                 requested_conversation_id if isinstance(requested_conversation_id, int) else None
             )
             try:
-                logger.info(f"ORCHESTRATOR received | chat_scope=customer | role={user_id}")
+                logger.info("ORCHESTRATOR received | chat_scope=customer | role=%s", user_id)
                 conversation_id = await _ensure_conversation(
                     chat_scope="customer",
                     user_id=user_id,
@@ -734,8 +759,9 @@ async def admin_chat_ws_stategraph(websocket: WebSocket) -> None:
         return
 
     try:
-        auth_payload = jwt.decode(token, get_settings().SECRET_KEY, algorithms=["HS256"])
-        user_id = decode_user_id(token, get_settings().SECRET_KEY)
+        secret_key = _ws_secret_key()
+        auth_payload = jwt.decode(token, secret_key, algorithms=["HS256"])
+        user_id = decode_user_id(token, secret_key)
     except (HTTPException, jwt.PyJWTError):
         await websocket.close(code=4401)
         return
@@ -763,7 +789,7 @@ async def admin_chat_ws_stategraph(websocket: WebSocket) -> None:
                 requested_conversation_id if isinstance(requested_conversation_id, int) else None
             )
             try:
-                logger.info(f"ORCHESTRATOR received | chat_scope=admin | role={user_id}")
+                logger.info("ORCHESTRATOR received | chat_scope=admin | role=%s", user_id)
                 conversation_id = await _ensure_conversation(
                     chat_scope="admin",
                     user_id=user_id,
@@ -814,10 +840,19 @@ async def admin_chat_ws_stategraph(websocket: WebSocket) -> None:
         logger.info("Admin chat websocket disconnected")
 
 
-def _get_mission_status_payload(status: str) -> dict[str, str | None]:
+@functools.lru_cache(maxsize=16)
+def _get_mission_status_payload(status: str) -> Mapping[str, str | None]:
+    """يحوّل حالة المهمة إلى حمولة عامة ثابتة تُخزَّن لكل قيمة حالة محدودة."""
     if status == "partial_success":
-        return {"status": "success", "outcome": "partial_success"}
-    return {"status": status, "outcome": None}
+        return MappingProxyType({"status": "success", "outcome": "partial_success"})
+    return MappingProxyType({"status": status, "outcome": None})
+
+
+@functools.lru_cache(maxsize=16)
+def _mission_status_frame(status: str) -> str:
+    """يسلسل إطار `mission_status` مرة واحدة لكل حالة ليُرسل كنص جاهز."""
+    payload = dict(_get_mission_status_payload(status))
+    return orjson.dumps({"type": "mission_status", "payload": payload}).decode()
 
 
 def _serialize_mission(mission: Mission) -> MissionResponse:
@@ -840,7 +875,7 @@ async def chat_with_agent_endpoint(request: ChatRequest, fastapi_req: Request) -
     Direct chat endpoint for the Orchestrator Agent (Microservice).
     Streams the response chunk by chunk.
     """
-    logger.info(f"Agent Chat Request: {request.question[:50]}... User: {request.user_id}")
+    logger.info("Agent Chat Request: %.50s... User: %s", request.question, request.user_id)
 
     # Prepare context
     context = request.context.copy()
@@ -914,7 +949,7 @@ async def create_mission_endpoint(
     db: AsyncSession = Depends(get_db),
 ) -> MissionResponse:
     correlation_id = req.headers.get("X-Correlation-ID") or str(uuid.uuid4())
-    logger.info(f"Orchestrator: Creating mission with Correlation ID: {correlation_id}")
+    logger.info("Orchestrator: Creating mission with Correlation ID: %s", correlation_id)
 
     try:
         mission = await start_mission(
@@ -992,11 +1027,12 @@ async def stream_mission_ws(
         return
 
     try:
-        decode_user_id(token, get_settings().SECRET_KEY)
+        decode_user_id(token, _ws_secret_key())
     except HTTPException:
         await websocket.close(code=4401)
         return
 
+    batched = negotiates_batch_protocol(websocket)
     await websocket.accept(subprotocol=selected_protocol)
 
     event_bus = get_event_bus()
@@ -1005,62 +1041,67 @@ async def stream_mission_ws(
     # We need a subscription iterator
     subscription = event_bus.subscribe(channel)
 
-    try:
-        async with async_session_factory() as session:
-            state_manager = MissionStateManager(session)
-            mission = await state_manager.get_mission(mission_id)
+    async with async_session_factory() as session:
+        # جلسة واحدة تعيش طوال الاتصال ويُعاد استخدامها لجلب الحالة النهائية.
+        state_manager = MissionStateManager(session)
+        try:
+            mission, events = await state_manager.get_mission_with_events(mission_id)
             if not mission:
                 await websocket.close(code=4004)
                 return
 
-            status_payload = _get_mission_status_payload(mission.status.value)
-            await websocket.send_json({"type": "mission_status", "payload": status_payload})
+            await websocket.send_text(_mission_status_frame(mission.status.value))
 
-            events = await state_manager.get_mission_events(mission_id)
-            for evt in events:
-                evt_type = (
-                    evt.event_type.value
-                    if hasattr(evt.event_type, "value")
-                    else str(evt.event_type)
-                )
-                payload = evt.payload_json or {}
-                await websocket.send_json(
-                    {"type": "mission_event", "payload": {"event_type": evt_type, "data": payload}}
+            history = [
+                {
+                    "event_type": _mission_event_type_name(evt.event_type),
+                    "data": evt.payload_json or {},
+                }
+                for evt in events
+            ]
+            if batched:
+                # العملاء المتفاوضون على الدفعات يستلمون السجل كاملاً في إطار واحد.
+                await _send_json_fast(
+                    websocket, {"type": "mission_event_snapshot", "payload": {"events": history}}
                 )
+            else:
+                for entry in history:
+                    await _send_json_fast(websocket, {"type": "mission_event", "payload": entry})
 
-    except Exception as e:
-        logger.error(f"WS Init Error: {e}")
-        await websocket.close(code=1011)
-        return
+            # إنهاء معاملة القراءة يعيد الاتصال إلى المجمع طوال انتظار الأحداث الحية.
+            await session.rollback()
 
-    try:
-        async for event in subscription:
-            canonical_event = _canonicalize_mission_event(event)
-            if canonical_event is None:
-                continue
+        except Exception as e:
+            logger.error("WS Init Error: %s", e)
+            await websocket.close(code=1011)
+            return
 
-            await websocket.send_json({"type": "mission_event", "payload": canonical_event})
+        try:
+            async for event in subscription:
+                canonical_event = _canonicalize_mission_event(event)
+                if canonical_event is None:
+                    continue
 
-            if canonical_event["event_type"] in ("mission_completed", "mission_failed"):
-                # Fetch final status
-                async with async_session_factory() as final_session:
-                    sm = MissionStateManager(final_session)
-                    m = await sm.get_mission(mission_id)
-                    if m:
-                        status_p = _get_mission_status_payload(m.status.value)
-                        await websocket.send_json({"type": "mission_status", "payload": status_p})
-                break
+                await _send_json_fast(
+                    websocket, {"type": "mission_event", "payload": canonical_event}
+                )
 
-    except WebSocketDisconnect:
-        logger.info(f"WS Disconnected: {mission_id}")
-    except Exception as e:
-        logger.error(f"WS Loop Error: {e}")
-    finally:
-        await websocket.close()
-        # Subscription is a generator, we just break loop to stop it,
-        # but cleanup of redis pubsub happens in generator finally block if we break?
-        # Python async generators support cleanup on garbage collection or aclose()
-        # Ideally we should use `async with` on the generator if it supported it, or manually close.
-        # My implementation of subscribe uses try/finally. If we break, `finally` runs?
-        # Yes, if we stop iterating, the generator is closed.
-        pass
+                if canonical_event["event_type"] in _TERMINAL_MISSION_EVENTS:
+                    final_status = await state_manager.get_mission_status(mission_id)
+                    if final_status:
+                        await websocket.send_text(_mission_status_frame(final_status.value))
+                    break
+
+        except WebSocketDisconnect:
+            logger.info("WS Disconnected: %s", mission_id)
+        except Exception as e:
+            logger.error("WS Loop Error: %s", e)
+        finally:
+            await websocket.close()
+            # Subscription is a generator, we just break loop to stop it,
+            # but cleanup of redis pubsub happens in generator finally block if we break?
+            # Python async generators support cleanup on garbage collection or aclose()
+            # Ideally we should use `async with` on the generator if it supported it, or manually close.
+            # My implementation of subscribe uses try/finally. If we break, `finally` runs?
+            # Yes, if we stop iterating, the generator is closed.
+            pass
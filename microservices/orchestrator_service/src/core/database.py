@@ -9,7 +9,10 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from microservices.orchestrator_service.src.core.config import settings
-from microservices.orchestrator_service.src.models.mission import OrchestratorSQLModel
+from microservices.orchestrator_service.src.models.mission import (
+    MissionOutbox,
+    OrchestratorSQLModel,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,9 @@ async def init_db() -> None:
         # We rely on main.py importing them.
         async with engine.begin() as conn:
             await conn.run_sync(OrchestratorSQLModel.metadata.create_all)
+            # create_all لا يضيف فهارس جديدة لجداول قائمة؛ نضمن فهرس relay الجزئي صراحةً.
+            for index in MissionOutbox.__table__.indexes:
+                await conn.run_sync(index.create, checkfirst=True)
         logger.info("Database initialized successfully.")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
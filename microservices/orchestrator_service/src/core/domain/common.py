@@ -32,12 +32,11 @@ class CaseInsensitiveEnum(enum.StrEnum):
     @classmethod
     def _missing_(cls, value: object) -> object:
         if isinstance(value, str):
-            upper_value = value.upper()
-            if upper_value in cls.__members__:
-                return cls[upper_value]
-            for member in cls:
-                if member.value == value.lower():
-                    return member
+            member = cls.__members__.get(value.upper())
+            if member is not None:
+                return member
+            # خريطة القيم المبنية مع الصنف تغني عن المسح الخطي للأعضاء.
+            return cls._value2member_map_.get(value.lower())
         return None
 
 
@@ -1,5 +1,7 @@
-import json
 import logging
+from collections.abc import Sequence
+
+import orjson
 
 import redis.asyncio as redis
 from microservices.orchestrator_service.src.core.config import settings
@@ -7,17 +9,42 @@ from microservices.orchestrator_service.src.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+def encode_event_message(message: dict[str, object]) -> bytes:
+    """يرمّز رسالة الحدث عبر orjson؛ المفاتيح غير النصية تُحوَّل كما في json.dumps."""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+
+
 class EventBus:
     def __init__(self):
         self.redis = redis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
 
     async def publish(self, channel: str, message: dict[str, object]) -> None:
         try:
-            await self.redis.publish(channel, json.dumps(message))
+            await self.redis.publish(channel, encode_event_message(message))
         except Exception as e:
             logger.error(f"Failed to publish to {channel}: {e}")
             raise
 
+    async def publish_many(
+        self, messages: Sequence[tuple[str, dict[str, object]]]
+    ) -> list[Exception | None]:
+        """
+        ينشر دفعة رسائل في جولة شبكة واحدة عبر pipeline غير معاملاتي.
+
+        يعيد لكل رسالة None عند النجاح أو الاستثناء الخاص بها، بالترتيب نفسه.
+        """
+        if not messages:
+            return []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for channel, message in messages:
+                pipe.publish(channel, encode_event_message(message))
+            try:
+                replies = await pipe.execute(raise_on_error=False)
+            except Exception as e:
+                logger.error(f"Failed to publish batch of {len(messages)} messages: {e}")
+                return [e] * len(messages)
+        return [reply if isinstance(reply, Exception) else None for reply in replies]
+
     async def subscribe(self, channel: str):
         """
         Yields messages from a channel.
@@ -29,8 +56,8 @@ class EventBus:
             async for message in pubsub.listen():
                 if message["type"] == "message":
                     try:
-                        yield json.loads(message["data"])
-                    except json.JSONDecodeError:
+                        yield orjson.loads(message["data"])
+                    except orjson.JSONDecodeError:
                         yield message["data"]
         finally:
             await pubsub.unsubscribe(channel)
@@ -2,6 +2,7 @@ import jwt
 from fastapi import HTTPException, WebSocket
 
 ALGORITHM = "HS256"
+BATCH_PROTOCOL = "batch-v1"
 
 
 def extract_bearer_token(auth_header: str | None) -> str:
@@ -61,3 +62,8 @@ def extract_websocket_auth(websocket: WebSocket) -> tuple[str | None, str | None
     # Simplify: Allow query param in dev only or if not strict
     # In microservice context, assuming strict security is handled by Gateway but WS might bypass
     return fallback_token, None
+
+
+def negotiates_batch_protocol(websocket: WebSocket) -> bool:
+    protocols = _parse_protocol_header(websocket.headers.get("sec-websocket-protocol"))
+    return BATCH_PROTOCOL in protocols
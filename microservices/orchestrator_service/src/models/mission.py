@@ -6,16 +6,16 @@ Decoupled from User Service.
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum, StrEnum
 
-from sqlalchemy import Column, DateTime, MetaData, Text, func
+from sqlalchemy import Column, DateTime, Index, MetaData, Text, func, text
 from sqlalchemy.orm import relationship
 from sqlmodel import Field, Relationship, SQLModel
 
 
-def utc_now():
-    return datetime.utcnow()
+def utc_now() -> datetime:
+    return datetime.now(UTC)
 
 
 class FlexibleEnum(Enum):
@@ -260,6 +260,15 @@ class MicroMissionOutbox(OrchestratorSQLModel, table=True):
     """
 
     __tablename__ = "mission_outbox"
+    __table_args__ = (
+        # فهرس جزئي يحوي السجلات غير المنشورة فقط بترتيب id كما يقرؤها relay.
+        Index(
+            "ix_mission_outbox_relay_pending",
+            "id",
+            postgresql_where=text("status IN ('pending', 'failed', 'processing')"),
+            sqlite_where=text("status IN ('pending', 'failed', 'processing')"),
+        ),
+    )
     id: int | None = Field(default=None, primary_key=True)
     mission_id: int = Field(index=True)
     event_type: str = Field(index=True)
@@ -4,7 +4,7 @@
 # Version: 11.2.0-pacelc-gapless
 # =================================================================================================
 
-import json
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
@@ -13,7 +13,10 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from microservices.orchestrator_service.src.core.event_bus import get_event_bus
+from microservices.orchestrator_service.src.core.event_bus import (
+    encode_event_message,
+    get_event_bus,
+)
 from microservices.orchestrator_service.src.core.protocols import EventBusProtocol
 from microservices.orchestrator_service.src.models.mission import (
     Mission,
@@ -38,6 +41,23 @@ def utc_now() -> datetime:
     return datetime.now(UTC)
 
 
+_outbox_wakeup: asyncio.Event | None = None
+
+
+def set_outbox_wakeup(event: asyncio.Event | None) -> None:
+    """يسجّل حدث إيقاظ حلقة relay الحالية (أو يلغيه عند None)."""
+
+    global _outbox_wakeup
+    _outbox_wakeup = event
+
+
+def notify_outbox_pending() -> None:
+    """يوقظ حلقة relay فورًا عند وجود سجل outbox ينتظر إعادة النشر."""
+
+    if _outbox_wakeup is not None:
+        _outbox_wakeup.set()
+
+
 class MissionStateManager:
     """
     يدير الحالة الدائمة للمهام والخطط داخل نواة الواقع.
@@ -66,7 +86,7 @@ class MissionStateManager:
             "payload_json": payload,
             "created_at": created_at.isoformat(),
         }
-        json.dumps(message)
+        encode_event_message(message)
         return message
 
     async def _load_relay_candidates(self, *, batch_size: int) -> list[MissionOutbox]:
@@ -148,8 +168,14 @@ class MissionStateManager:
         batch_size: int = 50,
         max_failed_attempts: int = 3,
         processing_timeout_seconds: int = 300,
+        fresh_only: bool = False,
     ) -> dict[str, int]:
-        """يعيد نشر سجلات outbox المتعثرة/المعلقة مع حالات معالجة واضحة."""
+        """يعيد نشر سجلات outbox المتعثرة/المعلقة مع حالات معالجة واضحة.
+
+        مع `fresh_only` (دورات الإيقاظ) تُعالج فقط السجلات التي لم يحاولها relay بعد،
+        فلا تستهلك موجة إيقاظات أثناء انقطاع Redis ميزانية إعادة المحاولة؛
+        إعادة محاولة السجلات الفاشلة تبقى للدورات الدورية.
+        """
 
         now = utc_now()
         candidates = await self._load_relay_candidates(batch_size=batch_size)
@@ -157,6 +183,7 @@ class MissionStateManager:
         published = 0
         failed = 0
         skipped = 0
+        ready: list[tuple[MissionOutbox, int, dict[str, JsonValue], dict[str, object]]] = []
 
         for outbox in candidates:
             current_attempt = self._relay_attempt(outbox)
@@ -170,6 +197,16 @@ class MissionStateManager:
                 )
                 continue
 
+            if fresh_only and current_attempt > 0:
+                skipped += 1
+                logger.info(
+                    "outbox_relay_skipped id=%s mission_id=%s attempt=%s reason=awaiting_interval",
+                    outbox.id,
+                    outbox.mission_id,
+                    current_attempt,
+                )
+                continue
+
             if not self._is_processing_stale(
                 outbox,
                 processing_timeout_seconds=processing_timeout_seconds,
@@ -184,9 +221,6 @@ class MissionStateManager:
                 )
                 continue
 
-            outbox.status = "processing"
-            await self.session.commit()
-
             next_attempt = current_attempt + 1
             payload = self._business_payload(outbox)
             message = {
@@ -196,33 +230,31 @@ class MissionStateManager:
                 "created_at": outbox.created_at.isoformat(),
             }
 
-            error_kind = "publish_error"
             try:
-                json.dumps(message)
+                encode_event_message(message)
             except TypeError as exc:
-                error_kind = "serialization_error"
-                payload_with_meta = dict(payload)
-                payload_with_meta["__relay"] = {
-                    "attempt": next_attempt,
-                    "last_error": str(exc),
-                    "last_error_kind": error_kind,
-                    "last_attempt_at": utc_now().isoformat(),
-                }
-                outbox.payload_json = payload_with_meta
-                await self._set_outbox_status(outbox, status="failed")
+                self._mark_relay_failed(
+                    outbox, payload, attempt=next_attempt, error=exc, kind="serialization_error"
+                )
                 failed += 1
                 processed += 1
-                logger.warning(
-                    "outbox_relay_failed id=%s mission_id=%s reason=%s",
-                    outbox.id,
-                    outbox.mission_id,
-                    error_kind,
-                )
                 continue
 
-            try:
-                await self.event_bus.publish(f"mission:{outbox.mission_id}", message)
-                await self._set_outbox_status(outbox, status="published", published_at=utc_now())
+            outbox.status = "processing"
+            ready.append((outbox, next_attempt, payload, message))
+
+        if ready or processed:
+            # تثبيت حالة processing للدفعة كلها في commit واحد قبل النشر لحماية الاستعادة.
+            await self.session.commit()
+
+        errors = await self._publish_relay_batch(
+            [(f"mission:{outbox.mission_id}", message) for outbox, _, _, message in ready]
+        )
+        published_at = utc_now()
+        for (outbox, next_attempt, payload, _), error in zip(ready, errors, strict=True):
+            if error is None:
+                outbox.status = "published"
+                outbox.published_at = published_at
                 published += 1
                 logger.info(
                     "outbox_relay_published id=%s mission_id=%s attempt=%s",
@@ -230,26 +262,16 @@ class MissionStateManager:
                     outbox.mission_id,
                     next_attempt,
                 )
-            except Exception as exc:
-                payload_with_meta = dict(payload)
-                payload_with_meta["__relay"] = {
-                    "attempt": next_attempt,
-                    "last_error": str(exc),
-                    "last_error_kind": error_kind,
-                    "last_attempt_at": utc_now().isoformat(),
-                }
-                outbox.payload_json = payload_with_meta
-                await self._set_outbox_status(outbox, status="failed")
-                failed += 1
-                logger.warning(
-                    "outbox_relay_failed id=%s mission_id=%s reason=%s",
-                    outbox.id,
-                    outbox.mission_id,
-                    error_kind,
+            else:
+                self._mark_relay_failed(
+                    outbox, payload, attempt=next_attempt, error=error, kind="publish_error"
                 )
-
+                failed += 1
             processed += 1
 
+        if ready:
+            await self.session.commit()
+
         return {
             "processed": processed,
             "published": published,
@@ -257,6 +279,52 @@ class MissionStateManager:
             "skipped": skipped,
         }
 
+    def _mark_relay_failed(
+        self,
+        outbox: MissionOutbox,
+        payload: dict[str, JsonValue],
+        *,
+        attempt: int,
+        error: Exception,
+        kind: str,
+    ) -> None:
+        """يسجل فشل محاولة relay داخل الحمولة دون commit؛ يثبّته المستدعي مع بقية الدفعة."""
+
+        payload_with_meta = dict(payload)
+        payload_with_meta["__relay"] = {
+            "attempt": attempt,
+            "last_error": str(error),
+            "last_error_kind": kind,
+            "last_attempt_at": utc_now().isoformat(),
+        }
+        outbox.payload_json = payload_with_meta
+        outbox.status = "failed"
+        outbox.published_at = None
+        logger.warning(
+            "outbox_relay_failed id=%s mission_id=%s reason=%s",
+            outbox.id,
+            outbox.mission_id,
+            kind,
+        )
+
+    async def _publish_relay_batch(
+        self, messages: list[tuple[str, dict[str, object]]]
+    ) -> list[Exception | None]:
+        """ينشر دفعة relay دفعة واحدة إن دعم الناقل ذلك، وإلا رسالةً رسالة."""
+
+        publish_many = getattr(self.event_bus, "publish_many", None)
+        if publish_many is not None:
+            return await publish_many(messages)
+
+        errors: list[Exception | None] = []
+        for channel, message in messages:
+            try:
+                await self.event_bus.publish(channel, message)
+                errors.append(None)
+            except Exception as exc:
+                errors.append(exc)
+        return errors
+
     async def get_outbox_operational_snapshot(self) -> dict[str, int | str | None]:
         """يعيد ملخصًا تشغيليًا لحالة outbox لدعم المراقبة واتخاذ القرار."""
 
@@ -453,9 +521,8 @@ class MissionStateManager:
         await self.session.commit()
 
         # 4. Broadcast immediately (Best effort)
-        # Ideally, a background worker polls 'mission_outbox' where status='pending'.
-        # For simplicity and latency, we try direct publish.
-        # If this fails, the 'monitor_mission_events' (catch-up) mechanism still works via DB polling.
+        # For latency, we try direct publish. On failure the relay loop is woken immediately
+        # instead of waiting for its next polling interval.
         message = self._build_event_bus_message(
             mission_id=mission_id,
             event_type=event_type,
@@ -468,6 +535,7 @@ class MissionStateManager:
         except Exception as e:
             await self._set_outbox_status(outbox, status="failed")
             logger.warning(f"Failed to publish event to Redis: {e}. Outbox record ID: {outbox.id}")
+            notify_outbox_pending()
 
     async def _set_outbox_status(
         self,
@@ -492,6 +560,36 @@ class MissionStateManager:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_mission_with_events(
+        self, mission_id: int
+    ) -> tuple[Mission | None, list[MissionEvent]]:
+        """
+        Fetch a mission and its historical events in a single round-trip.
+
+        Used by the mission WebSocket handshake, which only needs the status and
+        the event history, so plans and tasks are not loaded.
+        """
+        stmt = (
+            select(Mission, MissionEvent)
+            .outerjoin(MissionEvent, MissionEvent.mission_id == Mission.id)
+            .where(Mission.id == mission_id)
+            .order_by(MissionEvent.id.asc())
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            return None, []
+        return rows[0][0], [event for _, event in rows if event is not None]
+
+    async def get_mission_status(self, mission_id: int) -> MissionStatus | None:
+        """
+        Fetch only the current status column of a mission.
+
+        Reads the column directly so a long-lived session returns the fresh value
+        instead of a stale attribute from its identity map.
+        """
+        stmt = select(Mission.status).where(Mission.id == mission_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
     async def persist_plan(
         self,
         mission_id: int,
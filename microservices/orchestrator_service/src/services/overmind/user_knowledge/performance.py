@@ -8,7 +8,7 @@
 - Analytics: تحليلات متقدمة
 """
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -106,7 +106,7 @@ async def _calculate_weekly_missions(
     حساب المهام في الأسبوع الماضي.
     Calculate missions in the past week.
     """
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
+    seven_days_ago = datetime.now(UTC) - timedelta(days=7)
 
     recent_missions_query = select(func.count(Mission.id)).where(
         and_(Mission.initiator_id == user_id, Mission.created_at >= seven_days_ago)
@@ -1,5 +1,6 @@
 """Comprehensive tests for Admin router."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,12 +10,17 @@ from fastapi.testclient import TestClient
 from app.api.routers.admin import (
     get_ai_client,
     get_chat_dispatcher,
-    get_current_user_id,
+    get_current_user,
     get_db,
     get_session_factory,
     router,
 )
 from app.core.domain.user import User
+from app.deps.auth import CurrentUser
+
+
+def _current_user(user_id: int) -> CurrentUser:
+    return CurrentUser(user=SimpleNamespace(id=user_id), roles=[], permissions=set())
 
 
 @pytest.fixture
@@ -36,7 +42,7 @@ def mock_db():
 
 def test_get_actor_user_not_found(client, mock_db):
     client.app.dependency_overrides[get_db] = lambda: mock_db
-    client.app.dependency_overrides[get_current_user_id] = lambda: 999
+    client.app.dependency_overrides[get_current_user] = lambda: _current_user(999)
     mock_db.get.return_value = None
 
     response = client.get("/admin/api/chat/latest")
@@ -46,7 +52,7 @@ def test_get_actor_user_not_found(client, mock_db):
 
 def test_get_actor_user_inactive(client, mock_db):
     client.app.dependency_overrides[get_db] = lambda: mock_db
-    client.app.dependency_overrides[get_current_user_id] = lambda: 1
+    client.app.dependency_overrides[get_current_user] = lambda: _current_user(1)
 
     user = MagicMock(spec=User)
     user.is_active = False
@@ -59,7 +65,7 @@ def test_get_actor_user_inactive(client, mock_db):
 
 def test_get_latest_chat_not_admin(client, mock_db):
     client.app.dependency_overrides[get_db] = lambda: mock_db
-    client.app.dependency_overrides[get_current_user_id] = lambda: 1
+    client.app.dependency_overrides[get_current_user] = lambda: _current_user(1)
 
     user = MagicMock(spec=User)
     user.is_active = True
@@ -74,14 +80,18 @@ def test_get_latest_chat_not_admin(client, mock_db):
     assert "Admin access required" in response.json()["detail"]
 
 
+def _ws_db(*, is_admin: bool) -> AsyncMock:
+    """جلسة وهمية تعيد صف الإسقاط الخفيف لمستخدم المصافحة."""
+    result = MagicMock()
+    result.one_or_none.return_value = SimpleNamespace(id=1, is_active=True, is_admin=is_admin)
+    mock_db = AsyncMock()
+    mock_db.execute.return_value = result
+    return mock_db
+
+
 def test_chat_stream_ws_not_admin(app):
     client = TestClient(app)
-    mock_actor = MagicMock(spec=User)
-    mock_actor.is_active = True
-    mock_actor.is_admin = False
-
-    mock_db = AsyncMock()
-    mock_db.get.return_value = mock_actor
+    mock_db = _ws_db(is_admin=False)
 
     app.dependency_overrides[get_db] = lambda: mock_db
     # Mock extract_websocket_auth to return a token
@@ -97,12 +107,7 @@ def test_chat_stream_ws_not_admin(app):
 
 def test_chat_stream_ws_empty_question(app):
     client = TestClient(app)
-    mock_actor = MagicMock(spec=User)
-    mock_actor.is_active = True
-    mock_actor.is_admin = True
-
-    mock_db = AsyncMock()
-    mock_db.get.return_value = mock_actor
+    mock_db = _ws_db(is_admin=True)
 
     app.dependency_overrides[get_db] = lambda: mock_db
     with patch(
@@ -116,14 +121,27 @@ def test_chat_stream_ws_empty_question(app):
                 assert "Question is required" in data["payload"]["details"]
 
 
-def test_chat_stream_ws_orchestrator_error(app):
+def test_chat_stream_ws_rejects_malformed_message_and_stays_open(app):
     client = TestClient(app)
-    mock_actor = MagicMock(spec=User)
-    mock_actor.is_active = True
-    mock_actor.is_admin = True
+    mock_db = _ws_db(is_admin=True)
 
-    mock_db = AsyncMock()
-    mock_db.get.return_value = mock_actor
+    app.dependency_overrides[get_db] = lambda: mock_db
+    with patch(
+        "app.api.routers.admin.extract_websocket_auth", return_value=("valid_token", "json")
+    ):
+        with patch("app.api.routers.admin.decode_user_id", return_value=1):
+            with client.websocket_connect("/admin/api/chat/ws") as websocket:
+                websocket.send_text("not-json")
+                assert websocket.receive_json()["payload"]["details"] == "Invalid message."
+
+                websocket.send_json({"question": "   ", "extra": True})
+                data = websocket.receive_json()
+                assert "Question is required" in data["payload"]["details"]
+
+
+def test_chat_stream_ws_orchestrator_error(app):
+    client = TestClient(app)
+    mock_db = _ws_db(is_admin=True)
 
     app.dependency_overrides[get_db] = lambda: mock_db
 
@@ -147,3 +165,98 @@ def test_chat_stream_ws_orchestrator_error(app):
                     data = websocket.receive_json()
                     assert data["type"] == "error"
                     assert "Orchestrator error" in data["payload"]["details"]
+
+
+def test_chat_stream_ws_processes_pipelined_questions_in_order(app):
+    from app.services.chat.contracts import ChatDispatchResult
+
+    client = TestClient(app)
+    mock_db = _ws_db(is_admin=True)
+
+    app.dependency_overrides[get_db] = lambda: mock_db
+
+    def mock_dependency_factory():
+        return MagicMock()
+
+    app.dependency_overrides[get_ai_client] = mock_dependency_factory
+    app.dependency_overrides[get_chat_dispatcher] = mock_dependency_factory
+    app.dependency_overrides[get_session_factory] = lambda: AsyncMock
+
+    async def _dispatch(*, user, request, dispatcher):
+        async def _stream():
+            yield {"type": "delta", "payload": {"content": request.question}}
+
+        return ChatDispatchResult(status_code=200, stream=_stream())
+
+    with patch(
+        "app.api.routers.admin.extract_websocket_auth", return_value=("valid_token", "json")
+    ):
+        with patch("app.api.routers.admin.decode_user_id", return_value=1):
+            with patch(
+                "app.services.chat.orchestrator.ChatOrchestrator.dispatch", side_effect=_dispatch
+            ):
+                with client.websocket_connect("/admin/api/chat/ws") as websocket:
+                    websocket.send_json({"question": "first"})
+                    websocket.send_json({"question": "second"})
+                    frames = [websocket.receive_json() for _ in range(4)]
+
+    contents = [frame["payload"]["content"] for frame in frames if frame["type"] == "delta"]
+    assert contents == ["first", "second"]
+
+
+def test_get_actor_user_loads_user_once(client, mock_db):
+    client.app.dependency_overrides[get_db] = lambda: mock_db
+    client.app.dependency_overrides[get_current_user] = lambda: _current_user(1)
+
+    user = MagicMock(spec=User)
+    user.is_active = True
+    user.is_admin = False
+    mock_db.get.return_value = user
+    mock_db.expunge = MagicMock()
+
+    response = client.get("/admin/api/chat/latest")
+
+    assert response.status_code == 403
+    mock_db.get.assert_awaited_once_with(User, 1)
+    mock_db.refresh.assert_not_awaited()
+    mock_db.expunge.assert_called_once_with(user)
+
+
+def test_chat_stream_ws_admin_with_empty_roles_claim_is_accepted(app):
+    """مطالبة أدوار فارغة في رمز مسؤول لا تحسم الصلاحية؛ الحسم لقاعدة البيانات."""
+    import jwt
+
+    from app.services.auth.token_decoder import ALGORITHM
+
+    secret = "admin-ws-empty-roles-secret-for-tests"
+    token = jwt.encode({"sub": "1", "roles": []}, secret, algorithm=ALGORITHM)
+    client = TestClient(app)
+    mock_db = _ws_db(is_admin=True)
+    app.dependency_overrides[get_db] = lambda: mock_db
+
+    with patch("app.api.routers.admin.extract_websocket_auth", return_value=(token, "json")):
+        with patch("app.api.routers.admin.ws_secret_key", return_value=secret):
+            with client.websocket_connect("/admin/api/chat/ws") as websocket:
+                websocket.send_json({"question": ""})
+                data = websocket.receive_json()
+                assert "Question is required" in data["payload"]["details"]
+
+    mock_db.execute.assert_awaited_once()
+
+
+def test_chat_stream_ws_loads_projected_actor_without_orm_get(app):
+    client = TestClient(app)
+    mock_db = _ws_db(is_admin=True)
+    app.dependency_overrides[get_db] = lambda: mock_db
+
+    with patch(
+        "app.api.routers.admin.extract_websocket_auth", return_value=("valid_token", "json")
+    ):
+        with patch("app.api.routers.admin.decode_user_id", return_value=1):
+            with client.websocket_connect("/admin/api/chat/ws") as websocket:
+                websocket.send_json({"question": ""})
+                websocket.receive_json()
+
+    mock_db.execute.assert_awaited_once()
+    mock_db.get.assert_not_awaited()
+    mock_db.expunge.assert_not_called()
@@ -63,9 +63,12 @@ def local_admin_user(db_session: AsyncSession, event_loop):
 def client(test_app, local_admin_user, event_loop):
     """تهيئة عميل HTTP غير متزامن مع حقن هوية المسؤول."""
 
-    from app.api.routers.admin import get_current_user_id
+    from app.api.routers.admin import get_current_user
+    from app.deps.auth import CurrentUser
 
-    test_app.dependency_overrides[get_current_user_id] = lambda: local_admin_user.id
+    test_app.dependency_overrides[get_current_user] = lambda: CurrentUser(
+        user=local_admin_user, roles=[], permissions=set()
+    )
 
     client_cm = AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test")
     client_instance = event_loop.run_until_complete(client_cm.__aenter__())
@@ -74,8 +77,8 @@ def client(test_app, local_admin_user, event_loop):
         yield client_instance
     finally:
         event_loop.run_until_complete(client_cm.__aexit__(None, None, None))
-        if get_current_user_id in test_app.dependency_overrides:
-            del test_app.dependency_overrides[get_current_user_id]
+        if get_current_user in test_app.dependency_overrides:
+            del test_app.dependency_overrides[get_current_user]
 
 
 @pytest.mark.asyncio
@@ -12,6 +12,7 @@ from app.api.routers.ws_auth import (
     _extract_token_from_protocols,
     _parse_protocol_header,
     extract_websocket_auth,
+    ws_secret_key,
 )
 from app.core.domain.user import User
 
@@ -38,9 +39,12 @@ def test_customer_ws_decode_fail(customer_app):
         "app.api.routers.customer_chat.extract_websocket_auth", return_value=("token", "jwt")
     ):
         with patch("app.api.routers.customer_chat.decode_user_id", side_effect=HTTPException(401)):
-            with pytest.raises(WebSocketDisconnect):
-                with client.websocket_connect("/api/chat/ws"):
-                    pass
+            with patch("app.api.routers.customer_chat.build_chat_dispatcher") as build:
+                with pytest.raises(WebSocketDisconnect):
+                    with client.websocket_connect("/api/chat/ws"):
+                        pass
+
+    build.assert_not_called()
 
 
 def test_customer_ws_admin(customer_app):
@@ -82,6 +86,107 @@ def test_customer_ws_empty_question(customer_app):
                 assert "required" in data["payload"]["details"]
 
 
+def test_customer_ws_rejects_malformed_message_and_stays_open(customer_app):
+    client = TestClient(customer_app)
+    mock_user = MagicMock(spec=User)
+    mock_user.is_active = True
+    mock_user.is_admin = False
+    mock_db = AsyncMock()
+    mock_db.get.return_value = mock_user
+    customer_app.dependency_overrides[get_db] = lambda: mock_db
+
+    with patch(
+        "app.api.routers.customer_chat.extract_websocket_auth", return_value=("token", "jwt")
+    ):
+        with patch("app.api.routers.customer_chat.decode_user_id", return_value=1):
+            with client.websocket_connect("/api/chat/ws") as ws:
+                ws.send_text("not-json")
+                assert ws.receive_json()["payload"]["details"] == "Invalid message."
+
+                ws.send_json({"question": "   ", "extra": True})
+                assert "required" in ws.receive_json()["payload"]["details"]
+
+
+def test_customer_ws_batches_stream_when_negotiated(customer_app):
+    from app.api.routers.customer_chat import get_ai_client
+    from app.services.chat.contracts import ChatDispatchResult
+
+    client = TestClient(customer_app)
+    mock_user = MagicMock(spec=User)
+    mock_user.is_active = True
+    mock_user.is_admin = False
+    mock_db = AsyncMock()
+    mock_db.get.return_value = mock_user
+    customer_app.dependency_overrides[get_db] = lambda: mock_db
+
+    def mock_dependency_factory():
+        return MagicMock()
+
+    customer_app.dependency_overrides[get_ai_client] = mock_dependency_factory
+
+    async def _stream():
+        yield {"type": "delta", "payload": {"content": "a"}}
+        yield {"type": "delta", "payload": {"content": "b"}}
+
+    dispatch = AsyncMock(return_value=ChatDispatchResult(status_code=200, stream=_stream()))
+
+    with patch(
+        "app.api.routers.customer_chat.extract_websocket_auth", return_value=("token", "jwt")
+    ):
+        with patch("app.api.routers.customer_chat.decode_user_id", return_value=1):
+            with patch("app.services.chat.orchestrator.ChatOrchestrator.dispatch", dispatch):
+                with client.websocket_connect(
+                    "/api/chat/ws", subprotocols=["jwt", "token", "batch-v1"]
+                ) as ws:
+                    ws.send_json({"question": "hello"})
+                    assert ws.receive_json()["type"] == "status"
+                    assert ws.receive_json() == {
+                        "type": "batch",
+                        "events": [
+                            {"type": "delta", "payload": {"content": "a"}},
+                            {"type": "delta", "payload": {"content": "b"}},
+                        ],
+                    }
+
+
+@pytest.mark.asyncio
+async def test_customer_get_actor_user_skips_refresh():
+    from types import SimpleNamespace
+
+    from app.api.routers.customer_chat import get_actor_user
+    from app.deps.auth import CurrentUser
+
+    user = MagicMock(spec=User)
+    user.is_active = True
+    mock_db = AsyncMock()
+    mock_db.get.return_value = user
+    mock_db.expunge = MagicMock()
+
+    current = CurrentUser(user=SimpleNamespace(id=1), roles=[], permissions=set())
+
+    assert await get_actor_user(current=current, db=mock_db) is user
+    mock_db.get.assert_awaited_once_with(User, 1)
+    mock_db.refresh.assert_not_awaited()
+    mock_db.expunge.assert_called_once_with(user)
+
+
+@pytest.mark.asyncio
+async def test_require_permissions_checks_prebuilt_set():
+    from types import SimpleNamespace
+
+    from app.api.routers.customer_chat import _REQUIRE_QA_SUBMIT
+    from app.deps.auth import CurrentUser
+    from app.services.rbac import QA_SUBMIT
+
+    allowed = CurrentUser(user=SimpleNamespace(id=1), roles=[], permissions={QA_SUBMIT})
+    denied = CurrentUser(user=SimpleNamespace(id=1), roles=[], permissions=set())
+
+    assert await _REQUIRE_QA_SUBMIT(current=allowed) is allowed
+    with pytest.raises(HTTPException) as exc:
+        await _REQUIRE_QA_SUBMIT(current=denied)
+    assert exc.value.status_code == 403
+
+
 # --- WS Auth Tests ---
 def test_parse_protocol_header():
     assert _parse_protocol_header("jwt, token") == ["jwt", "token"]
@@ -111,3 +216,15 @@ def test_extract_websocket_auth_success():
     token, proto = extract_websocket_auth(mock_ws)
     assert token == "my_secret_token"
     assert proto == "jwt"
+
+
+def test_ws_secret_key_is_resolved_once():
+    ws_secret_key.cache_clear()
+    try:
+        with patch("app.api.routers.ws_auth.get_settings") as mock_settings:
+            mock_settings.return_value.SECRET_KEY = "cached-secret"
+            assert ws_secret_key() == "cached-secret"
+            assert ws_secret_key() == "cached-secret"
+            mock_settings.assert_called_once()
+    finally:
+        ws_secret_key.cache_clear()
@@ -0,0 +1,346 @@
+"""اختبارات نقاط الحساب الحالي وسجل التدقيق في نظام إدارة المستخدمين."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.routers.ums import get_me
+from app.core.domain.user import UserStatus
+from app.deps.auth import CurrentUser
+
+
+@pytest.mark.asyncio
+async def test_get_me_returns_roles_resolved_by_auth_dependency():
+    user = SimpleNamespace(
+        id=4,
+        email="me@example.com",
+        full_name="Me",
+        is_active=True,
+        status=UserStatus.ACTIVE,
+    )
+    current = CurrentUser(user=user, roles=["STANDARD_USER"], permissions=set())
+
+    result = await get_me(current=current)
+
+    assert result.id == 4
+    assert result.roles == ["STANDARD_USER"]
+
+
+@pytest.mark.asyncio
+async def test_list_audit_returns_plain_rows_and_supports_cursor(db_session):
+    from datetime import UTC, datetime, timedelta
+
+    from app.api.routers.ums import list_audit
+    from app.core.config import get_settings
+    from app.core.domain.audit import AuditLog
+    from app.services.auth import AuthService
+
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    for index in range(3):
+        db_session.add(
+            AuditLog(
+                action=f"action-{index}",
+                target_type="user",
+                details={"index": index},
+                created_at=base + timedelta(minutes=index),
+            )
+        )
+    await db_session.commit()
+    service = AuthService(db_session, get_settings())
+
+    rows = await list_audit(
+        _=None, auth_service=service, limit=2, offset=0, cursor=None, cursor_id=None
+    )
+    assert [row["action"] for row in rows] == ["action-2", "action-1"]
+    assert rows[0]["details"] == {"index": 2}
+    assert set(rows[0]) == set(AuditLog.model_fields)
+
+    older = await list_audit(
+        _=None,
+        auth_service=service,
+        limit=2,
+        offset=0,
+        cursor=rows[-1]["created_at"],
+        cursor_id=rows[-1]["id"],
+    )
+    assert [row["action"] for row in older] == ["action-0"]
+
+
+@pytest.mark.asyncio
+async def test_list_audit_cursor_keeps_rows_with_tied_timestamps(db_session):
+    from datetime import UTC, datetime
+
+    from app.api.routers.ums import list_audit
+    from app.core.config import get_settings
+    from app.core.domain.audit import AuditLog
+    from app.services.auth import AuthService
+
+    tied = datetime(2026, 1, 1, tzinfo=UTC)
+    for index in range(5):
+        db_session.add(AuditLog(action=f"tied-{index}", target_type="user", created_at=tied))
+    await db_session.commit()
+    service = AuthService(db_session, get_settings())
+
+    seen: list[str] = []
+    cursor, cursor_id = None, None
+    while True:
+        page = await list_audit(
+            _=None, auth_service=service, limit=2, offset=0, cursor=cursor, cursor_id=cursor_id
+        )
+        if not page:
+            break
+        seen.extend(row["action"] for row in page)
+        cursor, cursor_id = page[-1]["created_at"], page[-1]["id"]
+
+    assert sorted(seen) == [f"tied-{index}" for index in range(5)]
+    assert len(seen) == len(set(seen))
+
+
+@pytest.mark.asyncio
+async def test_list_audit_rejects_offset_with_cursor(db_session):
+    from datetime import UTC, datetime
+
+    from fastapi import HTTPException
+
+    from app.api.routers.ums import list_audit
+    from app.core.config import get_settings
+    from app.services.auth import AuthService
+
+    service = AuthService(db_session, get_settings())
+    with pytest.raises(HTTPException) as exc:
+        await list_audit(
+            _=None,
+            auth_service=service,
+            limit=2,
+            offset=3,
+            cursor=datetime(2026, 1, 1, tzinfo=UTC),
+            cursor_id=1,
+        )
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_users_builds_user_out_for_each_user(db_session):
+    from app.api.routers.ums import list_users
+    from app.core.config import get_settings
+    from app.services.auth import AuthService
+
+    service = AuthService(db_session, get_settings())
+    await service.register_user(
+        full_name="Listed User", email="listed@example.com", password="Password123!"
+    )
+
+    users = await list_users(_=None, auth_service=service)
+
+    listed = next(user for user in users if user.email == "listed@example.com")
+    assert listed.full_name == "Listed User"
+    assert listed.status == UserStatus.ACTIVE
+    assert listed.model_dump(mode="json")["status"] == "active"
+
+
+def test_audit_context_is_resolved_once_per_request():
+    from starlette.requests import Request
+
+    from app.api.routers.ums import _audit_context
+
+    request = Request(
+        {
+            "type": "http",
+            "headers": [(b"user-agent", b"pytest-agent")],
+            "client": ("10.0.0.1", 1234),
+        }
+    )
+
+    context = _audit_context(request)
+    assert (context.client_ip, context.user_agent) == ("10.0.0.1", "pytest-agent")
+    request.scope["client"] = ("10.0.0.2", 1234)
+    assert _audit_context(request) is context
+
+
+def test_audit_context_reuses_shared_empty_value():
+    from starlette.requests import Request
+
+    from app.api.routers.ums import _EMPTY_AUDIT_CONTEXT, _audit_context
+
+    request = Request({"type": "http", "headers": [], "client": None})
+
+    assert _audit_context(request) is _EMPTY_AUDIT_CONTEXT
+
+
+@pytest.mark.asyncio
+async def test_list_users_groups_roles_in_one_query(db_session):
+    from sqlalchemy import event
+
+    from app.api.routers.ums import list_users
+    from app.core.config import get_settings
+    from app.services.auth import AuthService
+    from app.services.rbac import ADMIN_ROLE, STANDARD_ROLE
+
+    service = AuthService(db_session, get_settings())
+    first = await service.register_user(
+        full_name="First", email="bulk-first@example.com", password="Password123!"
+    )
+    second = await service.register_user(
+        full_name="Second", email="bulk-second@example.com", password="Password123!"
+    )
+    await service.promote_to_admin(user=second)
+
+    statements: list[str] = []
+    engine = db_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        users = {user.id: user for user in await list_users(_=None, auth_service=service)}
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert users[first.id].roles == [STANDARD_ROLE]
+    assert users[second.id].roles == sorted({STANDARD_ROLE, ADMIN_ROLE})
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_user_roles_and_permissions_match_separate_queries_in_one_statement(db_session):
+    from sqlalchemy import event
+
+    from app.core.config import get_settings
+    from app.services.auth import AuthService
+    from app.services.rbac import ADMIN_ROLE, STANDARD_ROLE
+
+    service = AuthService(db_session, get_settings())
+    user = await service.register_user(
+        full_name="Combined", email="combined-rbac@example.com", password="Password123!"
+    )
+    await service.promote_to_admin(user=user)
+
+    statements: list[str] = []
+    engine = db_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        roles, permissions = await service.rbac.user_roles_and_permissions(user.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert sorted(roles) == sorted({STANDARD_ROLE, ADMIN_ROLE})
+    assert len(roles) == 2
+    assert permissions == await service.rbac.user_permissions(user.id)
+    assert await service.rbac.user_roles_and_permissions(404) == ([], set())
+
+
+@pytest.mark.asyncio
+async def test_enforce_recent_auth_checks_password_off_the_event_loop():
+    import threading
+
+    from fastapi import HTTPException
+    from starlette.requests import Request
+
+    from app.api.routers.ums import _enforce_recent_auth
+
+    loop_thread = threading.get_ident()
+    checked_in: list[int] = []
+
+    def check_password(password: str) -> bool:
+        checked_in.append(threading.get_ident())
+        return password == "correct"
+
+    current = CurrentUser(
+        user=SimpleNamespace(check_password=check_password), roles=[], permissions=set()
+    )
+    request = Request({"type": "http", "headers": [], "client": None})
+
+    await _enforce_recent_auth(
+        request=request,
+        auth_service=None,
+        current=current,
+        provided_token=None,
+        provided_password="correct",
+    )
+    with pytest.raises(HTTPException) as exc:
+        await _enforce_recent_auth(
+            request=request,
+            auth_service=None,
+            current=current,
+            provided_token=None,
+            provided_password="wrong",
+        )
+
+    assert exc.value.status_code == 401
+    assert checked_in and loop_thread not in checked_in
+
+
+def test_routes_with_equal_permissions_share_one_dependency():
+    from app.api.routers.ums import _REQUIRE_ACCOUNT_SELF, router
+
+    calls = [
+        {dep.call for dep in route.dependant.dependencies}
+        for route in router.routes
+        if route.path.startswith("/users/me")
+    ]
+
+    assert len(calls) == 3
+    assert all(_REQUIRE_ACCOUNT_SELF in route_calls for route_calls in calls)
+
+
+def test_audit_list_is_rendered_with_orjson():
+    from datetime import UTC, datetime
+    from unittest.mock import AsyncMock, MagicMock
+
+    from fastapi import FastAPI
+    from fastapi.responses import ORJSONResponse
+    from fastapi.testclient import TestClient
+
+    from app.api.routers.ums import _REQUIRE_AUDIT_READ, get_auth_service, router
+
+    result = MagicMock()
+    result.mappings.return_value = [
+        {"id": 1, "action": "LOGIN", "created_at": datetime(2026, 1, 1, tzinfo=UTC)}
+    ]
+    service = SimpleNamespace(session=SimpleNamespace(execute=AsyncMock(return_value=result)))
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[_REQUIRE_AUDIT_READ] = lambda: None
+    app.dependency_overrides[get_auth_service] = lambda: service
+
+    route = next(route for route in router.routes if route.path == "/admin/audit")
+    response = TestClient(app).get("/admin/audit")
+
+    assert route.response_class is ORJSONResponse
+    assert response.json() == [{"id": 1, "action": "LOGIN", "created_at": "2026-01-01T00:00:00Z"}]
+
+
+@pytest.mark.asyncio
+async def test_ask_question_block_is_audited_through_injected_session_factory():
+    from unittest.mock import AsyncMock, MagicMock
+
+    from fastapi import FastAPI
+    from httpx import ASGITransport, AsyncClient
+
+    from app.api.routers import ums
+    from app.deps.auth import get_auth_service
+    from app.services.audit import drain_pending_audit_records
+
+    session = AsyncMock()
+    session.add = MagicMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+
+    app = FastAPI()
+    app.include_router(ums.router)
+    app.dependency_overrides[ums._REQUIRE_QA_SUBMIT] = lambda: CurrentUser(
+        user=SimpleNamespace(id=9), roles=["STANDARD_USER"], permissions=set()
+    )
+    app.dependency_overrides[get_auth_service] = lambda: None
+    app.dependency_overrides[ums.get_session_factory] = lambda: factory
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/qa/question", json={"question": "zzqx"})
+    await drain_pending_audit_records()
+
+    assert response.status_code == 403
+    factory.assert_called_once_with()
+    entry = session.add.call_args.args[0]
+    assert entry.action == "POLICY_BLOCK"
+    assert entry.actor_user_id == 9
+    session.commit.assert_awaited_once()
@@ -0,0 +1,100 @@
+"""اختبارات بث أحداث WebSocket على دفعات."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from app.api.routers.ws_auth import negotiates_batch_protocol
+from app.api.routers.ws_streaming import stream_events
+
+
+class _RecordingWebSocket:
+    """قناة وهمية تسجل الإطارات المرسلة بالترتيب."""
+
+    def __init__(self) -> None:
+        self.frames: list[object] = []
+
+    async def send_text(self, data: str) -> None:
+        self.frames.append(orjson.loads(data))
+
+
+async def _events(items: list[object], delay: float = 0.0) -> AsyncIterator[object]:
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+def _delta(content: str) -> dict[str, object]:
+    return {"type": "assistant_delta", "payload": {"content": content}}
+
+
+@pytest.mark.asyncio
+async def test_unbatched_stream_sends_one_frame_per_event() -> None:
+    websocket = _RecordingWebSocket()
+    items = [_delta("a"), _delta("b")]
+
+    await stream_events(websocket, _events(items), batched=False)
+
+    assert websocket.frames == items
+
+
+@pytest.mark.asyncio
+async def test_batched_stream_coalesces_events_in_order() -> None:
+    websocket = _RecordingWebSocket()
+    items = [_delta(str(i)) for i in range(5)]
+
+    await stream_events(websocket, _events(items), batched=True, window_seconds=0.05)
+
+    assert websocket.frames == [{"type": "batch", "events": items}]
+
+
+@pytest.mark.asyncio
+async def test_batched_stream_flushes_on_terminal_event() -> None:
+    websocket = _RecordingWebSocket()
+    final = {"type": "assistant_final", "payload": {"content": "done"}}
+    items = [_delta("a"), final, _delta("late")]
+
+    await stream_events(websocket, _events(items), batched=True, window_seconds=0.05)
+
+    assert websocket.frames == [{"type": "batch", "events": [_delta("a"), final]}, _delta("late")]
+
+
+@pytest.mark.asyncio
+async def test_batched_stream_respects_max_events() -> None:
+    websocket = _RecordingWebSocket()
+    items = [_delta(str(i)) for i in range(5)]
+
+    await stream_events(websocket, _events(items), batched=True, max_events=2)
+
+    flattened = []
+    for frame in websocket.frames:
+        flattened.extend(frame["events"] if frame.get("type") == "batch" else [frame])
+    assert flattened == items
+    assert all(len(frame.get("events", [frame])) <= 2 for frame in websocket.frames)
+
+
+@pytest.mark.asyncio
+async def test_batched_stream_reraises_source_failure_after_flush() -> None:
+    websocket = _RecordingWebSocket()
+
+    async def _failing() -> AsyncIterator[object]:
+        yield _delta("a")
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await stream_events(websocket, _failing(), batched=True)
+
+    assert websocket.frames == [_delta("a")]
+
+
+def test_negotiates_batch_protocol_reads_protocol_header() -> None:
+    websocket = MagicMock()
+    websocket.headers = {"sec-websocket-protocol": "jwt, token, batch-v1"}
+    assert negotiates_batch_protocol(websocket) is True
+
+    websocket.headers = {"sec-websocket-protocol": "jwt, token"}
+    assert negotiates_batch_protocol(websocket) is False
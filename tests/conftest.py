@@ -341,11 +341,14 @@ def test_app(static_dir: Path) -> FastAPI:
     session_factory = _get_session_factory()
     from app.api.routers.admin import get_session_factory as get_admin_session_factory
     from app.api.routers.customer_chat import get_session_factory
+    from app.api.routers.ums import get_session_factory as get_ums_session_factory
+    from app.api.routers.ws_auth import ws_secret_key
     from app.core.database import get_db
     from app.core.settings.base import get_settings
     from app.main import create_app
 
     get_settings.cache_clear()
+    ws_secret_key.cache_clear()
     settings = get_settings()
     app = create_app(
         settings_override=settings,
@@ -360,6 +363,7 @@ def test_app(static_dir: Path) -> FastAPI:
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_session_factory] = lambda: session_factory
     app.dependency_overrides[get_admin_session_factory] = lambda: session_factory
+    app.dependency_overrides[get_ums_session_factory] = lambda: session_factory
     return app
 
 
@@ -0,0 +1,81 @@
+"""اختبارات مخطط النواة وإعادة استخدام مكدس البرمجيات الوسيطة."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.testclient import TestClient
+
+from app.core.app_blueprint import BASE_CORS_OPTIONS, build_cors_options, build_middleware_stack
+from app.core.config import AppSettings
+from app.middleware.remove_blocking_headers import RemoveBlockingHeadersMiddleware
+from app.middleware.security.rate_limit_middleware import RateLimitMiddleware
+from app.middleware.security.security_headers import SecurityHeadersMiddleware
+
+
+def _settings(**overrides: object) -> AppSettings:
+    values: dict[str, object] = {
+        "ENVIRONMENT": "testing",
+        "SECRET_KEY": "test-secret-key-that-is-long-enough",
+        "DATABASE_URL": "sqlite+aiosqlite:///:memory:",
+    }
+    values.update(overrides)
+    return AppSettings(**values)
+
+
+def test_middleware_stack_is_reused_for_equal_settings():
+    first = build_middleware_stack(_settings())
+    second = build_middleware_stack(_settings())
+
+    assert first == second
+    assert first is not second
+    assert first[0] is second[0]
+    first.append((RateLimitMiddleware, {}))
+    assert len(build_middleware_stack(_settings())) == len(second)
+
+
+def test_middleware_stack_follows_relevant_settings():
+    testing = build_middleware_stack(_settings(ALLOWED_HOSTS=["a.example"]))
+    development = build_middleware_stack(
+        _settings(ENVIRONMENT="development", ALLOWED_HOSTS=["b.example"])
+    )
+
+    assert testing[0] == (TrustedHostMiddleware, {"allowed_hosts": ["a.example"]})
+    assert development[0] == (TrustedHostMiddleware, {"allowed_hosts": ["b.example"]})
+    assert RateLimitMiddleware not in {spec[0] for spec in testing}
+    assert [spec[0] for spec in development] == [
+        TrustedHostMiddleware,
+        CORSMiddleware,
+        SecurityHeadersMiddleware,
+        RateLimitMiddleware,
+        RemoveBlockingHeadersMiddleware,
+        GZipMiddleware,
+    ]
+
+
+def test_cors_options_share_frozen_base_values():
+    options = build_cors_options([])
+
+    assert options["allow_origins"] == ("*",)
+    assert options["allow_methods"] is BASE_CORS_OPTIONS["allow_methods"]
+    with pytest.raises(TypeError):
+        BASE_CORS_OPTIONS["allow_credentials"] = False  # type: ignore[index]
+
+
+def test_cors_middleware_accepts_tuple_options():
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, **build_cors_options(["http://front.example"]))
+
+    response = TestClient(app).options(
+        "/",
+        headers={
+            "Origin": "http://front.example",
+            "Access-Control-Request-Method": "PATCH",
+            "Access-Control-Request-Headers": "Authorization",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://front.example"
+    assert "PATCH" in response.headers["access-control-allow-methods"]
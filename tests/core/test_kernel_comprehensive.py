@@ -110,6 +110,26 @@ class TestRealityKernel:
         with suppress(StopAsyncIteration):
             await anext(lifespan_gen)
 
+    @pytest.mark.asyncio
+    async def test_lifespan_prebuilds_and_closes_service_http_clients(self, mock_settings):
+        """
+        GIVEN a kernel app
+        WHEN the lifespan starts and then shuts down
+        THEN the boundary service HTTP clients are pooled at startup and closed at shutdown.
+        """
+        from app.core.http_client_factory import get_http_client_stats
+        from app.infrastructure.clients.user_client import user_client
+
+        kernel = RealityKernel(settings=mock_settings)
+        lifespan_gen = kernel._handle_lifespan_events()
+
+        await anext(lifespan_gen)
+        assert user_client.config.get_cache_key() in get_http_client_stats()
+
+        with suppress(StopAsyncIteration):
+            await anext(lifespan_gen)
+        assert user_client.config.get_cache_key() not in get_http_client_stats()
+
     def test_cors_logic_dev_vs_prod(self):
         """
         GIVEN different environments
@@ -0,0 +1,27 @@
+"""اختبارات بناء حالة النواة مع تأجيل إنشاء خدمة LangGraph."""
+
+from unittest.mock import patch
+
+from fastapi import FastAPI
+
+from app.core.kernel_state import apply_app_state, build_app_state
+from app.services.overmind.langgraph.service import LangGraphAgentService, get_langgraph_service
+
+
+def test_build_app_state_defers_langgraph_service_creation() -> None:
+    get_langgraph_service.cache_clear()
+    with patch(
+        "app.services.overmind.langgraph.service.create_langgraph_service",
+        wraps=LangGraphAgentService,
+    ) as factory:
+        app = FastAPI()
+        apply_app_state(app, build_app_state())
+        factory.assert_not_called()
+
+        first = app.state.langgraph_service_factory()
+        second = app.state.langgraph_service_factory()
+
+    assert isinstance(first, LangGraphAgentService)
+    assert first is second
+    factory.assert_called_once()
+    get_langgraph_service.cache_clear()
@@ -61,3 +61,22 @@ def test_readiness_endpoint(mock_init_db):
     assert data["concept_id"] == "unknown_concept_123"
     assert data["is_ready"] is True  # Logic permits proceeding if unknown
     assert "غير موجود" in data["recommendation"]
+
+
+@patch("microservices.memory_agent.main.init_db", new_callable=AsyncMock)
+def test_concept_graph_endpoint_matches_individual_endpoints(mock_init_db):
+    from microservices.memory_agent.main import create_app
+    from microservices.memory_agent.security import verify_service_token
+
+    app = create_app()
+    app.dependency_overrides[verify_service_token] = mock_verify_token
+    client = TestClient(app)
+
+    response = client.get("/knowledge/concepts/conditional_prob/graph")
+    assert response.status_code == 200
+    data = response.json()
+
+    for key, path in (("prerequisites", "prerequisites"), ("related", "related"), ("next", "next")):
+        expected = client.get(f"/knowledge/concepts/conditional_prob/{path}").json()
+        assert data[key] == expected
+    assert "combinations" in {concept["concept_id"] for concept in data["prerequisites"]}
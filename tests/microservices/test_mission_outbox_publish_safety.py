@@ -152,6 +152,40 @@ async def test_relay_outbox_events_skips_failed_after_retry_budget() -> None:
     assert bus.published_messages == []
 
 
+@pytest.mark.asyncio
+async def test_relay_wake_burst_does_not_exhaust_retry_budget() -> None:
+    """موجة دورات إيقاظ مع نشر فاشل دائمًا تستهلك محاولة واحدة فقط من الميزانية."""
+
+    outbox = MissionOutbox(
+        id=12,
+        mission_id=90,
+        event_type="status_change",
+        payload_json={"status": "running"},
+        status="failed",
+    )
+    session = _FakeSession()
+    bus = _FakeEventBus(should_fail=True)
+    manager = MissionStateManager(session=session, event_bus=bus)
+
+    async def _fake_candidates(*, batch_size: int):
+        _ = batch_size
+        return [outbox]
+
+    manager._load_relay_candidates = _fake_candidates  # type: ignore[method-assign]
+
+    for _ in range(5):
+        await manager.relay_outbox_events(batch_size=10, max_failed_attempts=3, fresh_only=True)
+
+    assert outbox.status == "failed"
+    assert outbox.payload_json["__relay"]["attempt"] == 1
+    assert len(bus.published_messages) == 1
+
+    result = await manager.relay_outbox_events(batch_size=10, max_failed_attempts=3)
+
+    assert result["failed"] == 1
+    assert outbox.payload_json["__relay"]["attempt"] == 2
+
+
 @pytest.mark.asyncio
 async def test_relay_outbox_events_marks_serialization_error_without_publish_call() -> None:
     """يثبت تصنيف serialization_error عندما تكون الحمولة غير قابلة للتسلسل."""
@@ -249,3 +283,64 @@ async def test_relay_processing_staleness_uses_last_attempt_timestamp_when_avail
 
     assert result == {"processed": 0, "published": 0, "failed": 0, "skipped": 1}
     assert bus.published_messages == []
+
+
+@dataclass
+class _FakeBatchEventBus:
+    """ناقل أحداث وهمي يدعم النشر المجمّع ويحدد الرسائل الفاشلة بالقناة."""
+
+    failing_channels: frozenset[str] = frozenset()
+    batches: list[list[tuple[str, object]]] | None = None
+
+    def __post_init__(self) -> None:
+        if self.batches is None:
+            self.batches = []
+
+    async def publish(self, channel: str, event: object) -> None:
+        raise AssertionError("relay must use publish_many when available")
+
+    async def publish_many(self, messages: list[tuple[str, object]]) -> list[Exception | None]:
+        self.batches.append(list(messages))
+        return [
+            RuntimeError("bus unavailable") if channel in self.failing_channels else None
+            for channel, _ in messages
+        ]
+
+
+@pytest.mark.asyncio
+async def test_relay_outbox_events_publishes_batch_in_one_call() -> None:
+    """ينشر relay الدفعة كاملة باستدعاء واحد ويثبت الحالات بعدد ثابت من commit."""
+
+    records = [
+        MissionOutbox(
+            id=20 + index,
+            mission_id=500 + index,
+            event_type="status_change",
+            payload_json={"n": index},
+            status="pending",
+        )
+        for index in range(3)
+    ]
+    session = _FakeSession()
+    bus = _FakeBatchEventBus(failing_channels=frozenset({"mission:501"}))
+    manager = MissionStateManager(session=session, event_bus=bus)
+
+    async def _fake_candidates(*, batch_size: int):
+        _ = batch_size
+        return records
+
+    manager._load_relay_candidates = _fake_candidates  # type: ignore[method-assign]
+
+    result = await manager.relay_outbox_events(batch_size=10, max_failed_attempts=3)
+
+    assert result == {"processed": 3, "published": 2, "failed": 1, "skipped": 0}
+    assert len(bus.batches) == 1
+    assert [channel for channel, _ in bus.batches[0]] == [
+        "mission:500",
+        "mission:501",
+        "mission:502",
+    ]
+    assert [record.status for record in records] == ["published", "failed", "published"]
+    assert records[1].published_at is None
+    assert records[1].payload_json["__relay"]["last_error_kind"] == "publish_error"
+    assert session.commit_count == 2
@@ -0,0 +1,30 @@
+"""اختبارات الفهرس الجزئي الذي يخدم استعلام relay لسجلات Outbox."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from microservices.orchestrator_service.src.models.mission import MissionOutbox
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_partial_index_is_created_idempotently() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(MissionOutbox.metadata.create_all, tables=[MissionOutbox.__table__])
+            # إعادة الإنشاء مع checkfirst يجب أن تكون آمنة كما في init_db.
+            for index in MissionOutbox.__table__.indexes:
+                await conn.run_sync(index.create, checkfirst=True)
+
+            result = await conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE name = 'ix_mission_outbox_relay_pending'")
+            )
+            ddl = result.scalar_one()
+    finally:
+        await engine.dispose()
+
+    assert "(id)" in ddl
+    assert "WHERE status IN ('pending', 'failed', 'processing')" in ddl
@@ -0,0 +1,185 @@
+"""اختبارات تحميل المهمة مع سجل أحداثها في استعلام واحد لمصافحة WebSocket."""
+
+from __future__ import annotations
+
+import contextlib
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from microservices.orchestrator_service.src.api import routes
+from microservices.orchestrator_service.src.models.mission import (
+    Mission,
+    MissionEvent,
+    MissionEventType,
+    MissionStatus,
+)
+from microservices.orchestrator_service.src.services.overmind.state import MissionStateManager
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Mission.metadata.create_all, tables=[Mission.__table__])
+        await conn.run_sync(Mission.metadata.create_all, tables=[MissionEvent.__table__])
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_mission_with_events_uses_one_query(session_factory) -> None:
+    async with session_factory() as session:
+        mission = Mission(objective="o", initiator_id=1)
+        session.add(mission)
+        await session.flush()
+        for event_type in (MissionEventType.CREATED, MissionEventType.STATUS_CHANGE):
+            session.add(MissionEvent(mission_id=mission.id, event_type=event_type))
+        await session.commit()
+        mission_id = mission.id
+
+    async with session_factory() as session:
+        statements: list[str] = []
+        engine = session.bind.sync_engine
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            loaded, events = await MissionStateManager(session).get_mission_with_events(mission_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+    assert loaded is not None and loaded.id == mission_id
+    assert [evt.event_type for evt in events] == [
+        MissionEventType.CREATED,
+        MissionEventType.STATUS_CHANGE,
+    ]
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_mission_status_reads_fresh_value(session_factory) -> None:
+    async with session_factory() as session:
+        mission = Mission(objective="o", initiator_id=1)
+        session.add(mission)
+        await session.commit()
+        mission_id = mission.id
+
+    async with session_factory() as session, session_factory() as writer:
+        manager = MissionStateManager(session)
+        loaded, _ = await manager.get_mission_with_events(mission_id)
+        assert loaded.status == MissionStatus.PENDING
+        await session.rollback()
+
+        stored = await writer.get(Mission, mission_id)
+        stored.status = MissionStatus.SUCCESS
+        await writer.commit()
+
+        assert await manager.get_mission_status(mission_id) == MissionStatus.SUCCESS
+        assert await manager.get_mission_status(404) is None
+
+
+@pytest.mark.asyncio
+async def test_get_mission_with_events_returns_empty_for_missing_mission(session_factory) -> None:
+    async with session_factory() as session:
+        assert await MissionStateManager(session).get_mission_with_events(404) == (None, [])
+
+
+class _FakeStateManager:
+    """مدير حالة وهمي يعيد مهمة مكتملة مع حدثين تاريخيين."""
+
+    def __init__(self, session: object) -> None:
+        self.session = session
+
+    async def get_mission_with_events(self, mission_id: int):
+        mission = SimpleNamespace(id=mission_id, status=MissionStatus.SUCCESS)
+        events = [
+            SimpleNamespace(event_type=MissionEventType.CREATED, payload_json={"step": 1}),
+            SimpleNamespace(event_type=MissionEventType.STATUS_CHANGE, payload_json=None),
+        ]
+        return mission, events
+
+    async def get_mission_status(self, mission_id: int):
+        return MissionStatus.SUCCESS
+
+
+class _FakeEventBus:
+    async def subscribe(self, channel: str):
+        yield {"event_type": "mission_completed", "data": {}}
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.rollbacks = 0
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+_SESSIONS: list[_FakeSession] = []
+
+
+@contextlib.asynccontextmanager
+async def _fake_session_factory():
+    session = _FakeSession()
+    _SESSIONS.append(session)
+    yield session
+
+
+def _mission_ws_client(monkeypatch) -> TestClient:
+    monkeypatch.setattr(routes, "decode_user_id", lambda *_: 1)
+    monkeypatch.setattr(routes, "MissionStateManager", _FakeStateManager)
+    monkeypatch.setattr(routes, "async_session_factory", _fake_session_factory)
+    monkeypatch.setattr(routes, "get_event_bus", _FakeEventBus)
+    app = FastAPI()
+    app.include_router(routes.router)
+    return TestClient(app)
+
+
+def test_mission_ws_replays_history_as_snapshot_for_batch_clients(monkeypatch) -> None:
+    client = _mission_ws_client(monkeypatch)
+
+    with client.websocket_connect(
+        "/missions/7/ws", subprotocols=["jwt", "token", "batch-v1"]
+    ) as ws:
+        assert ws.receive_json()["type"] == "mission_status"
+        assert ws.receive_json() == {
+            "type": "mission_event_snapshot",
+            "payload": {
+                "events": [
+                    {"event_type": "mission_created", "data": {"step": 1}},
+                    {"event_type": "status_change", "data": {}},
+                ]
+            },
+        }
+        assert ws.receive_json()["payload"]["event_type"] == "mission_completed"
+        assert ws.receive_json() == {
+            "type": "mission_status",
+            "payload": {"status": "success", "outcome": None},
+        }
+
+
+def test_mission_ws_reuses_one_session_for_terminal_status(monkeypatch) -> None:
+    _SESSIONS.clear()
+    client = _mission_ws_client(monkeypatch)
+
+    with client.websocket_connect("/missions/7/ws", subprotocols=["jwt", "token"]) as ws:
+        frames = [ws.receive_json() for _ in range(5)]
+
+    assert frames[-1]["type"] == "mission_status"
+    assert len(_SESSIONS) == 1
+    assert _SESSIONS[0].rollbacks == 1
+
+
+def test_mission_ws_replays_history_per_event_for_legacy_clients(monkeypatch) -> None:
+    client = _mission_ws_client(monkeypatch)
+
+    with client.websocket_connect("/missions/7/ws", subprotocols=["jwt", "token"]) as ws:
+        assert ws.receive_json()["type"] == "mission_status"
+        replayed = [ws.receive_json() for _ in range(2)]
+
+    assert [frame["type"] for frame in replayed] == ["mission_event", "mission_event"]
+    assert replayed[1]["payload"] == {"event_type": "status_change", "data": {}}
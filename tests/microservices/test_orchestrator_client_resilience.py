@@ -7,7 +7,10 @@ import json
 import httpx
 import pytest
 
-from app.infrastructure.clients.orchestrator_client import OrchestratorClient
+from app.infrastructure.clients.orchestrator_client import (
+    OrchestratorClient,
+    _iter_ndjson_lines,
+)
 
 
 class _AlwaysFailClient:
@@ -330,3 +333,75 @@ async def test_exercise_retrieval_fallback_concurrency_smoke(
 
     results = await asyncio.gather(*[run_once() for _ in range(8)])
     assert all(result == "تم العثور على تمرين محلي." for result in results)
+
+
+def _mock_transport_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_mission_endpoints_decode_bytes_directly(monkeypatch: pytest.MonkeyPatch) -> None:
+    """يتحقق من فك استجابات المهام مباشرة من البايتات إلى النموذج والقائمة."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/events"):
+            return httpx.Response(200, content=b'[{"event_type": "mission_created"}]')
+        return httpx.Response(
+            200,
+            content=b'{"id": 7, "objective": "o", "status": "running", "extra": 1}',
+        )
+
+    http_client = _mock_transport_client(handler)
+    client = OrchestratorClient(base_url="http://orchestrator-service:8006")
+
+    async def fake_get_client():
+        return http_client
+
+    monkeypatch.setattr(client, "_get_client", fake_get_client)
+    try:
+        mission = await client.get_mission(7)
+        created = await client.create_mission("o")
+        events = await client.get_mission_events(7)
+    finally:
+        await http_client.aclose()
+
+    assert mission is not None and mission.id == 7 and mission.status == "running"
+    assert created.id == 7
+    assert events == [{"event_type": "mission_created"}]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_parses_ndjson_and_keeps_non_json_lines(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """يتحقق من تحليل أسطر NDJSON وتمرير الأسطر غير الصالحة كنص."""
+    body = b'{"type": "assistant_final", "payload": {"content": "hi"}}\n\nnot-json\n'
+    http_client = _mock_transport_client(lambda _request: httpx.Response(200, content=body))
+    client = OrchestratorClient(base_url="http://orchestrator-service:8006")
+
+    async def fake_get_client():
+        return http_client
+
+    monkeypatch.setattr(client, "_get_client", fake_get_client)
+    try:
+        items = [item async for item in client.chat_with_agent(question="سؤال", user_id=1)]
+    finally:
+        await http_client.aclose()
+
+    assert len(items) == 2
+    assert items[0]["type"] == "assistant_final"
+    assert items[0]["payload"]["content"] == "hi"
+    assert items[1] == client._normalize_stream_event("not-json")
+
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_lines_joins_lines_split_across_chunks() -> None:
+    """يتحقق من إعادة تجميع الأسطر المقسومة بين الدفعات وإخراج السطر الأخير بلا فاصل."""
+
+    async def _chunks():
+        for chunk in (b'{"a":', b' 1}\n{"b": 2}\r\n\n', "سطر".encode()[:3], "سطر".encode()[3:]):
+            yield chunk
+
+    lines = [line async for line in _iter_ndjson_lines(_chunks())]
+
+    assert lines == [b'{"a": 1}', b'{"b": 2}\r', b"", "سطر".encode()]
@@ -6,7 +6,7 @@ import json
 
 import pytest
 
-from microservices.orchestrator_service.src.core.event_bus import EventBus
+from microservices.orchestrator_service.src.core.event_bus import EventBus, encode_event_message
 
 
 class _FailingRedis:
@@ -53,3 +53,12 @@ async def test_event_bus_publish_serializes_dict_payload() -> None:
     channel, raw = capturing.published[0]
     assert channel == "mission:2"
     assert json.loads(raw) == payload
+
+
+def test_encode_event_message_emits_compact_bytes_with_non_str_keys() -> None:
+    """يثبت أن الترميز عبر orjson يعيد bytes ويقبل المفاتيح الرقمية كما كان json.dumps."""
+
+    raw = encode_event_message({"event_type": "status_change", "counts": {1: "a"}})
+
+    assert isinstance(raw, bytes)
+    assert json.loads(raw) == {"event_type": "status_change", "counts": {"1": "a"}}
@@ -1,7 +1,9 @@
 import asyncio
+import json
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -132,6 +134,34 @@ def test_canonicalize_mission_event_accepts_legacy_shapes() -> None:
     assert data_shape == {"event_type": "mission_started", "data": {"b": 2}}
 
 
+def test_mission_status_payload_is_cached_and_read_only() -> None:
+    from microservices.orchestrator_service.src.api.routes import (
+        _get_mission_status_payload,
+        _mission_status_frame,
+    )
+
+    payload = _get_mission_status_payload("partial_success")
+    assert payload == {"status": "success", "outcome": "partial_success"}
+    assert _get_mission_status_payload("partial_success") is payload
+    with pytest.raises(TypeError):
+        payload["status"] = "failed"  # type: ignore[index]
+
+    frame = _mission_status_frame("running")
+    assert _mission_status_frame("running") is frame
+    assert json.loads(frame) == {
+        "type": "mission_status",
+        "payload": {"status": "running", "outcome": None},
+    }
+
+
+def test_mission_event_type_name_handles_enum_and_raw_values() -> None:
+    from microservices.orchestrator_service.src.api.routes import _mission_event_type_name
+    from microservices.orchestrator_service.src.models.mission import MissionEventType
+
+    assert _mission_event_type_name(MissionEventType.CREATED) == "mission_created"
+    assert _mission_event_type_name("legacy_event") == "legacy_event"
+
+
 def test_create_mission_endpoint_sanitizes_internal_errors() -> None:
     """يتأكد أن فشل إنشاء المهمة لا يسرّب تفاصيل داخلية للعميل."""
 
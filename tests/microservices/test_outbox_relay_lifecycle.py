@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
+from itertools import pairwise
 
 import pytest
 
 from microservices.orchestrator_service import main
+from microservices.orchestrator_service.src.services.overmind.state import notify_outbox_pending
 
 
 @pytest.mark.asyncio
@@ -25,7 +29,9 @@ async def test_run_outbox_relay_once_uses_settings_limits(monkeypatch) -> None:
             batch_size: int,
             max_failed_attempts: int,
             processing_timeout_seconds: int,
+            fresh_only: bool,
         ) -> dict[str, int]:
+            captured["fresh_only"] = fresh_only
             captured["batch_size"] = batch_size
             captured["max_failed_attempts"] = max_failed_attempts
             captured["processing_timeout_seconds"] = processing_timeout_seconds
@@ -45,7 +51,59 @@ async def test_run_outbox_relay_once_uses_settings_limits(monkeypatch) -> None:
 
     assert summary == {"processed": 0, "published": 0, "failed": 0, "skipped": 0}
     assert captured == {
+        "fresh_only": False,
         "batch_size": 17,
         "max_failed_attempts": 5,
         "processing_timeout_seconds": 123,
     }
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_loop_wakes_on_notification_before_interval(monkeypatch) -> None:
+    """يتأكد أن تعثر النشر المباشر يوقظ الحلقة فورًا دون انتظار الفاصل الدوري."""
+
+    stop_event = asyncio.Event()
+    cycles: list[bool] = []
+
+    async def _fake_run_once(*, fresh_only: bool = False) -> dict[str, int]:
+        cycles.append(fresh_only)
+        if len(cycles) == 1:
+            notify_outbox_pending()
+        else:
+            stop_event.set()
+        return {"processed": 0, "published": 0, "failed": 0, "skipped": 0}
+
+    monkeypatch.setattr(main, "_run_outbox_relay_once", _fake_run_once)
+    monkeypatch.setattr(main.settings, "OUTBOX_RELAY_INTERVAL_SECONDS", 60)
+    monkeypatch.setattr(main, "_RELAY_WAKE_MIN_GAP_DIVISOR", 600)
+
+    await asyncio.wait_for(main._outbox_relay_loop(stop_event), timeout=2)
+
+    assert cycles == [False, True]
+    notify_outbox_pending()  # لا حلقة مسجلة بعد الإيقاف: يجب ألا يفشل
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_loop_spaces_out_burst_of_wakeups(monkeypatch) -> None:
+    """موجة إيقاظات متتالية لا تُطلق دورات relay أسرع من الحد الأدنى للفاصل."""
+
+    stop_event = asyncio.Event()
+    started: list[float] = []
+
+    async def _fake_run_once(*, fresh_only: bool = False) -> dict[str, int]:
+        started.append(time.monotonic())
+        for _ in range(10):
+            notify_outbox_pending()
+        if len(started) == 3:
+            stop_event.set()
+        return {"processed": 0, "published": 0, "failed": 1, "skipped": 0}
+
+    monkeypatch.setattr(main, "_run_outbox_relay_once", _fake_run_once)
+    monkeypatch.setattr(main.settings, "OUTBOX_RELAY_INTERVAL_SECONDS", 1)
+
+    await asyncio.wait_for(main._outbox_relay_loop(stop_event), timeout=3)
+
+    min_gap = 1 / main._RELAY_WAKE_MIN_GAP_DIVISOR
+    gaps = [later - earlier for earlier, later in pairwise(started)]
+    assert len(gaps) == 2
+    assert all(gap >= min_gap * 0.9 for gap in gaps)
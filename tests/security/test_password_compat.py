@@ -1,6 +1,13 @@
+import pytest
+from fastapi import HTTPException
 from passlib.context import CryptContext
 
+from app.core.config import get_settings
+from app.core.domain import user as user_module
 from app.core.domain.models import pwd_context
+from app.core.domain.user import User
+from app.services.auth import AuthService
+from app.services.auth import service as auth_service_module
 
 
 def test_legacy_hash_support():
@@ -30,3 +37,40 @@ def test_legacy_hash_support():
     new_hash = pwd_context.hash(password)
     assert pwd_context.verify(password, new_hash)
     assert not pwd_context.needs_update(new_hash)
+
+
+def test_check_password_leaves_legacy_hash_untouched_and_offers_upgrade():
+    legacy_hash = CryptContext(schemes=["bcrypt"]).hash("testpassword")
+    user = User(full_name="Legacy", email="legacy@example.com", password_hash=legacy_hash)
+
+    assert user.verify_password_and_rehash("wrong") == (False, None)
+    assert user.check_password("testpassword")
+    assert user.password_hash == legacy_hash
+
+    valid, new_hash = user.verify_password_and_rehash("testpassword")
+    assert valid
+    assert new_hash is not None and new_hash.startswith("$argon2id$")
+    assert not pwd_context.needs_update(new_hash)
+    assert user.password_hash == legacy_hash
+
+
+def test_check_password_without_hash_still_runs_a_verification(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(user_module, "verify_against_dummy_hash", calls.append)
+    user = User(full_name="No Password", email="nopass@example.com")
+
+    assert not user.check_password("anything")
+    assert not user.verify_password("anything")
+    assert calls == ["anything", "anything"]
+
+
+async def test_authenticate_unknown_email_runs_dummy_verification(db_session, monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(auth_service_module, "verify_against_dummy_hash", calls.append)
+    service = AuthService(db_session, get_settings())
+
+    with pytest.raises(HTTPException) as exc:
+        await service.authenticate(email="missing@example.com", password="Password123!")
+
+    assert exc.value.status_code == 401
+    assert calls == ["Password123!"]
@@ -0,0 +1,80 @@
+"""اختبارات إعادة استخدام التحقق الحديث من أدلة إعادة المصادقة."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+from app.core.domain.user import User
+from app.services.auth import AuthService
+from app.services.auth import service as auth_service_module
+
+
+async def _user_and_proof(service: AuthService, email: str):
+    user = await service.register_user(
+        full_name="Reauth User",
+        email=email,
+        password="Password123!",
+        ip="1.1.1.1",
+        user_agent="pytest-agent",
+    )
+    token, _ = await service.issue_reauth_proof(user=user, password="Password123!")
+    return user, token
+
+
+@pytest.mark.asyncio
+async def test_reauth_proof_is_verified_once_within_cache_ttl(db_session):
+    auth_service_module._verified_reauth_proofs.clear()
+    settings = get_settings().model_copy(update={"REAUTH_CACHE_TTL_SECONDS": 5})
+    service = AuthService(db_session, settings)
+    user, token = await _user_and_proof(service, "reauth-cache@example.com")
+
+    with patch.object(service.crypto, "verify_jwt", wraps=service.crypto.verify_jwt) as verify:
+        await service.verify_reauth_proof(token, user=user)
+        await service.verify_reauth_proof(token, user=user)
+        assert verify.call_count == 1
+
+        other = User(id=user.id + 1000, full_name="Other", email="other@example.com")
+        with pytest.raises(HTTPException):
+            await service.verify_reauth_proof(token, user=other)
+        assert verify.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_reauth_proof_cache_is_disabled_by_default(db_session):
+    auth_service_module._verified_reauth_proofs.clear()
+    service = AuthService(db_session, get_settings())
+    user, token = await _user_and_proof(service, "reauth-nocache@example.com")
+
+    with patch.object(service.crypto, "verify_jwt", wraps=service.crypto.verify_jwt) as verify:
+        await service.verify_reauth_proof(token, user=user)
+        await service.verify_reauth_proof(token, user=user)
+
+    assert verify.call_count == 2
+    assert not auth_service_module._verified_reauth_proofs
+
+
+@pytest.mark.asyncio
+async def test_reauth_proof_cache_evicts_least_recently_used(db_session):
+    auth_service_module._verified_reauth_proofs.clear()
+    settings = get_settings().model_copy(update={"REAUTH_CACHE_TTL_SECONDS": 5})
+    service = AuthService(db_session, settings)
+    user, token = await _user_and_proof(service, "reauth-lru@example.com")
+    other, other_token = await _user_and_proof(service, "reauth-lru-other@example.com")
+    cache_key = (hashlib.sha256(token.encode()).digest()[:16], user.id)
+    stale_key = (b"\x00" * 16, 0)
+
+    with patch.object(auth_service_module, "REAUTH_CACHE_MAX_ENTRIES", 2):
+        await service.verify_reauth_proof(token, user=user)
+        auth_service_module._verified_reauth_proofs[stale_key] = time.time() + 60
+        await service.verify_reauth_proof(token, user=user)
+        await service.verify_reauth_proof(other_token, user=other)
+
+    assert cache_key in auth_service_module._verified_reauth_proofs
+    assert stale_key not in auth_service_module._verified_reauth_proofs
+    auth_service_module._verified_reauth_proofs.clear()
@@ -7,7 +7,9 @@ from fastapi import HTTPException
 from sqlalchemy import select
 
 from app.core.domain.models import RefreshToken
+from app.security.passwords import pwd_context
 from app.services.auth import AuthService
+from app.services.auth.token_manager import hash_refresh_secret, verify_refresh_secret
 
 
 @pytest.mark.asyncio
@@ -52,3 +54,33 @@ async def test_refresh_rotation_sets_replacement_and_replay_guard(db_session):
     )
     for token in family_tokens.scalars().all():
         assert token.revoked_at is not None
+
+
+@pytest.mark.asyncio
+async def test_refresh_secret_is_stored_as_sha256_and_legacy_hashes_still_verify(db_session):
+    service = AuthService(db_session)
+    user = await service.register_user(
+        full_name="Digest User",
+        email="digest@example.com",
+        password="Password123!",
+        ip="1.1.1.1",
+        user_agent="pytest-agent",
+    )
+    tokens = await service.issue_tokens(user, ip="1.1.1.1", user_agent="pytest-agent")
+    token_id, secret = service._split_refresh_token(tokens["refresh_token"])
+    record = await service._get_refresh_record(token_id)
+
+    assert record.hashed_token == hash_refresh_secret(secret)
+    assert verify_refresh_secret(secret, record.hashed_token)
+    assert not verify_refresh_secret(secret + "x", record.hashed_token)
+
+    legacy_hash = pwd_context.hash(secret)
+    assert verify_refresh_secret(secret, legacy_hash)
+    assert not verify_refresh_secret("wrong", legacy_hash)
+
+    record.hashed_token = legacy_hash
+    await db_session.commit()
+    rotated = await service.refresh_session(
+        refresh_token=tokens["refresh_token"], ip="1.1.1.1", user_agent="pytest-agent"
+    )
+    assert rotated["refresh_token"] != tokens["refresh_token"]
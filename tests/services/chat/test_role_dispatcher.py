@@ -4,7 +4,11 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from app.services.chat.contracts import ChatDispatchRequest, ChatDispatchResult, ChatStreamEvent
-from app.services.chat.dispatcher import ChatRoleDispatcher
+from app.services.chat.dispatcher import (
+    ChatRoleDispatcher,
+    build_chat_dispatcher,
+    get_dispatcher_template,
+)
 from tests.factories.base import UserFactory
 
 
@@ -78,3 +82,18 @@ async def test_dispatcher_routes_customer_to_customer_boundary() -> None:
     assert result == [{"type": "delta", "payload": {"content": "customer"}}]
     customer_boundary.orchestrate_chat_stream.assert_called_once()
     admin_boundary.orchestrate_chat_stream.assert_not_called()
+
+
+def test_build_chat_dispatcher_reuses_session_independent_components() -> None:
+    template = get_dispatcher_template()
+    first_db, second_db = MagicMock(), MagicMock()
+
+    first = build_chat_dispatcher(first_db)
+    second = build_chat_dispatcher(second_db)
+
+    assert get_dispatcher_template() is template
+    assert first._customer_boundary.db is first_db
+    assert second._customer_boundary.db is second_db
+    assert first._admin_boundary.db is first_db
+    assert first._customer_boundary.intent_detector is template.intent_detector
+    assert second._customer_boundary.tool_router is template.tool_router
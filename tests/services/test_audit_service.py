@@ -6,7 +6,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 # Ensure app is in path
 sys.path.append(os.getcwd())
 
-from app.services.audit import AuditAction, AuditService
+from app.services.audit import (
+    AuditAction,
+    AuditService,
+    drain_pending_audit_records,
+    schedule_audit_record,
+)
+from app.services.audit import service as audit_service_module
 
 
 class TestAuditService(unittest.IsolatedAsyncioTestCase):
@@ -57,5 +63,51 @@ class TestAuditService(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(call_kwargs["action"], "custom")
 
 
+class TestScheduledAuditRecord(unittest.IsolatedAsyncioTestCase):
+    async def test_scheduled_record_uses_its_own_session(self):
+        session = AsyncMock()
+        session.add = MagicMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = session
+
+        with patch("app.services.audit.service.AuditLog"):
+            task = schedule_audit_record(
+                factory,
+                actor_user_id=1,
+                action="POLICY_BLOCK",
+                target_type="question",
+                target_id="hash",
+                metadata={"reason": "blocked"},
+                ip=None,
+                user_agent=None,
+            )
+            self.assertIn(task, audit_service_module._pending_records)
+            await drain_pending_audit_records()
+
+        factory.assert_called_once_with()
+        session.commit.assert_awaited_once()
+        self.assertFalse(audit_service_module._pending_records)
+
+    async def test_failed_record_is_logged_and_released(self):
+        factory = MagicMock()
+        factory.return_value.__aenter__.side_effect = RuntimeError("db down")
+
+        with self.assertLogs("app.services.audit.service", level="ERROR") as logs:
+            schedule_audit_record(
+                factory,
+                actor_user_id=None,
+                action="POLICY_BLOCK",
+                target_type="question",
+                target_id=None,
+                metadata={},
+                ip=None,
+                user_agent=None,
+            )
+            await drain_pending_audit_records()
+
+        self.assertIn("db down", logs.output[0])
+        self.assertFalse(audit_service_module._pending_records)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -173,7 +173,7 @@ async def test_authenticate_user_fallback_on_401(service):
         mock_user.id = 2
         mock_user.email = "local_only@test.com"
         mock_user.is_admin = False
-        mock_user.verify_password.return_value = True
+        mock_user.verify_password_and_rehash.return_value = (True, None)
 
         service.persistence.get_user_by_email = AsyncMock(return_value=mock_user)
 
@@ -227,3 +227,50 @@ async def test_get_current_user_success_remote(service):
 
         mock_client.get_me.assert_called_once_with("valid_remote_token")
         service.persistence.get_user_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_local_login_persists_upgraded_legacy_hash(db_session):
+    """الدخول المحلي بتجزئة bcrypt قديمة يحفظ تجزئة Argon2id الجديدة في قاعدة البيانات."""
+    from passlib.context import CryptContext
+    from sqlalchemy import text
+
+    from app.security.passwords import pwd_context
+
+    legacy_hash = CryptContext(schemes=["bcrypt"]).hash("LegacyPass123!")
+    await db_session.execute(
+        text(
+            "INSERT INTO users (external_id, full_name, email, password_hash, is_admin, "
+            "is_active, status) VALUES (:external_id, :full_name, :email, :password_hash, "
+            ":is_admin, :is_active, :status)"
+        ),
+        {
+            "external_id": "legacy-login",
+            "full_name": "Legacy Login",
+            "email": "legacy-login@example.com",
+            "password_hash": legacy_hash,
+            "is_admin": False,
+            "is_active": True,
+            "status": "active",
+        },
+    )
+    await db_session.commit()
+    service = AuthBoundaryService(db_session)
+
+    with (
+        patch("app.services.boundaries.auth_boundary_service.user_service_client") as mock_client,
+        patch("app.services.boundaries.auth_boundary_service.chrono_shield") as mock_shield,
+    ):
+        mock_client.login_user.side_effect = httpx.ConnectError("down")
+        mock_shield.check_allowance = AsyncMock()
+        await service.authenticate_user("legacy-login@example.com", "LegacyPass123!", MagicMock())
+
+    db_session.expire_all()
+    stored = (
+        await db_session.execute(
+            text("SELECT password_hash FROM users WHERE email = 'legacy-login@example.com'")
+        )
+    ).scalar_one()
+    assert stored.startswith("$argon2id$")
+    assert not pwd_context.needs_update(stored)
+    assert pwd_context.verify("LegacyPass123!", stored)
@@ -0,0 +1,50 @@
+"""اختبارات فك رموز الدخول والتخزين المؤقت لنتائج التحقق."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app.services.auth import token_decoder
+from app.services.auth.token_decoder import ALGORITHM, decode_user_id
+
+SECRET = "test-secret-key-for-token-decoder-suite"
+
+
+def _token(**claims: object) -> str:
+    return jwt.encode(claims, SECRET, algorithm=ALGORITHM)
+
+
+def test_decode_user_id_returns_subject() -> None:
+    assert decode_user_id(_token(sub="7"), SECRET) == 7
+
+
+def test_decode_user_id_rejects_bad_signature() -> None:
+    token = jwt.encode({"sub": "1"}, "other-secret", algorithm=ALGORITHM)
+
+    with pytest.raises(HTTPException) as exc:
+        decode_user_id(token, SECRET)
+    assert exc.value.status_code == 401
+
+
+def test_decode_reuses_verified_token_until_it_expires() -> None:
+    token_decoder._decoded_tokens.clear()
+    token = _token(sub="5", exp=int(time.time()) + 30)
+
+    with patch.object(token_decoder.jwt, "decode", wraps=jwt.decode) as verify:
+        assert decode_user_id(token, SECRET) == 5
+        assert decode_user_id(token, SECRET) == 5
+        assert verify.call_count == 1
+
+        with pytest.raises(HTTPException):
+            decode_user_id(token, "rotated-secret-for-token-decoder-suite")
+        assert verify.call_count == 2
+
+        # بعد تجاوز `exp` المخزن يُعاد التحقق رغم أن مدة التخزين (60 ثانية) لم تنقضِ.
+        later = SimpleNamespace(time=lambda: time.time() + 31)
+        with patch.object(token_decoder, "time", later):
+            decode_user_id(token, SECRET)
+        assert verify.call_count == 3
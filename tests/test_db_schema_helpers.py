@@ -1,6 +1,15 @@
 """اختبارات مساعدة لمحول مخطط قاعدة البيانات."""
 
+import pytest
+
 from app.core import db_schema
+from app.core.db_schema_config import (
+    _ALL_COLUMN_NAMES,
+    _ALL_INDEX_NAMES,
+    _INDEX_SQL_BY_NAME,
+    _TABLE_NAMES,
+    REQUIRED_SCHEMA,
+)
 
 
 class _FakeDialect:
@@ -97,3 +106,60 @@ def test_apply_dialect_ddl_passthrough_for_postgres() -> None:
     converted = db_schema._apply_dialect_ddl(conn, query)
 
     assert converted == query
+
+
+class _FakeResult:
+    def __init__(self, rows: list[tuple[str, str]]) -> None:
+        self._rows = rows
+
+    def fetchall(self) -> list[tuple[str, str]]:
+        return self._rows
+
+
+class _RecordingConnection(_FakeConnection):
+    """اتصال وهمي يسجل الاستعلامات ويعيد صفوفاً ثابتة."""
+
+    def __init__(self, rows: list[tuple[str, str]]) -> None:
+        super().__init__("postgresql")
+        self.rows = rows
+        self.calls: list[dict[str, object]] = []
+
+    async def execute(self, statement: object, params: dict[str, object]) -> _FakeResult:
+        self.calls.append(params)
+        return _FakeResult(self.rows)
+
+
+@pytest.mark.asyncio
+async def test_catalog_reads_are_batched_for_postgres() -> None:
+    conn = _RecordingConnection([("users", "id"), ("users", "email"), ("roles", "id")])
+
+    columns = await db_schema._get_columns_by_table(conn, ["users", "roles", "tasks"])
+    indexes = await db_schema._get_indexes_by_table(conn, ["users", "roles", "tasks"])
+
+    assert columns == {"users": {"id", "email"}, "roles": {"id"}, "tasks": set()}
+    assert indexes["tasks"] == set()
+    assert conn.calls == [
+        {"table_names": ["users", "roles", "tasks"], "column_names": list(_ALL_COLUMN_NAMES)},
+        {"table_names": ["users", "roles", "tasks"], "index_names": list(_ALL_INDEX_NAMES)},
+    ]
+
+
+def test_required_index_names_map_to_their_create_statements() -> None:
+    assert len(_ALL_INDEX_NAMES) == len(set(_ALL_INDEX_NAMES))
+    for index_name in _ALL_INDEX_NAMES:
+        assert db_schema._infer_index_name(_INDEX_SQL_BY_NAME[index_name]) == index_name
+
+
+@pytest.mark.asyncio
+async def test_table_existence_is_checked_in_one_query() -> None:
+    conn = _RecordingConnection([("users",), ("roles",)])
+
+    existing = await db_schema._get_existing_tables(conn, _TABLE_NAMES)
+
+    assert existing == {"users", "roles"}
+    assert conn.calls == [{"table_names": list(_TABLE_NAMES)}]
+
+
+def test_required_column_union_covers_every_table() -> None:
+    for config in REQUIRED_SCHEMA.values():
+        assert config["columns_set"] <= set(_ALL_COLUMN_NAMES)
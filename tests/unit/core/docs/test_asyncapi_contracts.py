@@ -7,3 +7,78 @@ from app.core.asyncapi_contracts import (
 def test_asyncapi_contract_structure_is_valid():
     report = validate_asyncapi_contract_structure(default_asyncapi_contract_path())
     assert report.is_clean(), f"AsyncAPI contract errors: {report.errors}"
+
+
+def test_asyncapi_contract_validation_is_memoized_until_file_changes(tmp_path, monkeypatch):
+    import os
+
+    from app.core import asyncapi_contracts
+
+    spec = tmp_path / "events.yaml"
+    spec.write_text("asyncapi: 2.6.0\ninfo:\n  title: t\nchannels: {}\n", encoding="utf-8")
+    scans: list[str] = []
+    original_scan = asyncapi_contracts._scan_top_level_keys
+    monkeypatch.setattr(
+        asyncapi_contracts,
+        "_scan_top_level_keys",
+        lambda text: scans.append(text) or original_scan(text),
+    )
+
+    first = validate_asyncapi_contract_structure(spec)
+    assert validate_asyncapi_contract_structure(spec) is first
+    assert len(scans) == 1
+    assert not first.is_clean()
+
+    spec.write_text(
+        "asyncapi: 2.6.0\ninfo:\n  title: t\nchannels:\n  a:\n    publish: {}\n",
+        encoding="utf-8",
+    )
+    stat = spec.stat()
+    os.utime(spec, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert validate_asyncapi_contract_structure(spec).is_clean()
+    assert len(scans) == 2
+
+
+def test_asyncapi_contract_reports_missing_file(tmp_path):
+    report = validate_asyncapi_contract_structure(tmp_path / "missing.yaml")
+    assert report.errors == (f"AsyncAPI spec not found: {tmp_path / 'missing.yaml'}",)
+
+
+def test_scan_top_level_keys_ignores_nested_keys_and_comments():
+    from app.core.asyncapi_contracts import _scan_top_level_keys
+
+    text = "# channels: commented\nasyncapi: 2.6.0\ninfo:\n  title: t\n  channels: nested\nx-meta.v1 :\n"
+
+    assert _scan_top_level_keys(text) == {"asyncapi", "info", "x-meta.v1"}
+
+
+def test_scan_top_level_keys_does_not_join_a_bare_word_to_the_next_line():
+    from app.core.asyncapi_contracts import _scan_top_level_keys
+
+    text = "asyncapi: 2.6.0\nstray\n: value\ninfo:\n  title: x\n"
+    assert _scan_top_level_keys(text) == {"asyncapi", "info"}
+
+
+def test_manual_channel_parser_matches_yaml_parser():
+    from app.core.asyncapi_contracts import (
+        _extract_channels_from_yaml,
+        _extract_channels_from_yaml_manual,
+    )
+
+    text = default_asyncapi_contract_path().read_text(encoding="utf-8")
+    assert _extract_channels_from_yaml_manual(text) == _extract_channels_from_yaml(text)
+
+    crafted = (
+        "channels:\n"
+        "  a:\n"
+        "    # comment\n"
+        "    publish:\n"
+        "  note: plain\n"
+        "    subscribe:\n"
+        "  b:\n"
+        "    description: x\n"
+        "info:\n"
+        "  messages:\n"
+    )
+    assert _extract_channels_from_yaml_manual(crafted) == {"a": True, "b": False}
@@ -1,3 +1,7 @@
+import sys
+
+import pytest
+
 from app.core.db_schema import _ALLOWED_TABLES, REQUIRED_SCHEMA
 
 
@@ -26,3 +30,34 @@ def test_knowledge_edges_structure():
     assert "source_id" in columns
     assert "target_id" in columns
     assert "relation" in columns
+
+
+def test_every_table_has_a_precomputed_column_set():
+    for config in REQUIRED_SCHEMA.values():
+        assert config["columns_set"] == frozenset(config["columns"])
+
+
+def test_required_schema_is_read_only_with_interned_columns():
+    with pytest.raises(TypeError):
+        REQUIRED_SCHEMA["users"] = REQUIRED_SCHEMA["roles"]  # type: ignore[index]
+
+    for config in REQUIRED_SCHEMA.values():
+        for column in config["columns"]:
+            assert sys.intern(column) is column
+
+
+def test_table_names_cover_required_schema_in_foreign_key_order():
+    from app.core.db_schema_config import _TABLE_NAMES
+
+    assert sorted(_TABLE_NAMES) == sorted(REQUIRED_SCHEMA)
+    assert _TABLE_NAMES.index("users") < _TABLE_NAMES.index("admin_conversations")
+    assert _TABLE_NAMES.index("missions") < _TABLE_NAMES.index("tasks")
+    assert _TABLE_NAMES.index("knowledge_nodes") < _TABLE_NAMES.index("knowledge_edges")
+
+
+def test_embedding_index_uses_selected_hnsw_profile():
+    from app.core.db_schema_config import _HNSW_VARIANTS
+
+    assert set(_HNSW_VARIANTS) == {"fast", "balanced", "accurate"}
+    assert "WITH (m = 16, ef_construction = 64)" in _HNSW_VARIANTS["balanced"]
+    assert REQUIRED_SCHEMA["knowledge_nodes"]["indexes"]["embedding"] in _HNSW_VARIANTS.values()
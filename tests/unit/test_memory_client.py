@@ -0,0 +1,103 @@
+"""اختبارات عميل وكيل الذاكرة المبني على العميل المشترك."""
+
+import httpx
+import pytest
+
+from app.infrastructure.clients import memory_client as memory_client_module
+from app.infrastructure.clients.memory_client import MemoryClient
+
+
+@pytest.mark.asyncio
+async def test_memory_client_reuses_shared_pooled_client(monkeypatch):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"ok": True})
+
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    configs: list[object] = []
+
+    def fake_get_http_client(config):
+        configs.append(config)
+        return shared
+
+    monkeypatch.setattr(memory_client_module, "get_http_client", fake_get_http_client)
+    client = MemoryClient(base_url="http://memory.test/")
+
+    try:
+        assert await client._get("/knowledge/concepts/missing") is None
+        assert await client._post("knowledge/paths", {"a": 1}) == {"ok": True}
+    finally:
+        await shared.aclose()
+
+    assert [str(request.url) for request in requests] == [
+        "http://memory.test/knowledge/concepts/missing",
+        "http://memory.test/knowledge/paths",
+    ]
+    assert requests[0].headers["Authorization"].startswith("Bearer ")
+    assert configs == [client.config, client.config]
+
+
+def _concept(concept_id: str) -> dict[str, object]:
+    return {
+        "concept_id": concept_id,
+        "name_ar": concept_id,
+        "name_en": concept_id,
+        "description": "",
+        "subject": "math",
+        "level": "bac",
+        "difficulty": 0.5,
+        "tags": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_concept_neighborhood_uses_single_graph_request(monkeypatch):
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(
+            200,
+            json={"prerequisites": [_concept("p")], "related": [], "next": [_concept("n")]},
+        )
+
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(memory_client_module, "get_http_client", lambda _config: shared)
+    client = MemoryClient(base_url="http://memory.test")
+
+    try:
+        neighborhood = await client.get_concept_neighborhood("c1")
+    finally:
+        await shared.aclose()
+
+    assert paths == ["/knowledge/concepts/c1/graph"]
+    assert [c.concept_id for c in neighborhood["prerequisites"]] == ["p"]
+    assert neighborhood["related"] == []
+    assert [c.concept_id for c in neighborhood["next"]] == ["n"]
+
+
+@pytest.mark.asyncio
+async def test_concept_neighborhood_falls_back_without_graph_endpoint(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/graph"):
+            return httpx.Response(404)
+        return httpx.Response(200, json=[_concept(request.url.path.rsplit("/", 1)[-1])])
+
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(memory_client_module, "get_http_client", lambda _config: shared)
+    client = MemoryClient(base_url="http://memory.test")
+
+    try:
+        neighborhood = await client.get_concept_neighborhood("c1")
+    finally:
+        await shared.aclose()
+
+    assert {key: [c.concept_id for c in value] for key, value in neighborhood.items()} == {
+        "prerequisites": ["prerequisites"],
+        "related": ["related"],
+        "next": ["next"],
+    }
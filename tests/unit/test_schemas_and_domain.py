@@ -8,7 +8,7 @@ import pytest
 from pydantic import ValidationError
 
 from app.api.schemas.admin import ChatRequest, ConversationSummaryResponse
-from app.api.schemas.ums import ProfileUpdateRequest
+from app.api.schemas.ums import ProfileUpdateRequest, RoleAssignmentRequest
 from app.core.domain.common import CaseInsensitiveEnum, FlexibleEnum, JSONText, utc_now
 from app.core.domain.user import PasswordResetToken, RefreshToken, User
 
@@ -33,6 +33,10 @@ class TestCaseInsensitiveEnum:
         result = self.SampleEnum._missing_("pending")
         assert result == self.SampleEnum.PENDING
 
+    def test_match_mixed_case_value(self):
+        assert self.SampleEnum("Pending") is self.SampleEnum.PENDING
+        assert self.SampleEnum("aCtIvE") is self.SampleEnum.ACTIVE
+
     def test_no_match_returns_none(self):
         result = self.SampleEnum._missing_("unknown")
         assert result is None
@@ -139,6 +143,25 @@ class TestProfileUpdateRequest:
         req = ProfileUpdateRequest(email=" Test@Example.COM ")
         assert req.email == "test@example.com"
 
+    def test_request_is_frozen_and_ignores_unknown_fields(self):
+        req = ProfileUpdateRequest(full_name="Name", role="ADMIN")
+        assert not hasattr(req, "role")
+        with pytest.raises(ValidationError):
+            req.full_name = "Other"
+
+
+class TestRoleAssignmentRequest:
+    def test_admin_role_requires_justification(self):
+        with pytest.raises(ValidationError, match="Justification required"):
+            RoleAssignmentRequest(role_name="ADMIN", justification="   short   ")
+
+    def test_admin_justification_is_stripped(self):
+        req = RoleAssignmentRequest(role_name="ADMIN", justification="  incident response  ")
+        assert req.justification == "incident response"
+
+    def test_other_roles_do_not_need_justification(self):
+        assert RoleAssignmentRequest(role_name="STANDARD_USER").justification is None
+
 
 class TestUserModel:
     def test_set_and_check_password(self):